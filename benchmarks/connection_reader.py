@@ -0,0 +1,90 @@
+"""Benchmark reading Host Command event lines with a stream vs a buffered protocol.
+
+Starts a local server which writes a burst of enhanced log lines, and measures how
+quickly they can be read using each connection reading strategy:
+
+- stream: `readuntil` per line, using an asyncio StreamReader
+- protocol: `readuntil` per line, using the buffered protocol
+- protocol-batched: `readlines`, using the buffered protocol
+"""
+
+import argparse
+import asyncio
+import time
+
+from aiovantage._connection import BaseConnection
+
+parser = argparse.ArgumentParser(description="aiovantage connection benchmark")
+parser.add_argument("--lines", type=int, default=500_000, help="lines per run")
+parser.add_argument("--runs", type=int, default=3, help="number of runs")
+args = parser.parse_args()
+
+LINE = b"EL: 1234 Load.GetLevel 100.000\r\n"
+
+
+class BenchmarkConnection(BaseConnection):
+    """Plain-text connection to the local benchmark server."""
+
+    default_port = 0
+    default_ssl_port = 0
+
+
+async def serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Write a burst of lines to each client."""
+    chunk = LINE * 1000
+    for _ in range(args.lines // 1000):
+        writer.write(chunk)
+        await writer.drain()
+
+    writer.close()
+
+
+async def read_stream(conn: BaseConnection) -> int:
+    """Read lines one at a time with readuntil."""
+    count = 0
+    for _ in range(args.lines):
+        message = await conn.readuntil(b"\r\n")
+        message = message.rstrip()
+        count += 1
+
+    return count
+
+
+async def read_batched(conn: BaseConnection) -> int:
+    """Read lines in batches with readlines."""
+    count = 0
+    while count < args.lines:
+        count += len(await conn.readlines())
+
+    return count
+
+
+async def run(port: int, name: str, buffered: bool, batched: bool) -> None:
+    """Time reading every line from the server."""
+    timings: list[float] = []
+    for _ in range(args.runs):
+        conn = BenchmarkConnection("127.0.0.1", port=port, ssl=False, buffered=buffered)
+        await conn.open()
+
+        start = time.perf_counter()
+        await (read_batched(conn) if batched else read_stream(conn))
+        timings.append(time.perf_counter() - start)
+
+        conn.close()
+
+    best = min(timings)
+    print(f"{name:>18}: {best:.3f}s ({args.lines / best:,.0f} lines/s)")
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    server = await asyncio.start_server(serve, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+
+    async with server:
+        await run(port, "stream", buffered=False, batched=False)
+        await run(port, "protocol", buffered=True, batched=False)
+        await run(port, "protocol-batched", buffered=True, batched=True)
+
+
+asyncio.run(main())
@@ -0,0 +1,116 @@
+"""Benchmark the per-event cost of parsing object status messages.
+
+Compares parsing with the decoders precompiled for each method when the interface
+class is created, against the parsing code used before decoders were precompiled,
+which inspected the method signature for every message.
+"""
+
+import argparse
+import timeit
+from dataclasses import fields, is_dataclass
+from typing import Any, get_type_hints
+
+from aiovantage.command_client import Converter
+from aiovantage.object_interfaces import BlindInterface, LoadInterface
+
+parser = argparse.ArgumentParser(description="aiovantage object status benchmark")
+parser.add_argument("--number", type=int, default=100_000, help="events per run")
+parser.add_argument("--runs", type=int, default=5, help="number of runs")
+args = parser.parse_args()
+
+
+class Load(LoadInterface):
+    """Load object for benchmarking."""
+
+    vid = 1
+    level = None
+
+
+class Blind(BlindInterface):
+    """Blind object for benchmarking."""
+
+    vid = 2
+
+
+MESSAGES = [
+    ("Load.GetLevel", Load, "Load.GetLevel", "50.000", ()),
+    (
+        "Blind.GetBlindState",
+        Blind,
+        "Blind.GetBlindState",
+        "1",
+        ("0.000", "100.000", "10.000", "123456"),
+    ),
+]
+
+
+def legacy_parse_object_response(cls: Any, method: str, result: str, *args: str) -> Any:
+    """Parse a response the way it was parsed before decoders were precompiled."""
+    if method not in cls._method_signatures:
+        raise NotImplementedError(f"No signature found for method {method}")
+
+    signature: type[Any] = cls._method_signatures[method]
+    if signature in (None, type(None)):
+        return None
+
+    def get_output_value(out: str) -> Any:
+        if out == "return":
+            return result
+
+        if out.startswith("arg") and out[3:].isdigit():
+            index = int(out[3:])
+            if 0 <= index < len(args):
+                return args[index]
+
+        raise ValueError(f"Invalid 'out' metadata when parsing {method}")
+
+    if is_dataclass(signature):
+        type_hints = get_type_hints(signature)
+        props: dict[str, Any] = {}
+
+        for field in fields(signature):
+            out = field.metadata.get("out")
+            if out is None:
+                raise ValueError(f"Field {field.name} missing 'out' metadata")
+
+            field_signature = type_hints.get(field.name)
+            if field_signature is None:
+                raise ValueError(f"Field {field.name} missing type hint")
+
+            props[field.name] = Converter.deserialize(
+                field_signature, get_output_value(out)
+            )
+
+        return signature(**props)
+
+    out = cls._method_output.get(method, "return")
+    return Converter.deserialize(signature, get_output_value(out))
+
+
+def bench(name: str, stmt: str, namespace: dict[str, object]) -> None:
+    """Print the best per-event time of a statement."""
+    best = min(
+        timeit.repeat(stmt, globals=namespace, number=args.number, repeat=args.runs)
+    )
+    print(f"{name:>42}: {best / args.number * 1e6:.2f}us per event")
+
+
+for label, cls, method, result, method_args in MESSAGES:
+    namespace: dict[str, object] = {
+        "obj": cls(),
+        "method": method,
+        "result": result,
+        "args": method_args,
+        "legacy_parse": legacy_parse_object_response,
+    }
+
+    bench(
+        f"{label} (precompiled)",
+        "obj._parse_object_response(method, result, *args)",
+        namespace,
+    )
+    bench(
+        f"{label} (before precompiling)",
+        "legacy_parse(obj, method, result, *args)",
+        namespace,
+    )
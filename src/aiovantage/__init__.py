@@ -1,16 +1,25 @@
 """Asynchronous Python library for controlling Vantage InFusion controllers."""
 
 import asyncio
-from collections.abc import Callable, Iterator
+import copy
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor
+from pathlib import Path
 from ssl import SSLContext
 from types import TracebackType
 from typing import Any, TypeVar, cast
 
 from typing_extensions import Self
 
+from ._config_cache import CachedConfiguration, ConfigCache, ConfigVersion
 from ._logger import logger
-from .command_client import CommandClient, EventStream
-from .config_client import ConfigClient
+from .command_client import CommandClient, EventStream, StreamRecorder
+from .config_client import (
+    ConfigClient,
+    ConfigurationInterface,
+    IntrospectionInterface,
+)
 from .controllers import (
     AnemoSensorsController,
     AreasController,
@@ -20,6 +29,7 @@ from .controllers import (
     ButtonsController,
     Controller,
     DryContactsController,
+    FetchStateStats,
     GMemController,
     LightSensorsController,
     LoadGroupsController,
@@ -35,7 +45,15 @@ from .controllers import (
     TemperaturesController,
     ThermostatsController,
 )
-from .objects import SystemObject
+from .errors import ClientError, ConversionError
+from .events import (
+    EnhancedLogReceived,
+    EventSubscription,
+    ObjectAdded,
+    ObjectDeleted,
+    OverflowPolicy,
+)
+from .objects import Master, SystemObject
 
 __all__ = [
     "Vantage",
@@ -63,6 +81,20 @@ class Vantage:
         ssl_context_factory: Callable[[], SSLContext] | None = None,
         config_port: int | None = None,
         command_port: int | None = None,
+        command_pipeline_depth: int = 1,
+        command_pool_size: int = 1,
+        command_cache_size: int = 0,
+        command_cache_ttl: float = 3600,
+        coalesce_setters: bool = False,
+        fetch_concurrency: int = 16,
+        buffered_reader: bool = False,
+        shared_event_stream: bool = False,
+        update_coalesce_window: float | None = None,
+        slow_callback_threshold: float | None = None,
+        recorder: StreamRecorder | None = None,
+        callback_executor: Executor | None = None,
+        config_cache_dir: str | Path | None = None,
+        config_parse_executor: Executor | None = None,
     ) -> None:
         """Initialize the Vantage instance.
 
@@ -74,6 +106,35 @@ class Vantage:
             ssl_context_factory: A factory function to create an SSL context.
             config_port: The port to use for the config client.
             command_port: The port to use for the command client.
+            command_pipeline_depth: The maximum number of commands awaiting a response
+                at once, values greater than 1 enable command pipelining.
+            command_pool_size: The number of connections to send commands on.
+            command_cache_size: The maximum number of responses to rarely changing
+                getter methods to cache, or 0 to disable caching.
+            command_cache_ttl: The time-to-live of cached responses, in seconds.
+            coalesce_setters: Whether to coalesce rapid calls to setter methods of
+                objects, such as `Load.SetLevel`, only sending the latest call.
+            fetch_concurrency: The maximum number of concurrent requests to make when
+                fetching object state, across all controllers.
+            buffered_reader: Whether to read from connections with a buffered
+                protocol, which reduces per-line overhead when reading many lines.
+            shared_event_stream: Whether the event stream shares a connection with the
+                command client, rather than opening a separate connection.
+            update_coalesce_window: Optional window, in seconds, over which controllers
+                coalesce ObjectUpdated events for each object, see
+                [`Controller.update_coalesce_window`][aiovantage.controllers.Controller.update_coalesce_window].
+            slow_callback_threshold: Optionally, record timing statistics for event
+                callbacks, and log callbacks which take longer than this many seconds.
+            recorder: An optional recorder to record lines received by the command
+                client and event stream with.
+            callback_executor: An optional executor to call event callbacks
+                subscribed with `in_executor=True` in, rather than on the event loop.
+            config_cache_dir: Optionally, a directory to cache the configuration of the
+                system in. The cached configuration is used when initializing, unless
+                the configuration on the controller has changed since it was cached.
+            config_parse_executor: An optional thread or process pool executor to
+                parse large configuration responses in, so that events continue to be
+                handled while the configuration loads.
         """
         # Set up clients
         self._host = host
@@ -84,6 +145,8 @@ class Vantage:
             ssl=ssl,
             ssl_context_factory=ssl_context_factory,
             port=config_port,
+            buffered_reader=buffered_reader,
+            parse_executor=config_parse_executor,
         )
 
         self._command_client = CommandClient(
@@ -93,6 +156,14 @@ class Vantage:
             ssl=ssl,
             ssl_context_factory=ssl_context_factory,
             port=command_port,
+            pipeline_depth=command_pipeline_depth,
+            pool_size=command_pool_size,
+            cache_size=command_cache_size,
+            cache_ttl=command_cache_ttl,
+            coalesce_setters=coalesce_setters,
+            buffered_reader=buffered_reader,
+            read_events=shared_event_stream,
+            recorder=recorder,
         )
 
         self._event_stream = EventStream(
@@ -102,12 +173,47 @@ class Vantage:
             ssl=ssl,
             ssl_context_factory=ssl_context_factory,
             port=command_port,
+            buffered_reader=buffered_reader,
+            command_client=self._command_client if shared_event_stream else None,
+            recorder=recorder,
         )
 
+        if slow_callback_threshold is not None:
+            self._event_stream.enable_callback_timing(slow_callback_threshold)
+        self._event_stream.executor = callback_executor
+
+        # Optionally cache the configuration on disk
+        self._config_cache: ConfigCache | None = None
+        if config_cache_dir is not None:
+            self._config_cache = ConfigCache(config_cache_dir)
+
+        # Limit concurrent requests when fetching state across all controllers
+        self._fetch_semaphore = asyncio.Semaphore(fetch_concurrency)
+
+        # Route object status events to controllers, indexed by the vid of each object
+        self._controllers_by_vid: dict[int, Controller[Any]] = {}
+        self._status_controllers: set[Controller[Any]] = set()
+        self._status_unsub: Callable[[], None] | None = None
+
         # Set up controllers
         def add_controller(controller_cls: type[ControllerT]) -> ControllerT:
             controller = controller_cls(self)
+            controller.update_coalesce_window = update_coalesce_window
+            if slow_callback_threshold is not None:
+                controller.enable_callback_timing(slow_callback_threshold)
+            controller.executor = callback_executor
             self._controllers.add(controller)
+
+            # Keep the index of objects up to date
+            def on_object_added(event: ObjectAdded[SystemObject]) -> None:
+                self._controllers_by_vid[event.obj.vid] = controller
+
+            def on_object_deleted(event: ObjectDeleted[SystemObject]) -> None:
+                self._controllers_by_vid.pop(event.obj.vid, None)
+
+            controller.subscribe(ObjectAdded, on_object_added)
+            controller.subscribe(ObjectDeleted, on_object_deleted)
+
             return controller
 
         self._controllers: set[Controller[Any]] = set()
@@ -135,14 +241,15 @@ class Vantage:
 
     def __getitem__(self, vid: int) -> SystemObject:
         """Return the object with the given Vantage ID."""
-        for controller in self._controllers:
-            if vid in controller:
-                return cast(SystemObject, controller[vid])
-        raise KeyError(vid)
+        controller = self._controllers_by_vid.get(vid)
+        if controller is None:
+            raise KeyError(vid)
+
+        return cast(SystemObject, controller[vid])
 
     def __contains__(self, vid: int) -> bool:
         """Is the given Vantage ID known by any controller."""
-        return any(vid in controller for controller in self._controllers)
+        return vid in self._controllers_by_vid
 
     def __iter__(self) -> Iterator[SystemObject]:
         """Iterate over all objects known by the controllers."""
@@ -184,6 +291,18 @@ class Vantage:
         """The event stream instance."""
         return self._event_stream
 
+    @property
+    def fetch_semaphore(self) -> asyncio.Semaphore:
+        """The semaphore limiting concurrent requests when fetching object state."""
+        return self._fetch_semaphore
+
+    @property
+    def executor_queue_depth(self) -> int:
+        """The number of event callbacks waiting to run, or running, in the executor."""
+        return self._event_stream.executor_queue_depth + sum(
+            controller.executor_queue_depth for controller in self._controllers
+        )
+
     @property
     def anemo_sensors(self) -> AnemoSensorsController:
         """Controller for interacting with wind speed sensors."""
@@ -310,29 +429,245 @@ class Vantage:
         self.event_stream.stop()
 
     async def initialize(
-        self, *, fetch_state: bool = True, enable_state_monitoring: bool = True
+        self,
+        *,
+        fetch_state: bool = True,
+        enable_state_monitoring: bool = True,
+        page_size: int | None = None,
+        incremental: bool = False,
     ) -> None:
         """Initialize all controllers.
 
+        The configuration of every controller is loaded in a single pass, using one
+        filter over all of the object types managed by the controllers, or from the
+        configuration cache if enabled and up to date.
+
+        Once all controllers have been initialized, they can be refreshed
+        incrementally, see [`Controller.initialize`][aiovantage.controllers.Controller.initialize].
+
         Args:
             fetch_state: Whether to fetch the state properties of objects.
             enable_state_monitoring: Whether to monitor for state changes on objects.
+            page_size: The number of objects to fetch per configuration request, or
+                None to size pages adaptively.
+            incremental: Whether to only fetch objects modified since the controllers
+                were last populated, when possible. When populating the controllers,
+                this records the configuration version for later refreshes. If the
+                version can't be fetched, the whole configuration is reloaded.
         """
+        # Refresh each controller incrementally, once they have all been populated,
+        # checking the configuration version once for every controller. Without a
+        # version, fall back to loading the whole configuration in a single pass.
+        refresh = incremental and all(c.initialized for c in self._controllers)
+        version: ConfigVersion | None = None
+        if refresh:
+            version = await self.fetch_config_version()
+
+        if version is not None:
+            await asyncio.gather(
+                *[
+                    controller.initialize(
+                        fetch_state=fetch_state,
+                        enable_state_monitoring=enable_state_monitoring,
+                        page_size=page_size,
+                        config_version=version,
+                        incremental=True,
+                    )
+                    for controller in self._controllers
+                ]
+            )
+            return
+
+        # Load the objects of every controller, and route each object to the
+        # controller which manages its type. The version isn't fetched again if it
+        # couldn't be fetched for a refresh.
+        controllers_by_type = {
+            vantage_type: controller
+            for controller in self._controllers
+            for vantage_type in controller.vantage_types
+        }
+
+        objects: dict[Controller[Any], list[SystemObject]] = {
+            controller: [] for controller in self._controllers
+        }
+
+        loaded, version = await self._load_configuration(
+            tuple(sorted(controllers_by_type)),
+            page_size,
+            incremental and not refresh,
+        )
+        for obj in loaded:
+            controller = controllers_by_type.get(obj.vantage_type())
+            if controller is not None:
+                objects[controller].append(obj)
+
         await asyncio.gather(
             *[
                 controller.initialize(
                     fetch_state=fetch_state,
                     enable_state_monitoring=enable_state_monitoring,
+                    objects=controller_objects,
+                    config_version=version,
                 )
-                for controller in self._controllers
+                for controller, controller_objects in objects.items()
             ]
         )
 
-    async def fetch_state(self) -> None:
-        """Fetch the state properties of all objects."""
-        await asyncio.gather(
-            *[controller.fetch_state() for controller in self._controllers]
+    async def fetch_config_version(self) -> ConfigVersion | None:
+        """Fetch the times that the configuration of the system last changed.
+
+        Returns:
+            The configuration version, or None if no masters (controllers) have been
+            loaded, or the version couldn't be fetched.
+        """
+        master = self._masters.first()
+        if master is None:
+            return None
+
+        try:
+            return await ConfigVersion.fetch(master)
+        except (ClientError, ConversionError) as err:
+            logger.warning("Failed to fetch configuration version: %s", err)
+            return None
+
+    async def _load_configuration(
+        self, vantage_types: tuple[str, ...], page_size: int | None, incremental: bool
+    ) -> tuple[list[SystemObject], ConfigVersion | None]:
+        # Load all objects of the given types, from the configuration cache if the
+        # configuration hasn't changed since it was cached, otherwise from the
+        # controller with a single filter. The configuration version is only needed,
+        # and fetched, when caching or refreshing incrementally.
+        if self._config_cache is None and not incremental:
+            return await self._fetch_configuration(vantage_types, page_size), None
+
+        serial_number: int | None = None
+        master_number: int | None = None
+        cached: CachedConfiguration | None = None
+        if self._config_cache is not None:
+            # Look up the cached configuration, by the serial number of the controller
+            sys_info = await IntrospectionInterface.get_sys_info(self._config_client)
+            serial_number = sys_info.serial_number
+            master_number = sys_info.master_number
+            cached = await asyncio.to_thread(self._config_cache.load, serial_number)
+
+        # Check the configuration version before fetching, so changes made while
+        # fetching aren't missed by the next check. The master to check it with is
+        # usually known from the cached configuration or an earlier load, otherwise
+        # the masters are fetched on their own first.
+        if cached is not None:
+            masters = [obj for obj in cached.objects if isinstance(obj, Master)]
+        else:
+            masters = list(self._masters)
+
+        if not masters:
+            masters = [
+                obj
+                async for obj in ConfigurationInterface.get_objects(
+                    self._config_client, Master.vantage_type(), as_type=Master
+                )
+            ]
+
+        version = await self._fetch_load_version(masters, master_number)
+        if (
+            cached is not None
+            and cached.version == version
+            and cached.vantage_types == vantage_types
+        ):
+            logger.info(
+                "Loaded configuration from cache (%d objects)", len(cached.objects)
+            )
+            return cached.objects, version
+
+        objects = await self._fetch_configuration(vantage_types, page_size)
+
+        # Cache the configuration before it's used by controllers
+        if (
+            self._config_cache is not None
+            and serial_number is not None
+            and version is not None
+        ):
+            try:
+                await asyncio.to_thread(
+                    self._config_cache.save,
+                    serial_number,
+                    CachedConfiguration(version, vantage_types, objects),
+                )
+            except OSError as err:
+                logger.warning("Failed to save configuration cache: %s", err)
+
+        return objects, version
+
+    async def _fetch_configuration(
+        self, vantage_types: tuple[str, ...], page_size: int | None
+    ) -> list[SystemObject]:
+        # Fetch all objects of the given types from the controller, with one filter
+        objects = [
+            obj
+            async for obj in ConfigurationInterface.get_objects(
+                self._config_client,
+                *vantage_types,
+                as_type=SystemObject,
+                page_size=page_size,
+            )
+        ]
+
+        logger.info("Loaded configuration (%d objects)", len(objects))
+        return objects
+
+    async def _fetch_load_version(
+        self, masters: list[Master], master_number: int | None
+    ) -> ConfigVersion | None:
+        # Check the configuration version with the master we're connected to, if
+        # known, otherwise with any master
+        master = next((m for m in masters if m.number == master_number), None) or next(
+            iter(masters), None
         )
+        if master is None:
+            return None
+
+        # Query a copy, so loaded objects aren't bound to the client until they're
+        # cached and handed to controllers
+        master = copy.copy(master)
+        master.command_client = self._command_client
+        try:
+            return await ConfigVersion.fetch(master)
+        except (ClientError, ConversionError) as err:
+            logger.warning("Failed to check configuration version: %s", err)
+            return None
+
+    async def fetch_state(self) -> FetchStateStats:
+        """Fetch the state properties of all objects.
+
+        Returns:
+            Statistics about the objects fetched, across all controllers.
+        """
+        start = time.monotonic()
+
+        # Wait for every controller to finish before raising the first error, so none
+        # are left fetching in the background
+        results: list[FetchStateStats] = []
+        for result in await asyncio.gather(
+            *[controller.fetch_state() for controller in self._controllers],
+            return_exceptions=True,
+        ):
+            if isinstance(result, BaseException):
+                raise result
+
+            results.append(result)
+
+        stats = FetchStateStats(
+            objects=sum(result.objects for result in results),
+            fetches=sum(result.fetches for result in results),
+            duration=time.monotonic() - start,
+        )
+        logger.info(
+            "Fetched state of %d objects (%d fetches) in %.2fs",
+            stats.objects,
+            stats.fetches,
+            stats.duration,
+        )
+
+        return stats
 
     async def enable_state_monitoring(self) -> None:
         """Monitor for state changes on all objects."""
@@ -346,20 +681,59 @@ class Vantage:
             *[controller.disable_state_monitoring() for controller in self._controllers]
         )
 
+    def route_object_status(self, controller: Controller[Any]) -> Callable[[], None]:
+        """Route object status events from the Enhanced Log to a controller.
+
+        Each status event is tokenized once, and passed directly to the controller
+        which manages the object, rather than every controller handling every event.
+
+        Args:
+            controller: The controller to route status events to.
+
+        Returns:
+            A function to stop routing status events to the controller.
+        """
+        # Subscribe to object status events when the first controller is routed
+        self._status_controllers.add(controller)
+        if self._status_unsub is None:
+            self._status_unsub = self.event_stream.subscribe_enhanced_log(
+                self._handle_enhanced_log_event, "STATUS", "STATUSEX"
+            )
+
+        def unroute() -> None:
+            self._status_controllers.discard(controller)
+            if not self._status_controllers and self._status_unsub is not None:
+                self._status_unsub()
+                self._status_unsub = None
+
+        return unroute
+
     def subscribe(
-        self, event_type: type[T], callback: Callable[[T], None]
+        self,
+        event_type: type[T],
+        callback: Callable[[T], None],
+        *,
+        vid: int | None = None,
+        attrs: Iterable[str] | None = None,
+        in_executor: bool = False,
     ) -> Callable[[], None]:
         """Subscribe to events from every controller.
 
         Args:
             event_type: The type of event to subscribe to.
             callback: The callback to call when the event is emitted.
+            vid: Only call back for events related to the object with this Vantage ID.
+            attrs: Only call back for events where any of these attributes changed.
+            in_executor: Whether to call the callback in the callback executor, in
+                order for each object, rather than on the event loop.
 
         Returns:
             A function to unsubscribe.
         """
         unsubscribes = [
-            controller.subscribe(event_type, callback)
+            controller.subscribe(
+                event_type, callback, vid=vid, attrs=attrs, in_executor=in_executor
+            )
             for controller in self._controllers
         ]
 
@@ -368,3 +742,51 @@ class Vantage:
                 unsub()
 
         return unsubscribe
+
+    def events(
+        self,
+        event_type: type[T],
+        *,
+        vid: int | None = None,
+        attrs: Iterable[str] | None = None,
+        maxsize: int = 1000,
+        overflow: OverflowPolicy = "drop_oldest",
+    ) -> EventSubscription[T]:
+        """Subscribe to events from every controller, with an async iterator.
+
+        Example:
+            ```python
+            async with vantage.events(ObjectUpdated) as events:
+                async for event in events:
+                    print(event.obj.name, event.attrs_changed)
+            ```
+
+        Args:
+            event_type: The type of event to subscribe to.
+            vid: Only receive events related to the object with this Vantage ID.
+            attrs: Only receive events where any of these attributes changed.
+            maxsize: The maximum number of queued events.
+            overflow: What to do with new events when the queue is full, either drop
+                the oldest queued event, or drop the new event.
+
+        Returns:
+            An async iterator of events, which should be closed when no longer needed.
+        """
+        subscription = EventSubscription[T](maxsize, overflow)
+        subscription.attach(
+            self.subscribe(event_type, subscription.put, vid=vid, attrs=attrs)
+        )
+        return subscription
+
+    def _handle_enhanced_log_event(self, event: EnhancedLogReceived) -> None:
+        # Handle STATUS/STATUSEX logs from the enhanced log, which are tokenized once.
+        # These are "object interface" status messages, of the form:
+        # -> EL: <vid> <method> <result> <arg1> <arg2> ...
+        vid = event.vid
+
+        # Pass the event to the controller managing the object, if it is routed
+        controller = self._controllers_by_vid.get(vid)
+        if controller in self._status_controllers:
+            controller.handle_object_status(
+                vid, event.method, event.result, *event.args
+            )
@@ -0,0 +1,69 @@
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class ResponseCache(Generic[T]):
+    """A size-bounded cache of responses, which expire after a time-to-live.
+
+    When the cache is full, the least recently used response is evicted.
+
+    Args:
+        maxsize: The maximum number of responses to cache, or 0 to disable caching.
+        ttl: The time-to-live of cached responses, in seconds.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600) -> None:
+        """Initialize the cache."""
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, T]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached responses, including expired responses."""
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> T | None:
+        """Get a cached response, if it exists and hasn't expired.
+
+        Args:
+            key: The key of the response.
+
+        Returns:
+            The cached response, or None.
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, value: T) -> None:
+        """Cache a response, evicting the least recently used response if full.
+
+        Args:
+            key: The key of the response.
+            value: The response to cache.
+        """
+        if self._maxsize <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._entries.clear()
@@ -0,0 +1,273 @@
+import asyncio
+from collections.abc import Callable, Sequence
+
+from aiovantage._logger import logger
+from aiovantage.errors import ClientConnectionError, ClientError, CommandError
+
+from .connection import CommandConnection
+from .pipeline import CommandPipeline, parse_error
+from .priority import CommandPriority, PrioritySemaphore
+from .recorder import COMMAND_CLIENT, StreamRecorder
+
+
+class CommandChannel:
+    """A single authenticated connection to the Host Command service.
+
+    The connection is opened lazily when needed, and will automatically reconnect if
+    the connection is lost. While the connection is open and idle, a periodic "ECHO"
+    health check is sent, and the connection is closed if the health check fails.
+
+    Args:
+        connection: The connection to send requests on.
+        username: The username to use for authentication.
+        password: The password to use for authentication.
+        read_timeout: The read timeout in seconds.
+        pipeline_depth: The maximum number of requests awaiting a response at once.
+        health_check_interval: The interval between health checks in seconds, or None
+            to disable health checks.
+        read_events: Whether to continuously read from the connection, so interleaved
+            event lines can be passed to an event handler.
+        on_connect: An optional callback, called when a new connection is opened.
+        recorder: An optional recorder to record received response lines with. Event
+            lines are recorded by the event stream which handles them.
+    """
+
+    def __init__(
+        self,
+        connection: CommandConnection,
+        username: str | None = None,
+        password: str | None = None,
+        *,
+        read_timeout: float = 60,
+        pipeline_depth: int = 1,
+        health_check_interval: float | None = None,
+        read_events: bool = False,
+        on_connect: Callable[[], None] | None = None,
+        recorder: StreamRecorder | None = None,
+    ) -> None:
+        """Initialize the channel."""
+        self._connection = connection
+        self._username = username
+        self._password = password
+        self._read_timeout = read_timeout
+        self._health_check_interval = health_check_interval
+        self._on_connect = on_connect
+        self._recorder = recorder
+        self._health_check_task: asyncio.Task[None] | None = None
+        self._connection_lock = asyncio.Lock()
+        self._command_lock = PrioritySemaphore()
+        self._busy = 0
+        self._healthy = True
+
+        self._pipeline: CommandPipeline | None = None
+        if pipeline_depth > 1 or read_events:
+            self._pipeline = CommandPipeline(
+                connection, max(pipeline_depth, 1), recorder
+            )
+
+    @property
+    def connection(self) -> CommandConnection:
+        """The connection used by this channel."""
+        return self._connection
+
+    @property
+    def reads_events(self) -> bool:
+        """Whether event lines received on the connection can be handled."""
+        return self._pipeline is not None
+
+    @property
+    def event_handler(self) -> Callable[[str], None] | None:
+        """The handler for event lines received on the connection."""
+        return None if self._pipeline is None else self._pipeline.event_handler
+
+    @event_handler.setter
+    def event_handler(self, handler: Callable[[str], None] | None) -> None:
+        if self._pipeline is None:
+            raise ValueError("The channel does not read events.")
+
+        self._pipeline.event_handler = handler
+
+    @property
+    def busy(self) -> int:
+        """The number of requests waiting to be sent, or awaiting a response."""
+        return self._busy
+
+    @property
+    def healthy(self) -> bool:
+        """Whether the most recent health check or connection attempt succeeded."""
+        return self._healthy
+
+    def close(self) -> None:
+        """Close the connection, and stop health checks."""
+        if self._health_check_task is not None:
+            self._health_check_task.cancel()
+            self._health_check_task = None
+
+        if self._pipeline is not None:
+            self._pipeline.stop()
+
+        self._connection.close()
+
+    async def wait_closed(self) -> None:
+        """Wait until the connection is lost or closed, when reading events."""
+        if self._pipeline is not None:
+            await self._pipeline.wait_stopped()
+
+    async def request(
+        self, request: str, priority: CommandPriority = CommandPriority.NORMAL
+    ) -> list[str]:
+        """Send a request, and return all response lines.
+
+        Raises an exception if the response line contains R:ERROR. Requests waiting
+        for the connection are sent in priority order.
+
+        Args:
+            request: The request to send.
+            priority: The priority of the request.
+
+        Returns:
+            The response lines received from the server.
+        """
+        self._busy += 1
+        try:
+            conn = await self.connect()
+
+            # Send the request, without waiting for earlier requests if pipelining
+            if self._pipeline is not None:
+                return await self._pipeline.request(
+                    request, self._read_timeout, priority
+                )
+
+            # Send the request, and wait for the response
+            async with self._command_lock.hold(priority):
+                await conn.write(f"{request}\n")
+                return await self._read_response(conn)
+        finally:
+            self._busy -= 1
+
+    async def request_many(
+        self,
+        requests: Sequence[str],
+        priority: CommandPriority = CommandPriority.NORMAL,
+    ) -> list[list[str] | CommandError]:
+        """Send a batch of requests in a single write, and return all responses.
+
+        Args:
+            requests: The requests to send.
+            priority: The priority of the batch.
+
+        Returns:
+            The response lines, or command error, for each request in order.
+        """
+        self._busy += len(requests)
+        try:
+            conn = await self.connect()
+
+            # Send the requests, without waiting for earlier requests if pipelining
+            if self._pipeline is not None:
+                return await self._pipeline.request_many(
+                    requests, self._read_timeout, priority
+                )
+
+            # Send the requests, and wait for the responses, which arrive in order
+            async with self._command_lock.hold(priority):
+                responses: list[list[str] | CommandError] = []
+                try:
+                    await conn.write("".join(f"{request}\n" for request in requests))
+                    for _ in requests:
+                        try:
+                            responses.append(await self._read_response(conn))
+                        except CommandError as err:
+                            responses.append(err)
+                except BaseException:
+                    # Close the connection, so the responses we didn't read aren't
+                    # read by the next request, it will be reopened when needed
+                    conn.close()
+                    raise
+
+                return responses
+        finally:
+            self._busy -= len(requests)
+
+    async def connect(self) -> CommandConnection:
+        """Open and authenticate the connection, if it isn't already open."""
+        async with self._connection_lock:
+            if self._connection.closed:
+                # Stop reading responses from the previous connection
+                if self._pipeline is not None:
+                    self._pipeline.stop(ClientConnectionError("Connection lost."))
+
+                try:
+                    # Open a new connection
+                    await self._connection.open()
+
+                    # Authenticate the new connection if we have credentials
+                    if self._username and self._password:
+                        await self._connection.authenticate(
+                            self._username, self._password
+                        )
+                except ClientError:
+                    self._healthy = False
+                    raise
+
+                self._healthy = True
+                if self._on_connect is not None:
+                    self._on_connect()
+
+                # Start reading pipelined responses from the new connection
+                if self._pipeline is not None:
+                    self._pipeline.start()
+
+                # Start health checking the new connection
+                interval = self._health_check_interval
+                if interval is not None and self._health_check_task is None:
+                    self._health_check_task = asyncio.create_task(
+                        self._health_check(interval)
+                    )
+
+                logger.info(
+                    "Connected to command client at %s:%d",
+                    self._connection.host,
+                    self._connection.port,
+                )
+
+            return self._connection
+
+    async def _read_response(self, conn: CommandConnection) -> list[str]:
+        # Read all lines of a response, up to and including the response line
+        response_lines: list[str] = []
+        while True:
+            response_line = await conn.readuntil(b"\r\n", self._read_timeout)
+            response_line = response_line.rstrip()
+
+            # Ignore potentially interleaved "event" messages
+            if response_line.startswith(("S:", "L:", "EL:")):
+                logger.debug("Ignoring event message: %s", response_line)
+                continue
+
+            if self._recorder is not None:
+                self._recorder.record(COMMAND_CLIENT, response_line)
+
+            # Handle command errors
+            if response_line.startswith("R:ERROR"):
+                raise parse_error(response_line)
+
+            # Return the response once we see the response line
+            response_lines.append(response_line)
+            if response_line.startswith("R:"):
+                return response_lines
+
+    async def _health_check(self, interval: float) -> None:
+        # Periodically send an "ECHO" command on idle connections, and close the
+        # connection if it fails so it will be reopened by the next request.
+        while True:
+            await asyncio.sleep(interval)
+            if self._connection.closed or self._busy:
+                continue
+
+            try:
+                await self.request("ECHO", CommandPriority.BACKGROUND)
+            except ClientError as err:
+                logger.debug("Health check failed: %s", str(err))
+                self._healthy = False
+                self._connection.close()
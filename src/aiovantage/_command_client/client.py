@@ -1,18 +1,21 @@
 import asyncio
-import re
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections.abc import Callable, Hashable, Sequence
+from dataclasses import dataclass, field
 from ssl import SSLContext
 from types import TracebackType
-from typing import Any
+from typing import Any, Literal, overload
 
 from typing_extensions import Self
 
 from aiovantage._logger import logger
-from aiovantage.errors import CommandError, raise_command_error
+from aiovantage.errors import CommandError
 
+from .cache import ResponseCache
+from .channel import CommandChannel
 from .connection import CommandConnection
 from .converter import Converter
+from .priority import CommandPriority, current_priority
+from .recorder import StreamRecorder
 
 
 @dataclass
@@ -36,12 +39,24 @@ class CommandResponse:
     """Any additional lines of text returned before the response line."""
 
 
+@dataclass
+class _LatestRequests:
+    # Tracks commands with the same key, so superseded commands can be dropped
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    sequence: int = 0
+    waiters: int = 0
+
+
 class CommandClient:
     """Client for sending commands to the Vantage Host Command (HC) service.
 
     Connections are created lazily when needed, and closed when the client is closed,
     and will automatically reconnect if the connection is lost.
 
+    Optionally, a pool of connections can be used, in which case each command is sent
+    on the least busy connection. This prevents slow commands, such as hardware reads,
+    from blocking other commands.
+
     Args:
         host: The hostname or IP address of the Vantage controller.
         username: The username to use for authentication.
@@ -51,6 +66,22 @@ class CommandClient:
         port: The port to connect to.
         conn_timeout: The connection timeout in seconds.
         read_timeout: The read timeout in seconds.
+        pipeline_depth: The maximum number of commands awaiting a response at once.
+            Values greater than 1 enable pipelining, where commands are sent without
+            waiting for the responses to earlier commands.
+        pool_size: The number of connections to send commands on.
+        health_check_interval: Optionally, the interval between health checks of idle
+            connections in seconds, eg. when pooling connections.
+        coalesce_setters: Whether to coalesce rapid calls to setter methods of objects,
+            such as `Load.SetLevel`, only sending the latest call.
+        buffered_reader: Whether to read from the connection with a buffered protocol,
+            which reduces per-line overhead when reading many lines.
+        read_events: Whether the first connection continuously reads event lines, so
+            it can be shared with an [`EventStream`][aiovantage.command_client.EventStream].
+        cache_size: The maximum number of responses to rarely changing getter methods
+            to cache, or 0 to disable caching.
+        cache_ttl: The time-to-live of cached responses, in seconds.
+        recorder: An optional recorder to record received response lines with.
     """
 
     def __init__(
@@ -64,21 +95,47 @@ class CommandClient:
         port: int | None = None,
         conn_timeout: float = 30,
         read_timeout: float = 60,
+        pipeline_depth: int = 1,
+        pool_size: int = 1,
+        health_check_interval: float | None = None,
+        coalesce_setters: bool = False,
+        buffered_reader: bool = False,
+        read_events: bool = False,
+        cache_size: int = 0,
+        cache_ttl: float = 3600,
+        recorder: StreamRecorder | None = None,
     ) -> None:
         """Initialize the client."""
-        self._connection = CommandConnection(
-            host,
-            port=port,
-            ssl=ssl,
-            ssl_context_factory=ssl_context_factory,
-            conn_timeout=conn_timeout,
+        # Cached responses are discarded whenever a connection is (re)opened
+        self._response_cache: ResponseCache[tuple[str, ...]] = ResponseCache(
+            cache_size, cache_ttl
         )
 
-        self._username = username
-        self._password = password
-        self._read_timeout = read_timeout
-        self._connection_lock = asyncio.Lock()
-        self._command_lock = asyncio.Lock()
+        self._channels = [
+            CommandChannel(
+                CommandConnection(
+                    host,
+                    port=port,
+                    ssl=ssl,
+                    ssl_context_factory=ssl_context_factory,
+                    conn_timeout=conn_timeout,
+                    buffered=buffered_reader,
+                ),
+                username,
+                password,
+                read_timeout=read_timeout,
+                pipeline_depth=pipeline_depth,
+                health_check_interval=health_check_interval,
+                read_events=read_events and index == 0,
+                on_connect=self._response_cache.clear,
+                recorder=recorder,
+            )
+            for index in range(max(pool_size, 1))
+        ]
+
+        self._coalesce_setters = coalesce_setters
+        self._in_flight_requests: dict[str, asyncio.Future[list[str]]] = {}
+        self._latest_requests: dict[Hashable, _LatestRequests] = {}
 
     async def __aenter__(self) -> Self:
         """Return context manager."""
@@ -95,9 +152,27 @@ class CommandClient:
         if exc_val:
             raise exc_val
 
+    @property
+    def coalesce_setters(self) -> bool:
+        """Whether rapid calls to setter methods of objects are coalesced."""
+        return self._coalesce_setters
+
+    @property
+    def response_cache(self) -> ResponseCache[tuple[str, ...]]:
+        """The cache of responses to requests for rarely changing values."""
+        return self._response_cache
+
+    @property
+    def event_channel(self) -> CommandChannel | None:
+        """The first channel, if it continuously reads event lines, eg. with `read_events`."""
+        channel = self._channels[0]
+        return channel if channel.reads_events else None
+
     def close(self) -> None:
-        """Close the connection to the Host Command service."""
-        self._connection.close()
+        """Close the connection(s) to the Host Command service."""
+        self._response_cache.clear()
+        for channel in self._channels:
+            channel.close()
 
     async def command(self, command: str, *params: Any) -> CommandResponse:
         """Send a command to the Host Command service and wait for a response.
@@ -109,21 +184,57 @@ class CommandClient:
         Returns:
             A CommandResponse instance.
         """
-        # Build the request
-        request = command
-        if params:
-            request += " " + " ".join(Converter.serialize(p) for p in params)
-
         # Send the request
-        *data, return_line = await self.raw_request(request)
-
-        # Break the response into tokens
-        command, *args = Converter.tokenize(return_line)
+        response = await self.raw_request(_build_request(command, *params))
 
         # Parse the response
-        return CommandResponse(command[2:], args, data)
+        return _parse_response(response)
+
+    @overload
+    async def command_many(
+        self, *commands: tuple[Any, ...], return_exceptions: Literal[False] = False
+    ) -> list[CommandResponse]: ...
+
+    @overload
+    async def command_many(
+        self, *commands: tuple[Any, ...], return_exceptions: Literal[True]
+    ) -> list[CommandResponse | CommandError]: ...
+
+    async def command_many(
+        self, *commands: tuple[Any, ...], return_exceptions: bool = False
+    ) -> list[CommandResponse] | list[CommandResponse | CommandError]:
+        """Send a batch of commands to the Host Command service in a single write.
+
+        Args:
+            commands: The commands to send, each a tuple of the command and its params.
+            return_exceptions: Whether to return command errors in place of responses,
+                rather than raising the first command error.
+
+        Returns:
+            A CommandResponse instance for each command, in order.
+        """
+        # Send the requests
+        responses = await self.raw_request_many(
+            [_build_request(*command) for command in commands],
+            return_exceptions=True,
+        )
+
+        # Parse the responses
+        results: list[CommandResponse | CommandError] = []
+        for response in responses:
+            if isinstance(response, CommandError):
+                if not return_exceptions:
+                    raise response
+
+                results.append(response)
+            else:
+                results.append(_parse_response(response))
 
-    async def raw_request(self, request: str) -> list[str]:
+        return results
+
+    async def raw_request(
+        self, request: str, *, priority: CommandPriority | None = None
+    ) -> list[str]:
         """Send a raw command to the Host Command service and return all response lines.
 
         Handles authentication if required, and raises an exception if the response line
@@ -131,62 +242,214 @@ class CommandClient:
 
         Args:
             request: The request to send.
+            priority: The priority of the command, defaults to the priority set by
+                [`command_priority`][aiovantage.command_client.command_priority].
 
         Returns:
             The response lines received from the server.
         """
-        conn = await self._get_connection()
+        channel = self._select_channel()
 
         # Send the command
-        async with self._command_lock:
-            logger.debug("Sending command: %s", request)
-            await conn.write(f"{request}\n")
-
-            # Read all lines of the response
-            response_lines: list[str] = []
-            while True:
-                response_line = await conn.readuntil(b"\r\n", self._read_timeout)
-                response_line = response_line.rstrip()
-
-                # Handle command errors
-                if response_line.startswith("R:ERROR"):
-                    # Parse a command error from a message.
-                    match = re.match(r"R:ERROR:(\d+) (.+)", response_line)
-                    if not match:
-                        raise CommandError(response_line)
-
-                    # Convert the error code to a specific exception, if possible
-                    raise_command_error(int(match.group(1)), match.group(2))
-
-                # Ignore potentially interleaved "event" messages
-                if response_line.startswith(("S:", "L:", "EL:")):
-                    logger.debug("Ignoring event message: %s", response_line)
-                    continue
-
-                # Return the response once we see the response line
-                response_lines.append(response_line)
-                if response_line.startswith("R:"):
-                    break
-
+        logger.debug("Sending command: %s", request)
+        response_lines = await channel.request(
+            request, current_priority() if priority is None else priority
+        )
         logger.debug("Received response: %s", "\n".join(response_lines))
 
         return response_lines
 
-    async def _get_connection(self) -> CommandConnection:
-        """Get a connection to the Host Command service."""
-        async with self._connection_lock:
-            if self._connection.closed:
-                # Open a new connection
-                await self._connection.open()
+    async def raw_request_cached(
+        self, request: str, *, priority: CommandPriority | None = None
+    ) -> list[str]:
+        """Send a raw command, or return a cached response to the same command.
+
+        Only suitable for commands which return rarely changing values, such as the
+        type or model of an object. Responses are cached until they expire, or the
+        cache is cleared.
+
+        Args:
+            request: The request to send.
+            priority: The priority of the command, defaults to the priority set by
+                [`command_priority`][aiovantage.command_client.command_priority].
+
+        Returns:
+            The response lines received from the server, or the cached response lines.
+        """
+        # Responses are cached as tuples, so callers can't modify the cached copy
+        cached = self._response_cache.get(request)
+        if cached is not None:
+            logger.debug("Using cached response for command: %s", request)
+            return list(cached)
+
+        response = await self.raw_request_shared(request, priority=priority)
+        self._response_cache.set(request, tuple(response))
+
+        return response
+
+    async def raw_request_shared(
+        self, request: str, *, priority: CommandPriority | None = None
+    ) -> list[str]:
+        """Send a raw command, or wait for an identical command which is in flight.
+
+        Only suitable for commands without side effects, such as reading the level of
+        a load, since concurrent identical commands are only sent once.
+
+        Args:
+            request: The request to send.
+            priority: The priority of the command, defaults to the priority set by
+                [`command_priority`][aiovantage.command_client.command_priority].
+
+        Returns:
+            The response lines received from the server.
+        """
+        in_flight = self._in_flight_requests.get(request)
+        if in_flight is None:
+            in_flight = asyncio.ensure_future(
+                self.raw_request(request, priority=priority)
+            )
+            self._in_flight_requests[request] = in_flight
+
+            def request_done(future: asyncio.Future[list[str]]) -> None:
+                if self._in_flight_requests.get(request) is future:
+                    del self._in_flight_requests[request]
+
+                # Retrieve the exception, in case every caller was cancelled
+                if not future.cancelled():
+                    future.exception()
+
+            in_flight.add_done_callback(request_done)
+        else:
+            logger.debug("Sharing in-flight command: %s", request)
+
+        # Shield the shared request, so a cancelled caller doesn't cancel it for others
+        return await asyncio.shield(in_flight)
+
+    async def raw_request_latest(
+        self,
+        key: Hashable,
+        request: str,
+        *,
+        priority: CommandPriority | None = None,
+    ) -> list[str] | None:
+        """Send a raw command, unless superseded by a later command with the same key.
+
+        Commands with the same key are sent one at a time. If more commands with the
+        same key are made while one is being sent, only the latest of them is sent
+        next, and the others are dropped.
+
+        Args:
+            key: The key identifying commands which supersede each other, eg. the VID
+                and method of the command.
+            request: The request to send.
+            priority: The priority of the command, defaults to the priority set by
+                [`command_priority`][aiovantage.command_client.command_priority].
+
+        Returns:
+            The response lines received from the server, or None if the command was
+            superseded and not sent.
+        """
+        latest = self._latest_requests.get(key)
+        if latest is None:
+            latest = self._latest_requests[key] = _LatestRequests()
+
+        latest.sequence += 1
+        latest.waiters += 1
+        sequence = latest.sequence
+
+        try:
+            async with latest.lock:
+                if sequence != latest.sequence:
+                    logger.debug("Dropping superseded command: %s", request)
+                    return None
+
+                return await self.raw_request(request, priority=priority)
+        finally:
+            latest.waiters -= 1
+            if not latest.waiters:
+                del self._latest_requests[key]
+
+    @overload
+    async def raw_request_many(
+        self,
+        requests: Sequence[str],
+        *,
+        return_exceptions: Literal[False] = False,
+        priority: CommandPriority | None = None,
+    ) -> list[list[str]]: ...
+
+    @overload
+    async def raw_request_many(
+        self,
+        requests: Sequence[str],
+        *,
+        return_exceptions: Literal[True],
+        priority: CommandPriority | None = None,
+    ) -> list[list[str] | CommandError]: ...
+
+    async def raw_request_many(
+        self,
+        requests: Sequence[str],
+        *,
+        return_exceptions: bool = False,
+        priority: CommandPriority | None = None,
+    ) -> list[list[str]] | list[list[str] | CommandError]:
+        """Send a batch of raw commands in a single write, and return all responses.
+
+        All commands in the batch are sent on the same connection, and written and
+        flushed at once, rather than paying the cost of a write for each command.
+        When pipelining, larger batches than the pipeline depth are written in parts,
+        as earlier commands are answered.
+
+        Args:
+            requests: The requests to send.
+            return_exceptions: Whether to return command errors in place of responses,
+                rather than raising the first command error.
+            priority: The priority of the batch, defaults to the priority set by
+                [`command_priority`][aiovantage.command_client.command_priority].
+
+        Returns:
+            The response lines received from the server for each request, in order.
+        """
+        if not requests:
+            return []
+
+        channel = self._select_channel()
+
+        # Send the commands
+        logger.debug("Sending %d commands: %s", len(requests), "\n".join(requests))
+        responses = await channel.request_many(
+            requests, current_priority() if priority is None else priority
+        )
+        logger.debug("Received %d responses", len(responses))
+
+        # Raise the first command error, unless asked to return them
+        if not return_exceptions:
+            for response in responses:
+                if isinstance(response, CommandError):
+                    raise response
+
+        return responses
+
+    def _select_channel(self) -> CommandChannel:
+        # Prefer healthy connections, with the fewest outstanding commands
+        return min(
+            self._channels, key=lambda channel: (not channel.healthy, channel.busy)
+        )
+
+
+def _build_request(command: str, *params: Any) -> str:
+    # Build a request from a command and its serialized parameters
+    request = command
+    if params:
+        request += " " + " ".join(Converter.serialize(p) for p in params)
+
+    return request
 
-                # Authenticate the new connection if we have credentials
-                if self._username and self._password:
-                    await self._connection.authenticate(self._username, self._password)
 
-                logger.info(
-                    "Connected to command client at %s:%d",
-                    self._connection.host,
-                    self._connection.port,
-                )
+def _parse_response(response: list[str]) -> CommandResponse:
+    # Break the response line into tokens, and wrap it with any additional lines
+    *data, return_line = response
+    command, *args = Converter.tokenize(return_line)
 
-            return self._connection
+    return CommandResponse(command[2:], args, data)
@@ -2,6 +2,7 @@ import datetime as dt
 import re
 import struct
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from decimal import Decimal
 from enum import IntEnum
 from typing import Any
@@ -251,14 +252,33 @@ class Converter:
         Returns:
             The deserialized object.
         """
+        return Converter.deserializer(data_type, **kwargs)(value)
+
+    @staticmethod
+    def deserializer(data_type: type, **kwargs: Any) -> Callable[[str], Any]:
+        """Get a function to deserialize tokens from the Host Command service.
+
+        The converter for the data type is looked up once, so the returned function
+        can be reused to deserialize many tokens cheaply.
+
+        Args:
+            data_type: The data type to deserialize values to.
+            **kwargs: Additional deserialization arguments.
+
+        Returns:
+            A function which deserializes a string token to the data type.
+        """
         converter = _get_converter(data_type)
 
-        try:
-            return converter.deserialize(value, data_type=data_type, **kwargs)
-        except Exception as ex:
-            raise ConversionError(
-                f"Failed to deserialize value '{value}' of type {data_type}"
-            ) from ex
+        def deserialize(value: str) -> Any:
+            try:
+                return converter.deserialize(value, data_type=data_type, **kwargs)
+            except Exception as ex:
+                raise ConversionError(
+                    f"Failed to deserialize value '{value}' of type {data_type}"
+                ) from ex
+
+        return deserialize
 
     @staticmethod
     def serialize(value: Any, **kwargs: Any) -> str:
@@ -1,7 +1,9 @@
 import asyncio
 from collections import Counter
-from collections.abc import Callable
+from collections.abc import Callable, Container
 from contextlib import suppress
+from itertools import islice
+from pathlib import Path
 from ssl import SSLContext
 from types import TracebackType
 from typing import TypeVar
@@ -19,18 +21,28 @@ from aiovantage.events import (
     StatusReceived,
 )
 
+from .channel import CommandChannel
+from .client import CommandClient
 from .connection import CommandConnection
-from .converter import Converter
+from .priority import CommandPriority
+from .recorder import COMMAND_CLIENT, EVENT_STREAM, StreamRecorder, read_recording
 
 T = TypeVar("T")
 
 # The interval between keepalive messages, in seconds.
 KEEPALIVE_INTERVAL = 60
 
+# The number of recorded lines read at a time when replaying a recording.
+REPLAY_BATCH_SIZE = 1000
+
 
 class EventStream(EventDispatcher):
     """Client to subscribe to events from the Vantage Host Command (HC) service.
 
+    By default, the event stream opens its own connection. Optionally, it can share
+    a connection with a command client created with `read_events=True`, in which case
+    events received on that connection are dispatched by the event stream.
+
     Args:
         host: The hostname or IP address of the Vantage controller.
         username: The username to use for authentication.
@@ -39,6 +51,11 @@ class EventStream(EventDispatcher):
         ssl_context_factory: A factory function to use when creating default SSL contexts.
         port: The port to connect to.
         conn_timeout: The connection timeout in seconds.
+        buffered_reader: Whether to read from the connection with a buffered protocol,
+            which reduces per-line overhead when reading many lines.
+        command_client: A command client to share a connection with, rather than
+            opening a separate connection.
+        recorder: An optional recorder to record received messages with.
     """
 
     def __init__(
@@ -51,24 +68,39 @@ class EventStream(EventDispatcher):
         ssl_context_factory: Callable[[], SSLContext] | None = None,
         port: int | None = None,
         conn_timeout: float = 30,
+        buffered_reader: bool = False,
+        command_client: CommandClient | None = None,
+        recorder: StreamRecorder | None = None,
     ) -> None:
         """Initialize the client."""
+        # Use the command client's event channel, if sharing a connection
+        self._channel: CommandChannel | None = None
+        if command_client is not None:
+            self._channel = command_client.event_channel
+            if self._channel is None:
+                raise ValueError("The command client does not read events.")
+
         self._connection = CommandConnection(
             host,
             port=port,
             ssl=ssl,
             ssl_context_factory=ssl_context_factory,
             conn_timeout=conn_timeout,
+            buffered=buffered_reader,
         )
 
         self._username = username
         self._password = password
+        self._recorder = recorder
         self._tasks: list[asyncio.Task[None]] = []
         self._start_lock = asyncio.Lock()
         self._started = False
         self._connection_lock = asyncio.Lock()
         self._command_queue: asyncio.Queue[str] = asyncio.Queue()
 
+        # Status subscribers, indexed by category, including "ALL"
+        self._status_subscribers: dict[str, list[Callable[[StatusReceived], None]]] = {}
+
         self._status_counts: StatusCounter[str] = StatusCounter(
             on_first_add=self._enable_status,
             on_last_remove=self._disable_status,
@@ -105,6 +137,9 @@ class EventStream(EventDispatcher):
 
             # Start the event stream tasks
             if not self._started:
+                if self._channel is not None:
+                    self._channel.event_handler = self._handle_message
+
                 self._tasks.append(asyncio.create_task(self._message_handler()))
                 self._tasks.append(asyncio.create_task(self._command_handler()))
                 self._tasks.append(asyncio.create_task(self._keepalive()))
@@ -119,13 +154,79 @@ class EventStream(EventDispatcher):
         for task in self._tasks:
             task.cancel()
         self._tasks.clear()
-        self._connection.close()
+
+        # Stop handling events, but leave a shared connection to the command client
+        if self._channel is not None:
+            self._channel.event_handler = None
+        else:
+            self._connection.close()
 
         logger.debug("Stopped the event stream")
         self._started = False
 
+    async def replay(
+        self,
+        path: str | Path,
+        *,
+        speed: float | None = 1.0,
+        sources: Container[str] = (EVENT_STREAM,),
+    ) -> int:
+        """Replay a recording made by a `StreamRecorder`, without a connection.
+
+        Recorded messages are parsed and emitted as if they were received from the
+        Host Command service, so subscribers can be tested with real traffic.
+
+        Args:
+            path: The path of the recording.
+            speed: The playback speed relative to the recording, eg. 2.0 for twice
+                as fast, or None to replay as fast as possible.
+            sources: The clients to replay lines received by, "E" for the event stream
+                and "C" for the command client. Responses received by the command
+                client are skipped, only event messages are replayed.
+
+        Returns:
+            The number of messages replayed.
+        """
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        replayed = 0
+
+        # Read the recording in batches in a thread, so file reads don't block the
+        # event loop, which also yields to it between batches
+        recording = read_recording(path)
+        try:
+            while batch := await asyncio.to_thread(
+                list, islice(recording, REPLAY_BATCH_SIZE)
+            ):
+                for recorded in batch:
+                    if recorded.source not in sources:
+                        continue
+
+                    # Responses to commands aren't event stream traffic
+                    if recorded.source == COMMAND_CLIENT and not _is_event(
+                        recorded.line
+                    ):
+                        continue
+
+                    # Wait until the message is due
+                    if speed is not None:
+                        delay = start + recorded.time / speed - loop.time()
+                        if delay > 0:
+                            await asyncio.sleep(delay)
+
+                    self._parse_message(recorded.line)
+                    replayed += 1
+        finally:
+            recording.close()
+
+        return replayed
+
     async def _get_connection(self) -> CommandConnection:
         """Get a connection to the Host Command service."""
+        # Use the shared connection, which the command client opens and authenticates
+        if self._channel is not None:
+            return await self._channel.connect()
+
         async with self._connection_lock:
             if self._connection.closed:
                 # Open a new connection
@@ -161,17 +262,17 @@ class EventStream(EventDispatcher):
         # Enable this status type if it's not already enabled
         self._status_counts.update(categories)
 
-        # Filter events by category
-        def filtered_callback(event: StatusReceived) -> None:
-            if "ALL" in categories or event.category in categories:
-                callback(event)
-
-        # Subscribe, and return an wrapped unsubscribe callback
-        off = self.subscribe(StatusReceived, filtered_callback)
+        # Index the callback by category, so events only reach matching subscribers
+        keys = {"ALL"} if "ALL" in categories else set(categories)
+        for category in keys:
+            self._status_subscribers.setdefault(category, []).append(callback)
 
         def unsubscribe_status() -> None:
             self._status_counts.subtract(categories)
-            off()
+            for category in keys:
+                self._status_subscribers[category].remove(callback)
+                if not self._status_subscribers[category]:
+                    del self._status_subscribers[category]
 
         return unsubscribe_status
 
@@ -216,12 +317,16 @@ class EventStream(EventDispatcher):
                     self._resubscribe()
                 connect_attempts = 1
 
-                # Wait for new messages
+                # Messages on a shared connection are read by the command client,
+                # so just wait for the connection to be lost
+                if self._channel is not None:
+                    await self._channel.wait_closed()
+                    raise ClientConnectionError("Connection lost.")
+
+                # Wait for new messages, which may arrive in batches
                 while True:
-                    message = await conn.readuntil(b"\r\n")
-                    message = message.rstrip()
-                    logger.debug("Received message: %s", message)
-                    self._parse_message(message)
+                    for message in await conn.readlines():
+                        self._handle_message(message)
 
             except ClientConnectionError:
                 pass  # Pass through to retry logic below
@@ -276,19 +381,35 @@ class EventStream(EventDispatcher):
     async def _send(self, message: str) -> None:
         # Send a plaintext message to the Host Command service."""
         logger.debug("Sending message: %s", message)
+
+        # Send as a command on a shared connection, so the response is consumed
+        if self._channel is not None:
+            await self._channel.request(message, CommandPriority.BACKGROUND)
+            return
+
         await self._connection.write(f"{message}\n")
 
+    def _handle_message(self, message: str) -> None:
+        # Handle a message received from the Host Command service.
+        logger.debug("Received message: %s", message)
+        if self._recorder is not None:
+            self._recorder.record(EVENT_STREAM, message)
+
+        self._parse_message(message)
+
     def _parse_message(self, message: str) -> None:
         # Parse a message from the Host Command service.
         if message.startswith("S:"):
-            # Parse a "status" message, of the form "S:<type> <vid> <args>"
+            # Emit a "status" message, of the form "S:<type> <vid> <args>"
             # These messages are emitted when the state of an object changes after
             # subscribing to updates via "STATUS <type>" or "ADDSTATUS <vid>".
-            category, vid_str, *args = Converter.tokenize(message)
-            self.emit(StatusReceived(category[2:], int(vid_str), args))
+            # The message is tokenized lazily, when first accessed by a subscriber.
+            event = StatusReceived.from_message(message)
+            self.emit(event)
+            self._dispatch_status(event, message[2:].split(" ", 1)[0])
 
         elif message.startswith("EL: "):
-            # Parse an "enhanced log" message, of the form "EL: <log>"
+            # Emit an "enhanced log" message, of the form "EL: <log>"
             # These messages are emitted when an enhanced log is received after
             # subscribing to updates via "ELLOG <type>".
             self.emit(EnhancedLogReceived(message[4:]))
@@ -296,6 +417,12 @@ class EventStream(EventDispatcher):
         elif message.startswith("R:ERROR"):
             logger.error("Error message from EventStream: %s", message)
 
+    def _dispatch_status(self, event: StatusReceived, category: str) -> None:
+        # Pass a status event to subscribers of its category, and of "ALL" categories
+        for key in (category, "ALL"):
+            for callback in self._status_subscribers.get(key, ()):
+                self._call_subscriber(callback, event)
+
     def _queue_command(self, command: str) -> None:
         # Queue a command to be sent to the Host Command service.
         self._command_queue.put_nowait(command)
@@ -353,3 +480,8 @@ class StatusCounter(Counter[T]):
         elif previous > 0 and value <= 0:
             self._on_last_remove(key)
             del self[key]
+
+
+def _is_event(message: str) -> bool:
+    # Check if a message is an "event" message, rather than a response to a command
+    return message.startswith(("S:", "L:", "EL:"))
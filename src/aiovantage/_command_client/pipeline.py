@@ -0,0 +1,364 @@
+import asyncio
+import re
+from collections import deque
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+from aiovantage._logger import logger
+from aiovantage.errors import (
+    ClientConnectionError,
+    ClientTimeoutError,
+    CommandError,
+    command_error,
+)
+
+from .connection import CommandConnection
+from .converter import Converter
+from .priority import CommandPriority, PrioritySemaphore
+from .recorder import COMMAND_CLIENT, StreamRecorder
+
+
+def parse_error(response_line: str) -> CommandError:
+    """Parse a command error from an "R:ERROR" response line.
+
+    Args:
+        response_line: The response line, eg. "R:ERROR:7 Invalid Object"
+
+    Returns:
+        The command error, converted to a specific exception type if possible.
+    """
+    match = re.match(r"R:ERROR:(\d+) (.+)", response_line)
+    if not match:
+        return CommandError(response_line)
+
+    return command_error(int(match.group(1)), match.group(2))
+
+
+def _method_key(token: str) -> str:
+    # Methods may be quoted in requests, but are echoed unquoted in responses
+    if token.startswith('"') and token.endswith('"') and len(token) >= 2:
+        token = token[1:-1]
+
+    return token.upper()
+
+
+def request_key(request: str) -> tuple[str, ...]:
+    """Get the key used to match a request to its response line.
+
+    Args:
+        request: The request, eg. "INVOKE 123 Load.GetLevel"
+
+    Returns:
+        The command, VID and method for INVOKE requests, otherwise just the command.
+    """
+    # INVOKE <vid> <method> <arg1> <arg2> ...
+    # <command> <arg1> <arg2> ...
+    command, *tokens = Converter.tokenize(request)
+    command = command.upper()
+    if command == "INVOKE" and len(tokens) >= 2:
+        return (command, tokens[0], _method_key(tokens[1]))
+
+    return (command,)
+
+
+def response_key(response_line: str) -> tuple[str, ...]:
+    """Get the key used to match a response line to its request.
+
+    Args:
+        response_line: The response line, eg. "R:INVOKE 123 100.000 Load.GetLevel"
+
+    Returns:
+        The command, VID and method for INVOKE responses, otherwise just the command.
+    """
+    # -> R:INVOKE <vid> <result> <method> <arg1> <arg2> ...
+    # -> R:<command> <arg1> <arg2> ...
+    command = response_line[2:].split(maxsplit=1)[0].upper()
+    if command == "INVOKE":
+        tokens = Converter.tokenize(response_line)
+        if len(tokens) >= 4:
+            return (command, tokens[1], _method_key(tokens[3]))
+
+    return (command,)
+
+
+@dataclass
+class _PendingRequest:
+    key: tuple[str, ...]
+    future: "asyncio.Future[list[str]]"
+
+
+class CommandPipeline:
+    """Pipelined request handling for a Host Command connection.
+
+    Requests are written to the connection as soon as they are made, without waiting
+    for the responses to earlier requests. A background task reads response lines,
+    and matches each "R:" line to the oldest outstanding request with the same
+    command, VID and method, since these are echoed back in the response.
+
+    Interleaved event lines are passed to the event handler, if one is set.
+
+    Args:
+        connection: The connection to send requests on.
+        max_in_flight: The maximum number of outstanding requests.
+        recorder: An optional recorder to record received response lines with.
+    """
+
+    def __init__(
+        self,
+        connection: CommandConnection,
+        max_in_flight: int,
+        recorder: StreamRecorder | None = None,
+    ) -> None:
+        """Initialize the pipeline."""
+        self._connection = connection
+        self._recorder = recorder
+        self._slots = PrioritySemaphore(max_in_flight)
+        self._pending: deque[_PendingRequest] = deque()
+        self._data: list[str] = []
+        self._reader_task: asyncio.Task[None] | None = None
+        self.event_handler: Callable[[str], None] | None = None
+
+    @property
+    def in_flight(self) -> int:
+        """The number of requests awaiting a response."""
+        return len(self._pending)
+
+    async def wait_stopped(self) -> None:
+        """Wait until the pipeline stops reading responses from the connection."""
+        if self._reader_task is not None:
+            await asyncio.wait([self._reader_task])
+
+    def start(self) -> None:
+        """Start reading responses from the connection."""
+        if self._reader_task is None or self._reader_task.done():
+            self._data.clear()
+            self._reader_task = asyncio.create_task(self._read_responses())
+
+    def stop(self, exc: Exception | None = None) -> None:
+        """Stop reading responses, and fail any outstanding requests.
+
+        Args:
+            exc: The exception to fail outstanding requests with.
+        """
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            self._reader_task = None
+
+        self._fail_pending(exc or ClientConnectionError("Client closed."))
+
+    async def request(
+        self,
+        request: str,
+        timeout: float | None = None,
+        priority: CommandPriority = CommandPriority.NORMAL,
+    ) -> list[str]:
+        """Send a request, and wait for the response lines.
+
+        When the maximum number of requests are outstanding, waiting requests are
+        sent in priority order.
+
+        Args:
+            request: The request to send.
+            timeout: The optional timeout in seconds.
+            priority: The priority of the request.
+
+        Returns:
+            The response lines received from the server.
+        """
+        await self._slots.acquire(priority)
+        pending = self._register(request)
+        try:
+            await self._connection.write(f"{request}\n")
+        except ClientConnectionError:
+            self._discard_pending([pending])
+            raise
+
+        # Wait for the response. If the caller stops waiting, the request keeps its
+        # slot until the response arrives, since it is still outstanding.
+        try:
+            return await asyncio.wait_for(asyncio.shield(pending.future), timeout)
+        except asyncio.TimeoutError as err:
+            self._reset(ClientTimeoutError("Timed out waiting for a response."))
+            raise ClientTimeoutError from err
+
+    async def request_many(
+        self,
+        requests: Sequence[str],
+        timeout: float | None = None,
+        priority: CommandPriority = CommandPriority.NORMAL,
+    ) -> list[list[str] | CommandError]:
+        """Send a batch of requests, and wait for all responses.
+
+        Each request in the batch takes a slot, like any other request. Requests are
+        written together, in as few writes as the available slots allow.
+
+        Args:
+            requests: The requests to send.
+            timeout: The optional timeout in seconds, for the whole batch.
+            priority: The priority of the batch.
+
+        Returns:
+            The response lines, or command error, for each request in order.
+        """
+        batch: list[_PendingRequest] = []
+        unsent: list[tuple[str, _PendingRequest]] = []
+
+        async def write_unsent() -> None:
+            data = "".join(f"{r}\n" for r, _ in unsent)
+            sending = [pending for _, pending in unsent]
+            unsent.clear()
+            try:
+                await self._connection.write(data)
+            except ClientConnectionError:
+                self._discard_pending(sending)
+                raise
+
+        async def send() -> list[list[str] | BaseException]:
+            for request in requests:
+                # Write the requests we have slots for, before waiting for more
+                if unsent and self._slots.locked():
+                    await write_unsent()
+
+                await self._slots.acquire(priority)
+                pending = self._register(request)
+                batch.append(pending)
+                unsent.append((request, pending))
+
+            await write_unsent()
+
+            # Wait for all the responses, without cancelling outstanding requests
+            # if we stop waiting
+            return await asyncio.gather(
+                *(asyncio.shield(pending.future) for pending in batch),
+                return_exceptions=True,
+            )
+
+        try:
+            try:
+                results = await asyncio.wait_for(send(), timeout)
+            finally:
+                # Unregister requests which were never sent
+                self._discard_pending([pending for _, pending in unsent])
+        except asyncio.TimeoutError as err:
+            self._reset(ClientTimeoutError("Timed out waiting for a response."))
+            raise ClientTimeoutError from err
+
+        # Command errors are returned, anything else fails the whole batch
+        responses: list[list[str] | CommandError] = []
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(
+                result, CommandError
+            ):
+                raise result
+
+            responses.append(result)
+
+        return responses
+
+    async def _read_responses(self) -> None:
+        # Read response lines from the connection, and dispatch them to requests
+        try:
+            while True:
+                for response_line in await self._connection.readlines():
+                    self._handle_line(response_line)
+        except ClientConnectionError as err:
+            # Close the connection so it is reopened by the next request
+            self._connection.close()
+            self._fail_pending(err)
+
+    def _handle_line(self, response_line: str) -> None:
+        # Handle potentially interleaved "event" messages
+        if response_line.startswith(("S:", "L:", "EL:")):
+            if self.event_handler is not None:
+                self.event_handler(response_line)
+            else:
+                logger.debug("Ignoring event message: %s", response_line)
+            return
+
+        if self._recorder is not None:
+            self._recorder.record(COMMAND_CLIENT, response_line)
+
+        # Collect additional lines, which precede the response line
+        if not response_line.startswith("R:"):
+            self._data.append(response_line)
+            return
+
+        # Errors don't echo the request, but the controller handles requests in
+        # order, so they belong to the oldest outstanding request
+        if response_line.startswith("R:ERROR"):
+            pending = self._pop_pending(None)
+        else:
+            pending = self._pop_pending(response_key(response_line))
+
+        data, self._data = self._data, []
+        if pending is None:
+            logger.debug("Ignoring unexpected response: %s", response_line)
+            return
+
+        # Requests which were discarded have already been cancelled
+        if pending.future.done():
+            return
+
+        if response_line.startswith("R:ERROR"):
+            pending.future.set_exception(parse_error(response_line))
+        else:
+            pending.future.set_result([*data, response_line])
+
+    def _pop_pending(self, key: tuple[str, ...] | None) -> _PendingRequest | None:
+        # Find the oldest outstanding request matching the key, or the oldest
+        # outstanding request if there is no key
+        if not self._pending:
+            return None
+
+        if key is None:
+            return self._pending.popleft()
+
+        for index, pending in enumerate(self._pending):
+            if pending.key == key:
+                del self._pending[index]
+                return pending
+
+        # The controller answers requests in order, so a response we can't match
+        # by key still belongs to the oldest outstanding request
+        logger.debug("No request matches response key %s, using oldest", key)
+        return self._pending.popleft()
+
+    def _register(self, request: str) -> _PendingRequest:
+        # Register a request, which holds a slot, before writing it so the response
+        # can't arrive before we are waiting for it. The slot is freed once the
+        # request is answered, failed, or discarded.
+        pending = _PendingRequest(
+            request_key(request), asyncio.get_running_loop().create_future()
+        )
+        pending.future.add_done_callback(self._request_done)
+        self._pending.append(pending)
+        return pending
+
+    def _request_done(self, future: "asyncio.Future[list[str]]") -> None:
+        self._slots.release()
+
+        # Retrieve the exception, in case the caller stopped waiting
+        if not future.cancelled():
+            future.exception()
+
+    def _discard_pending(self, requests: Sequence[_PendingRequest]) -> None:
+        # Unregister requests which were never sent, unless they were already
+        # failed and unregistered because the connection was lost
+        for pending in requests:
+            if pending in self._pending:
+                self._pending.remove(pending)
+            pending.future.cancel()
+
+    def _reset(self, exc: Exception) -> None:
+        # After a timeout, late responses and errors can't be reliably matched to
+        # their requests, so close the connection to be reopened by the next
+        # request, and fail all outstanding requests
+        self._connection.close()
+        self.stop(exc)
+
+    def _fail_pending(self, exc: Exception) -> None:
+        # Fail all outstanding requests with the given exception
+        while self._pending:
+            pending = self._pending.popleft()
+            if not pending.future.done():
+                pending.future.set_exception(exc)
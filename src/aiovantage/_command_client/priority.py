@@ -0,0 +1,128 @@
+import asyncio
+import heapq
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from itertools import count
+
+
+class CommandPriority(IntEnum):
+    """Priority classes for commands sent to the Host Command service.
+
+    When commands are queued waiting for a connection, higher priority commands are
+    sent first. Commands with the same priority are sent in the order they were made.
+    """
+
+    INTERACTIVE = 0
+    """User-initiated commands, which should be sent as soon as possible.
+
+    Commands which control objects, such as setting the level of a load, are sent
+    with this priority unless a different priority is set.
+    """
+
+    NORMAL = 1
+    """The default priority for commands."""
+
+    BACKGROUND = 2
+    """Bulk or periodic commands, such as fetching state, keepalives, or polling."""
+
+
+_priority: ContextVar[CommandPriority] = ContextVar(
+    "command_priority", default=CommandPriority.NORMAL
+)
+
+
+def current_priority() -> CommandPriority:
+    """Get the priority for commands sent from the current context."""
+    return _priority.get()
+
+
+@contextmanager
+def command_priority(priority: CommandPriority) -> Iterator[None]:
+    """Set the priority of commands sent within the context.
+
+    The priority also applies to any tasks created within the context.
+
+    Example:
+        ```python
+        with command_priority(CommandPriority.BACKGROUND):
+            await load.get_level()
+        ```
+
+    Args:
+        priority: The priority to send commands with.
+    """
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class PrioritySemaphore:
+    """A semaphore which wakes waiters in priority order, rather than FIFO order.
+
+    Args:
+        value: The initial value of the semaphore.
+    """
+
+    def __init__(self, value: int = 1) -> None:
+        """Initialize the semaphore."""
+        self._value = value
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._counter = count()
+
+    @property
+    def waiting(self) -> int:
+        """The number of tasks waiting to acquire the semaphore."""
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    def locked(self) -> bool:
+        """Whether the semaphore can't be acquired without waiting."""
+        return self._value == 0
+
+    async def acquire(self, priority: int = CommandPriority.NORMAL) -> None:
+        """Acquire the semaphore, waiting behind any higher priority waiters.
+
+        Args:
+            priority: The priority of the waiter, lower values are woken first.
+        """
+        # The semaphore is only available when there are no waiters
+        if self._value > 0:
+            self._value -= 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future))
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Pass the semaphore on if we were woken, but cancelled before running
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Release the semaphore, handing it to the highest priority waiter."""
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+
+        self._value += 1
+
+    @asynccontextmanager
+    async def hold(self, priority: int = CommandPriority.NORMAL) -> AsyncIterator[None]:
+        """Acquire the semaphore for the duration of the context.
+
+        Args:
+            priority: The priority of the waiter, lower values are woken first.
+        """
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
@@ -0,0 +1,108 @@
+import gzip
+import time
+from collections.abc import Generator
+from pathlib import Path
+from types import TracebackType
+from typing import IO, NamedTuple
+
+from typing_extensions import Self
+
+# Sources of recorded lines
+EVENT_STREAM = "E"
+COMMAND_CLIENT = "C"
+
+
+class RecordedLine(NamedTuple):
+    """A line received from the Host Command service, read from a recording."""
+
+    time: float
+    """The time the line was received, in seconds since recording started."""
+
+    source: str
+    """The client which received the line, "E" for event stream, "C" for commands."""
+
+    line: str
+    """The line, without the trailing line ending."""
+
+
+def _open(path: str | Path, write: bool = False) -> IO[str]:
+    # Recordings ending in ".gz" are transparently compressed. Entries are only
+    # separated by "\n", so a stray "\r" in a recorded line doesn't split it.
+    if str(path).endswith(".gz"):
+        if write:
+            return gzip.open(path, "wt", encoding="utf-8", newline="\n")
+        return gzip.open(path, "rt", encoding="utf-8", newline="\n")
+
+    return open(path, "w" if write else "r", encoding="utf-8", newline="\n")
+
+
+class StreamRecorder:
+    """Records lines received from the Host Command service to a file.
+
+    Each line is written with the time it was received, relative to when recording
+    started, and the client which received it, eg. "12.345678 E S:LOAD 123 100.000".
+    Recordings can be replayed with
+    [`EventStream.replay`][aiovantage.command_client.EventStream.replay].
+
+    Lines are written to a buffered file, which is compressed if the path ends in
+    ".gz". The recorder can be shared between an event stream and a command client.
+
+    Args:
+        path: The path of the file to record to.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize the recorder."""
+        self._file = _open(path, write=True)
+        self._start = time.monotonic()
+        self.lines_recorded = 0
+
+    def __enter__(self) -> Self:
+        """Return context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit context manager."""
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        """Whether the recorder has been closed."""
+        return self._file.closed
+
+    def record(self, source: str, line: str) -> None:
+        """Record a received line.
+
+        Args:
+            source: The client which received the line, "E" or "C".
+            line: The line, without the trailing line ending.
+        """
+        if self._file.closed:
+            return
+
+        self._file.write(f"{time.monotonic() - self._start:.6f} {source} {line}\n")
+        self.lines_recorded += 1
+
+    def close(self) -> None:
+        """Flush and close the recording."""
+        self._file.close()
+
+
+def read_recording(path: str | Path) -> Generator[RecordedLine, None, None]:
+    """Read the lines of a recording made by a `StreamRecorder`.
+
+    Args:
+        path: The path of the recording.
+
+    Yields:
+        Each recorded line, in the order it was received.
+    """
+    with _open(path) as file:
+        for entry in file:
+            timestamp, source, line = entry.rstrip("\n").split(" ", 2)
+            yield RecordedLine(float(timestamp), source, line)
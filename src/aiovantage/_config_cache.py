@@ -0,0 +1,195 @@
+import asyncio
+import datetime as dt
+import os
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import NamedTuple
+
+from xsdata.formats.dataclass.serializers import XmlSerializer
+from xsdata.formats.dataclass.serializers.config import SerializerConfig
+
+from aiovantage._config_client.client import create_parser, create_xml_context
+from aiovantage._config_client.interfaces.configuration import WrappedObject
+from aiovantage._logger import logger
+from aiovantage.object_interfaces import ConfigurationInterface
+from aiovantage.objects import SystemObject
+
+# Increment when the format of cached configurations changes
+CACHE_FORMAT_VERSION = 2
+
+# The format of configuration times in cached configurations, which are in UTC
+_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+
+
+class ConfigVersion(NamedTuple):
+    """The times that the configuration of a Vantage system last changed."""
+
+    modification_time: dt.datetime
+    """The time an object was last modified."""
+
+    last_delete_time: dt.datetime
+    """The time an object was last deleted."""
+
+    last_clear_time: dt.datetime
+    """The time the configuration was last cleared."""
+
+    @classmethod
+    async def fetch(cls, master: ConfigurationInterface) -> "ConfigVersion":
+        """Fetch the configuration times from a master (controller).
+
+        Args:
+            master: The master object to query.
+
+        Returns:
+            The current configuration version.
+        """
+        modification_time, last_delete_time, last_clear_time = await asyncio.gather(
+            master.get_modification_time(),
+            master.get_last_delete_time(ConfigurationInterface.Store.Datastore),
+            master.get_last_clear_time(),
+        )
+
+        return cls(modification_time, last_delete_time, last_clear_time)
+
+
+@dataclass
+class CachedConfiguration:
+    """A cached copy of the configuration of a Vantage system."""
+
+    version: ConfigVersion
+    """The configuration version the objects were fetched at."""
+
+    vantage_types: tuple[str, ...]
+    """The object types that were fetched."""
+
+    objects: list[SystemObject]
+    """The objects that were fetched."""
+
+
+@dataclass
+class _CacheDocument:
+    # The on-disk format of a cached configuration. Objects are stored as the XML
+    # the ACI service returns them in, so they are parsed like fetched objects.
+    class Meta:
+        name = "ConfigurationCache"
+
+    format_version: int = field(metadata={"type": "Attribute"})
+    modification_time: dt.datetime = field(metadata={"format": _TIME_FORMAT})
+    last_delete_time: dt.datetime = field(metadata={"format": _TIME_FORMAT})
+    last_clear_time: dt.datetime = field(metadata={"format": _TIME_FORMAT})
+    vantage_types: list[str] = field(
+        default_factory=list[str],
+        metadata={"wrapper": "Types", "name": "Type", "type": "Element"},
+    )
+    objects: list[WrappedObject] = field(
+        default_factory=list[WrappedObject],
+        metadata={"wrapper": "Objects", "name": "Object", "type": "Element"},
+    )
+
+
+class ConfigCache:
+    """An on-disk cache of Vantage system configurations.
+
+    Configurations are stored in a file per system, keyed by the serial number of the
+    controller, so a single directory can be shared by multiple systems.
+
+    Args:
+        directory: The directory to store cached configurations in.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initialize the cache."""
+        self._directory = Path(directory)
+
+        xml_context = create_xml_context()
+        self._serializer = XmlSerializer(
+            config=SerializerConfig(indent="  "), context=xml_context
+        )
+        self._parser = create_parser(xml_context)
+
+    @property
+    def directory(self) -> Path:
+        """The directory cached configurations are stored in."""
+        return self._directory
+
+    def path(self, serial_number: int) -> Path:
+        """Get the path of the cached configuration for a controller.
+
+        Args:
+            serial_number: The serial number of the controller.
+
+        Returns:
+            The path of the cache file.
+        """
+        return self._directory / f"config-{serial_number}.xml"
+
+    def load(self, serial_number: int) -> CachedConfiguration | None:
+        """Load the cached configuration for a controller.
+
+        Args:
+            serial_number: The serial number of the controller.
+
+        Returns:
+            The cached configuration, or None if there is no usable cached copy.
+        """
+        try:
+            with open(self.path(serial_number), "rb") as file:
+                document = self._parser.parse(file, _CacheDocument)
+        except FileNotFoundError:
+            return None
+        except Exception as err:
+            # Unreadable, or created by an incompatible version of the library
+            logger.warning("Ignoring unreadable configuration cache: %s", err)
+            return None
+
+        if document.format_version != CACHE_FORMAT_VERSION:
+            return None
+
+        # Objects of unknown types can't be parsed, so the cache is incomplete
+        objects = [obj.obj for obj in document.objects]
+        if not all(isinstance(obj, SystemObject) for obj in objects):
+            logger.warning("Ignoring configuration cache with unknown objects")
+            return None
+
+        return CachedConfiguration(
+            ConfigVersion(
+                document.modification_time,
+                document.last_delete_time,
+                document.last_clear_time,
+            ),
+            tuple(document.vantage_types),
+            objects,  # type: ignore[arg-type]
+        )
+
+    def save(self, serial_number: int, config: CachedConfiguration) -> None:
+        """Save the configuration for a controller.
+
+        The cache file is replaced atomically, so a partially written file is never
+        loaded.
+
+        Args:
+            serial_number: The serial number of the controller.
+            config: The configuration to cache.
+        """
+        document = _CacheDocument(
+            format_version=CACHE_FORMAT_VERSION,
+            modification_time=config.version.modification_time,
+            last_delete_time=config.version.last_delete_time,
+            last_clear_time=config.version.last_clear_time,
+            vantage_types=list(config.vantage_types),
+            objects=[WrappedObject(obj.vid, obj) for obj in config.objects],
+        )
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+        content = self._serializer.render(document)  # type: ignore
+
+        fd, tmp_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                file.write(content)
+            os.replace(tmp_path, self.path(serial_number))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -1,6 +1,9 @@
 import asyncio
 import datetime as dt
+import logging
+import threading
 from collections.abc import Callable
+from concurrent.futures import Executor
 from ssl import SSLContext
 from types import TracebackType
 from typing import Any, Protocol, TypeVar
@@ -24,6 +27,9 @@ Interface = TypeVar("Interface")
 Call = TypeVar("Call")
 Return = TypeVar("Return")
 
+# The default size of responses to parse in the parse executor, in bytes
+DEFAULT_PARSE_OFFLOAD_THRESHOLD = 64 * 1024
+
 
 class Method(Protocol[Call, Return]):
     """Method protocol."""
@@ -46,6 +52,12 @@ class ConfigClient:
         port: The port to connect to.
         conn_timeout: The connection timeout in seconds.
         read_timeout: The read timeout in seconds.
+        buffered_reader: Whether to read from the connection with a buffered protocol,
+            which reduces per-line overhead when reading many lines.
+        parse_executor: An optional thread or process pool executor to parse large
+            responses in, so parsing doesn't block the event loop.
+        parse_offload_threshold: The size of responses, in bytes, at or above which
+            responses are parsed in the parse executor rather than inline.
     """
 
     def __init__(
@@ -59,6 +71,9 @@ class ConfigClient:
         port: int | None = None,
         conn_timeout: float = 30,
         read_timeout: float = 60,
+        buffered_reader: bool = False,
+        parse_executor: Executor | None = None,
+        parse_offload_threshold: int = DEFAULT_PARSE_OFFLOAD_THRESHOLD,
     ) -> None:
         """Initialize the client."""
         self._connection = ConfigConnection(
@@ -67,6 +82,7 @@ class ConfigClient:
             ssl=ssl,
             ssl_context_factory=ssl_context_factory,
             conn_timeout=conn_timeout,
+            buffered=buffered_reader,
         )
 
         self._username = username
@@ -74,26 +90,16 @@ class ConfigClient:
         self._read_timeout = read_timeout
         self._connection_lock = asyncio.Lock()
         self._request_lock = asyncio.Lock()
+        self._parse_executor = parse_executor
+        self._parse_offload_threshold = parse_offload_threshold
 
-        # Default to pascal case for element and attribute names
-        xml_context = XmlContext(
-            element_name_generator=_pascal_case_preserve,
-            attribute_name_generator=_pascal_case_preserve,
-            models_package="aiovantage._objects",
-        )
-
-        # Configure the request serializer
+        # Configure the request serializer, and the response parser
+        xml_context = create_xml_context()
         self._serializer = XmlSerializer(
             config=SerializerConfig(xml_declaration=False),
             context=xml_context,
         )
-
-        # Configure the response parser
-        self._parser = XmlParser(
-            config=ParserConfig(fail_on_unknown_properties=False),
-            context=xml_context,
-            handler=XmlEventHandler,
-        )
+        self._parser = create_parser(xml_context)
 
     async def __aenter__(self) -> Self:
         """Return context manager."""
@@ -120,16 +126,24 @@ class ConfigClient:
         Returns:
             The raw XML response.
         """
-        # Open the connection if it's closed
+        response = await self._raw_request_bytes(request, separator)
+        return response.decode()
+
+    async def _raw_request_bytes(self, request: str, separator: str) -> bytes:
+        # Send a raw XML request, and return the undecoded response. Open the
+        # connection if it's closed.
         conn = await self._get_connection()
 
         # Send the request and read the response
         logger.debug("Sending request: %s", request)
         async with self._request_lock:
             await conn.write(request)
-            response = await conn.readuntil(separator.encode(), self._read_timeout)
+            response = await conn.readuntil_bytes(
+                separator.encode(), self._read_timeout
+            )
 
-        logger.debug("Received response: %s", response)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received response: %s", response.decode())
 
         return response
 
@@ -149,6 +163,25 @@ class ConfigClient:
         Returns:
             The result of the method call.
         """
+        result, _size = await self.rpc_with_size(interface_cls, method_cls, params)
+        return result
+
+    async def rpc_with_size(
+        self,
+        interface_cls: type[Interface],
+        method_cls: type[Method[Call, Return]],
+        params: Call | None = None,
+    ) -> tuple[Return, int]:
+        """Call a remote procedure on the ACI service, and measure the response.
+
+        Args:
+            interface_cls: The interface class.
+            method_cls: The method class to call.
+            params: The parameters to pass to the method.
+
+        Returns:
+            The result of the method call, and the size of the raw XML response.
+        """
         # Build a method instance with the given parameters
         method = method_cls()
         method.call = params
@@ -159,12 +192,19 @@ class ConfigClient:
 
         # Build the request
         request_str = self._serializer.render(request)  # type: ignore
-        response_str = await self.raw_request(
+        response_bytes = await self._raw_request_bytes(
             request_str, f"</{type(request).__name__}>\n"
         )
 
-        # Parse the response
-        response = self._parser.from_string(response_str, type(request))
+        # Parse the response, in the parse executor if it's large. The parser
+        # works on bytes, so the response is never decoded.
+        size = len(response_bytes)
+        if self._parse_executor is not None and size >= self._parse_offload_threshold:
+            response = await asyncio.get_running_loop().run_in_executor(
+                self._parse_executor, _parse_response, response_bytes, type(request)
+            )
+        else:
+            response = self._parser.from_bytes(response_bytes, type(request))
 
         # Extract the method response
         method_response: Method[Call, Return] | None = getattr(
@@ -178,7 +218,7 @@ class ConfigClient:
         ):
             raise ClientResponseError("Failed to parse response")
 
-        return method_response.result
+        return method_response.result, size
 
     def close(self) -> None:
         """Close the connection to the ACI service."""
@@ -208,6 +248,41 @@ class ConfigClient:
             return self._connection
 
 
+def create_xml_context() -> XmlContext:
+    """Create the XML context used to serialize and parse ACI messages.
+
+    Element and attribute names default to PascalCase.
+    """
+    return XmlContext(
+        element_name_generator=_pascal_case_preserve,
+        attribute_name_generator=_pascal_case_preserve,
+        models_package="aiovantage._objects",
+    )
+
+
+def create_parser(xml_context: XmlContext) -> XmlParser:
+    """Create a parser for ACI responses, which ignores unknown properties."""
+    return XmlParser(
+        config=ParserConfig(fail_on_unknown_properties=False),
+        context=xml_context,
+        handler=XmlEventHandler,
+    )
+
+
+# Response parsers used by executor threads or processes, one per thread
+_executor_parsers = threading.local()
+
+
+def _parse_response(response: bytes, clazz: type[Interface]) -> Interface:
+    # Parse a response in an executor. This is a module-level function so it can be
+    # sent to process pools, and parsers are per-thread since they aren't thread-safe.
+    parser: XmlParser | None = getattr(_executor_parsers, "parser", None)
+    if parser is None:
+        parser = _executor_parsers.parser = create_parser(create_xml_context())
+
+    return parser.from_bytes(response, clazz)
+
+
 def _pascal_case_preserve(name: str) -> str:
     # Convert a field/class name to PascalCase, preserving existing PascalCase names.
     # This is helpful for class names like IConfiguration, etc. which get clobbered by
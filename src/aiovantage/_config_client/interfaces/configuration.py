@@ -9,6 +9,14 @@ from ..client import ConfigClient
 
 T = TypeVar("T")
 
+# Bounds for adaptively sized pages of filter results
+DEFAULT_PAGE_SIZE = 50
+MIN_PAGE_SIZE = 10
+MAX_PAGE_SIZE = 1000
+
+# The default size of filter result responses to aim for, in bytes
+DEFAULT_TARGET_PAGE_BYTES = 256 * 1024
+
 
 @dataclass
 class WrappedObject:
@@ -112,7 +120,9 @@ class ConfigurationInterface:
             A list of Vantage objects
         """
         return await client.rpc(
-            IConfiguration, GetFilterResults, GetFilterResults.Params(h_filter)
+            IConfiguration,
+            GetFilterResults,
+            GetFilterResults.Params(h_filter, count, whole_object),
         )
 
     @staticmethod
@@ -145,13 +155,22 @@ class ConfigurationInterface:
     @overload
     @staticmethod
     def get_objects(
-        client: ConfigClient, *types: str, xpath: str | None = None, as_type: type[T]
+        client: ConfigClient,
+        *types: str,
+        xpath: str | None = None,
+        as_type: type[T],
+        page_size: int | None = None,
+        target_page_bytes: int = DEFAULT_TARGET_PAGE_BYTES,
     ) -> AsyncIterator[T]: ...
 
     @overload
     @staticmethod
     def get_objects(
-        client: ConfigClient, *types: str, xpath: str | None = None
+        client: ConfigClient,
+        *types: str,
+        xpath: str | None = None,
+        page_size: int | None = None,
+        target_page_bytes: int = DEFAULT_TARGET_PAGE_BYTES,
     ) -> AsyncIterator[Any]: ...
 
     @staticmethod
@@ -160,17 +179,27 @@ class ConfigurationInterface:
         *types: str,
         xpath: str | None = None,
         as_type: type[T] | None = None,
+        page_size: int | None = None,
+        target_page_bytes: int = DEFAULT_TARGET_PAGE_BYTES,
     ) -> AsyncIterator[T | Any]:
         """Get Vantage objects, optionally filtered by a type and/or an XPath.
 
         This is a convenience function that wraps the open_filter, get_filter_results
         and close_filter methods.
 
+        Unless a page size is given, results are fetched in pages sized adaptively,
+        based on the average size of the objects in the previous page, so that each
+        response is close to the target size.
+
         Args:
             client: A config client instance
             *types: The type names of the objects to fetch, eg. "Area", "Load", "Keypad"
             xpath: An optional xpath to filter the results by, eg. "/Load", "/*[@VID='12']"
             as_type: The type to verify the objects as
+            page_size: The number of objects to fetch per request, or None to size
+                pages adaptively
+            target_page_bytes: The size of each response to aim for, in bytes, when
+                sizing pages adaptively
 
         Yields:
             A stream of Vantage objects
@@ -179,13 +208,27 @@ class ConfigurationInterface:
         handle = await ConfigurationInterface.open_filter(client, *types, xpath=xpath)
 
         try:
-            # Fetch the results
-            while objects := await ConfigurationInterface.get_filter_results(
-                client, handle
-            ):
+            # Fetch the results, one page at a time
+            count = page_size or DEFAULT_PAGE_SIZE
+            while True:
+                objects, size = await client.rpc_with_size(
+                    IConfiguration,
+                    GetFilterResults,
+                    GetFilterResults.Params(handle, count),
+                )
+                if not objects:
+                    break
+
                 for obj in objects:
                     if as_type is None or isinstance(obj.obj, as_type):
                         yield obj.obj
+
+                # Size the next page based on the average size of these objects
+                if page_size is None:
+                    count = min(
+                        max(target_page_bytes * len(objects) // size, MIN_PAGE_SIZE),
+                        MAX_PAGE_SIZE,
+                    )
         finally:
             # Close the filter
             with suppress(ClientError):
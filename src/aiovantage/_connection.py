@@ -1,11 +1,15 @@
 """Wrapper for an asyncio connection to a Vantage controller."""
 
 import asyncio
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Awaitable, Callable
 from ssl import CERT_NONE, SSLContext, create_default_context
+from typing import TypeVar, cast
 
 from .errors import ClientConnectionError, ClientTimeoutError
 
+T = TypeVar("T")
+
 
 def get_default_context() -> SSLContext:
     """Create a default SSL context."""
@@ -17,8 +21,208 @@ def get_default_context() -> SSLContext:
     return ctx
 
 
+class FramingProtocol(asyncio.BufferedProtocol):
+    """Protocol which receives data into a reusable buffer, and splits it into frames.
+
+    Received data is appended to a single buffer, which is split on a separator when
+    frames are read. Reading lines returns every complete line received so far, so a
+    single receive containing many lines is decoded and split in one go.
+
+    Args:
+        limit: The buffer size, reading is paused when this much data is unread,
+            unless it doesn't yet contain a complete frame.
+    """
+
+    def __init__(self, limit: int) -> None:
+        """Initialize the protocol."""
+        self._limit = limit
+        self._receive_buffer = memoryview(bytearray(min(limit, 2**16)))
+        self._data = bytearray()
+        self._scan_separator = b""
+        self._scan_offset = 0
+        self._transport: asyncio.Transport | None = None
+        self._data_waiter: asyncio.Future[None] | None = None
+        self._drain_waiters: deque[asyncio.Future[None]] = deque()
+        self._reading_paused = False
+        self._writing_paused = False
+        self._closed = False
+        self._exc: Exception | None = None
+
+    @property
+    def closed(self) -> bool:
+        """Return whether the connection is closed, or closing."""
+        return self._closed or self._transport is None or self._transport.is_closing()
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Store the transport when the connection is made."""
+        self._transport = cast(asyncio.Transport, transport)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        """Wake any waiters when the connection is lost."""
+        self._closed = True
+        self._exc = exc
+        self._wake_data_waiter()
+
+        # Wake any writers waiting for the buffer to drain
+        self._wake_drain_waiters(ClientConnectionError("Connection lost."))
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        """Return the buffer to receive data into."""
+        return self._receive_buffer
+
+    def buffer_updated(self, nbytes: int) -> None:
+        """Append newly received data to the unread data."""
+        self._data += self._receive_buffer[:nbytes]
+
+        # Apply backpressure if the reader is falling behind
+        reader_behind = len(self._data) > 2 * self._limit
+        if reader_behind and not self._reading_paused and self._transport is not None:
+            self._transport.pause_reading()
+            self._reading_paused = True
+
+        self._wake_data_waiter()
+
+    def eof_received(self) -> bool:
+        """Close the connection when the remote end closes it."""
+        self._closed = True
+        self._wake_data_waiter()
+        return False
+
+    def pause_writing(self) -> None:
+        """Pause writing when the transport buffer is full."""
+        self._writing_paused = True
+
+    def resume_writing(self) -> None:
+        """Resume writing when the transport buffer has drained."""
+        self._writing_paused = False
+        self._wake_drain_waiters()
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._closed = True
+        if self._transport is not None:
+            self._transport.close()
+
+    async def write(self, data: bytes) -> None:
+        """Write data, waiting for the transport buffer to drain if it is full."""
+        if self.closed or self._transport is None:
+            raise ClientConnectionError("Client not connected.")
+
+        self._transport.write(data)
+        if self._writing_paused:
+            waiter = asyncio.get_running_loop().create_future()
+            self._drain_waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                self._drain_waiters.remove(waiter)
+
+    def read_frame(self, separator: bytes) -> bytes | None:
+        """Read a frame, up to and including the separator, if one has been received.
+
+        Args:
+            separator: The separator which ends a frame.
+
+        Returns:
+            The frame, or None if a complete frame hasn't been received yet.
+        """
+        end = self._find(separator)
+        if end < 0:
+            return None
+
+        end += len(separator)
+        frame = bytes(self._data[:end])
+        self._consume(end)
+
+        return frame
+
+    def read_lines(self) -> list[str] | None:
+        """Read all complete lines received so far.
+
+        Returns:
+            The lines, without line terminators, or None if no complete lines have
+            been received yet.
+        """
+        if self._find(b"\r\n") < 0:
+            return None
+
+        end = self._data.rfind(b"\r\n")
+        with memoryview(self._data) as view:
+            text = str(view[:end], "utf-8")
+        self._consume(end + 2)
+
+        return text.split("\r\n")
+
+    async def wait_for_data(self) -> None:
+        """Wait until more data is received, or raise if the connection is closed."""
+        if self._closed:
+            raise ClientConnectionError("Connection closed.") from self._exc
+
+        self._data_waiter = asyncio.get_running_loop().create_future()
+        try:
+            await self._data_waiter
+        finally:
+            self._data_waiter = None
+
+    def _wake_data_waiter(self) -> None:
+        if self._data_waiter is not None and not self._data_waiter.done():
+            self._data_waiter.set_result(None)
+
+    def _wake_drain_waiters(self, exc: Exception | None = None) -> None:
+        for waiter in self._drain_waiters:
+            if waiter.done():
+                continue
+
+            if exc is None:
+                waiter.set_result(None)
+            else:
+                waiter.set_exception(exc)
+
+    def _find(self, separator: bytes) -> int:
+        # Find the first separator, only searching data which hasn't been searched
+        # already, allowing for a separator split across receives
+        if separator != self._scan_separator:
+            self._scan_separator = separator
+            self._scan_offset = 0
+
+        end = self._data.find(separator, self._scan_offset)
+        if end < 0:
+            self._scan_offset = max(len(self._data) - len(separator) + 1, 0)
+
+            # Keep reading, even past the limit, since the frame can't be read
+            # until it is complete
+            self._resume_reading()
+
+        return end
+
+    def _consume(self, end: int) -> None:
+        # Discard data which has been read, and resume reading if we've caught up
+        del self._data[:end]
+        self._scan_offset = 0
+        if len(self._data) <= self._limit:
+            self._resume_reading()
+
+    def _resume_reading(self) -> None:
+        if self._reading_paused:
+            if self._transport is not None:
+                self._transport.resume_reading()
+            self._reading_paused = False
+
+
 class BaseConnection:
-    """Wrapper for an asyncio connection to a Vantage controller."""
+    """Wrapper for an asyncio connection to a Vantage controller.
+
+    By default, data is read using an asyncio stream. Optionally, a buffered protocol
+    can be used instead, which avoids per-line overhead when reading many lines.
+
+    Args:
+        host: The hostname or IP address of the Vantage controller.
+        port: The port to connect to.
+        ssl: The SSL context to use. True will use a default context, False will disable SSL.
+        ssl_context_factory: A factory function to use when creating default SSL contexts.
+        conn_timeout: The connection timeout in seconds.
+        buffered: Whether to read data with a buffered protocol, rather than a stream.
+    """
 
     default_port: int
     default_ssl_port: int
@@ -32,12 +236,15 @@ class BaseConnection:
         ssl: SSLContext | bool = True,
         ssl_context_factory: Callable[[], SSLContext] | None = None,
         conn_timeout: float | None = None,
+        buffered: bool = False,
     ) -> None:
         """Initialize the connection."""
         self._host = host
         self._conn_timeout = conn_timeout
+        self._buffered = buffered
         self._reader: asyncio.StreamReader | None = None
         self._writer: asyncio.StreamWriter | None = None
+        self._protocol: FramingProtocol | None = None
 
         # Set up the SSL context
         if isinstance(ssl, SSLContext):
@@ -57,20 +264,32 @@ class BaseConnection:
     async def open(self) -> None:
         """Open the connection."""
         # If we're already connected, do nothing
-        if self._writer is not None and not self._writer.is_closing():
+        if not self.closed:
             return
 
         # Create the connection
         try:
-            self._reader, self._writer = await asyncio.wait_for(
-                asyncio.open_connection(
-                    self._host,
-                    self._port,
-                    ssl=self._ssl_context,
-                    limit=self.buffer_limit,
-                ),
-                timeout=self._conn_timeout,
-            )
+            if self._buffered:
+                loop = asyncio.get_running_loop()
+                _, self._protocol = await asyncio.wait_for(
+                    loop.create_connection(
+                        lambda: FramingProtocol(self.buffer_limit),
+                        self._host,
+                        self._port,
+                        ssl=self._ssl_context,
+                    ),
+                    timeout=self._conn_timeout,
+                )
+            else:
+                self._reader, self._writer = await asyncio.wait_for(
+                    asyncio.open_connection(
+                        self._host,
+                        self._port,
+                        ssl=self._ssl_context,
+                        limit=self.buffer_limit,
+                    ),
+                    timeout=self._conn_timeout,
+                )
         except asyncio.TimeoutError as exc:
             raise ClientTimeoutError(
                 f"Timeout connecting to {self._host}:{self._port}"
@@ -82,6 +301,10 @@ class BaseConnection:
 
     def close(self) -> None:
         """Close the connection."""
+        if self._protocol is not None:
+            self._protocol.close()
+            self._protocol = None
+
         if self._writer is not None and not self._writer.is_closing():
             self._writer.close()
             self._writer = None
@@ -99,6 +322,9 @@ class BaseConnection:
     @property
     def closed(self) -> bool:
         """Return whether the connection is closed."""
+        if self._buffered:
+            return self._protocol is None or self._protocol.closed
+
         return self._writer is None or self._writer.is_closing()
 
     async def write(self, message: str) -> None:
@@ -107,6 +333,11 @@ class BaseConnection:
         Args:
             message: The message to send, as a string.
         """
+        # Send the request using the buffered protocol
+        if self._protocol is not None:
+            await self._protocol.write(message.encode())
+            return
+
         # Make sure we're connected
         if self._writer is None or self._writer.is_closing():
             raise ClientConnectionError("Client not connected.")
@@ -128,16 +359,66 @@ class BaseConnection:
         Returns:
             The data read, as a string.
         """
+        data = await self.readuntil_bytes(separator, timeout)
+        return data.decode()
+
+    async def readuntil_bytes(
+        self, separator: bytes, timeout: float | None = None
+    ) -> bytes:
+        """Read raw data until the separator is found or the optional timeout is reached.
+
+        Args:
+            separator: The separator to read until.
+            timeout: The optional timeout in seconds.
+
+        Returns:
+            The data read, including the separator.
+        """
+        # Read the response using the buffered protocol
+        if self._protocol is not None:
+            protocol = self._protocol
+            while (frame := protocol.read_frame(separator)) is None:
+                await self._wait(protocol.wait_for_data(), timeout)
+
+            return frame
+
         # Make sure we're connected
         if self._reader is None or self.closed:
             raise ClientConnectionError("Client not connected.")
 
         # Read the response, with optional timeout
+        return await self._wait(self._reader.readuntil(separator), timeout)
+
+    async def readlines(self, timeout: float | None = None) -> list[str]:
+        """Read one or more complete lines, or until the optional timeout is reached.
+
+        When reading with a buffered protocol, all complete lines received so far are
+        returned at once. Otherwise, a single line is returned.
+
+        Args:
+            timeout: The optional timeout in seconds.
+
+        Returns:
+            The lines read, without line terminators.
+        """
+        # Read every complete line using the buffered protocol
+        if self._protocol is not None:
+            protocol = self._protocol
+            while (lines := protocol.read_lines()) is None:
+                await self._wait(protocol.wait_for_data(), timeout)
+
+            return lines
+
+        # Read a single line
+        line = await self.readuntil(b"\r\n", timeout)
+        return [line.removesuffix("\r\n")]
+
+    @staticmethod
+    async def _wait(aw: Awaitable[T], timeout: float | None) -> T:
+        # Wait for a read, translating errors into client errors
         try:
-            data = await asyncio.wait_for(self._reader.readuntil(separator), timeout)
+            return await asyncio.wait_for(aw, timeout)
         except asyncio.TimeoutError as err:
             raise ClientTimeoutError from err
         except (OSError, asyncio.IncompleteReadError) as err:
             raise ClientConnectionError from err
-
-        return data.decode()
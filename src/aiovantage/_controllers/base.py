@@ -1,14 +1,17 @@
 import asyncio
-from collections.abc import Callable
-from dataclasses import fields
+import datetime as dt
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, fields
 from enum import Enum
+from types import TracebackType
 from typing import TYPE_CHECKING, TypeVar, cast
 
+from aiovantage._config_cache import ConfigVersion
 from aiovantage._logger import logger
-from aiovantage.command_client import Converter
+from aiovantage.command_client import CommandPriority, command_priority
 from aiovantage.config_client import ConfigurationInterface
 from aiovantage.events import (
-    EnhancedLogReceived,
     EventDispatcher,
     ObjectAdded,
     ObjectDeleted,
@@ -36,6 +39,44 @@ class StatusType(Enum):
     """Category status events, eg: S:LOAD, S:BLIND, etc."""
 
 
+@dataclass
+class FetchStateStats:
+    """Statistics from fetching the state of objects."""
+
+    objects: int = 0
+    """The number of objects fetched."""
+
+    fetches: int = 0
+    """The number of property fetches made.
+
+    Some properties, like the colors of RGB loads, are fetched with several requests.
+    """
+
+    duration: float = 0.0
+    """The total time taken, in seconds."""
+
+
+class _FetchLimiter:
+    # Bounds concurrent property fetches using a semaphore which may be shared with
+    # other fetches, while counting the fetches made through this limiter.
+
+    def __init__(self, semaphore: asyncio.Semaphore) -> None:
+        self._semaphore = semaphore
+        self.fetches = 0
+
+    async def __aenter__(self) -> None:
+        await self._semaphore.acquire()
+        self.fetches += 1
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._semaphore.release()
+
+
 class Controller(QuerySet[T], EventDispatcher):
     """Base controller for managing collections of Vantage objects."""
 
@@ -45,6 +86,14 @@ class Controller(QuerySet[T], EventDispatcher):
     force_category_status: bool = False
     """Whether to force the controller to handle 'STATUS' categories."""
 
+    update_coalesce_window: float | None = None
+    """Optional window, in seconds, to coalesce ObjectUpdated events over.
+
+    When set, the changed attributes of each object are merged over the window, and a
+    single ObjectUpdated event is emitted per object at the end of the window. A window
+    of 0 coalesces updates within a single iteration of the event loop.
+    """
+
     def __init__(self, vantage: "Vantage") -> None:
         """Initialize a controller.
 
@@ -57,6 +106,11 @@ class Controller(QuerySet[T], EventDispatcher):
         self._status_type: StatusType | None = None
         self._status_unsubs: list[Callable[[], None]] = []
         self._lock = asyncio.Lock()
+        self._pending_updates: dict[int, tuple[T, dict[str, None]]] = {}
+        self._flush_handle: asyncio.Handle | None = None
+        self._modified_since: dt.datetime | None = None
+        self._sync_version: ConfigVersion | None = None
+        self._reconnect_task: asyncio.Task[FetchStateStats] | None = None
 
         QuerySet[T].__init__(self, self._objects, self._lazy_initialize)
         EventDispatcher.__init__(self)
@@ -69,91 +123,166 @@ class Controller(QuerySet[T], EventDispatcher):
         """Return True if the object with the given Vantage ID exists."""
         return vid in self._objects
 
+    @property
+    def initialized(self) -> bool:
+        """Whether the controller has been populated."""
+        return self._initialized
+
     @property
     def status_type(self) -> StatusType | None:
         """Return the type of status event that the controller is monitoring."""
         return self._status_type
 
     async def initialize(
-        self, *, fetch_state: bool = True, enable_state_monitoring: bool = True
+        self,
+        *,
+        fetch_state: bool = True,
+        enable_state_monitoring: bool = True,
+        page_size: int | None = None,
+        objects: Iterable[SystemObject] | None = None,
+        config_version: ConfigVersion | None = None,
+        incremental: bool = False,
     ) -> None:
         """Populate the controller, and optionally fetch object state.
 
+        When refreshing incrementally, only objects modified since the controller was
+        last populated are fetched, based on the modification time of each object.
+        Objects are only checked for deletion, by fetching all objects, when the
+        controller reports that objects have been deleted since the last refresh.
+        The first incremental refresh after populating the controller without a
+        configuration version fetches all objects, as do controllers running firmware
+        which doesn't report modification times.
+
         Args:
             fetch_state: Whether to fetch the state properties of objects.
             enable_state_monitoring: Whether to monitor for state changes on objects.
+            page_size: The number of objects to fetch per configuration request, or
+                None to size pages adaptively.
+            objects: Optionally, the objects to populate the controller with, rather
+                than fetching them, eg. from a system-wide configuration load.
+            config_version: Optionally, the configuration version fetched before the
+                objects were loaded, rather than fetching it when refreshing
+                incrementally.
+            incremental: Whether to only fetch objects modified since the controller
+                was last populated, when possible.
         """
         # Prevent concurrent controller initialization from multiple tasks, since we
         # are batch-modifying the _items dict.
         async with self._lock:
             prev_ids = set(self._objects.keys())
             cur_ids: set[int] = set()
-
-            # Fetch all objects managed by this controller
-            async for obj in ConfigurationInterface.get_objects(
-                self._vantage.config_client, *self.vantage_types, as_type=SystemObject
-            ):
+            added: list[T] = []
+            config_changed = False
+
+            # Check whether an incremental refresh is possible, by comparing the
+            # configuration version with the version at the last refresh
+            version = config_version
+            if version is None and incremental:
+                version = await self._vantage.fetch_config_version()
+            delta = objects is None and self._can_refresh_incrementally(version)
+
+            if delta:
+                # Fetch only objects modified since the last refresh, if any
+                objects = []
+                if version != self._sync_version:
+                    objects = await self._fetch_objects(page_size, self._modified_since)
+            elif objects is None:
+                # Fetch all objects managed by this controller
+                objects = await self._fetch_objects(page_size)
+
+            for obj in objects:
                 obj = cast(T, obj)
+                if obj.vid not in self._objects:
+                    added.append(obj)
+                    config_changed = True
 
-                if obj.vid in prev_ids:
-                    # This is an existing object.
-                    existing_obj = self._objects[obj.vid]
-
-                    # Check if any attributes have changed and update them
-                    attrs_changed: list[str] = []
-                    for f in fields(type(obj)):
-                        if hasattr(existing_obj, f.name):
-                            new_value = getattr(obj, f.name)
-                            if getattr(existing_obj, f.name) != new_value:
-                                setattr(existing_obj, f.name, new_value)
-                                attrs_changed.append(f.name)
-
-                    # Notify subscribers if any attributes changed
-                    if attrs_changed:
-                        self.emit(ObjectUpdated(existing_obj, attrs_changed))
-                else:
-                    # This is a new object.
-
-                    # Attach the command client to the object
-                    obj.command_client = self._vantage.command_client
-
-                    # Add it to the controller and notify subscribers
-                    self._objects[obj.vid] = obj
-                    self.emit(ObjectAdded(obj))
-
-                # Keep track of which objects we've seen
+                config_changed |= self._merge_object(obj)
                 cur_ids.add(obj.vid)
 
             # Handle objects that were removed
-            for vid in prev_ids - cur_ids:
-                obj = self._objects.pop(vid)
-                self.emit(ObjectDeleted(obj))
+            if not delta:
+                for vid in prev_ids - cur_ids:
+                    config_changed = True
+                    obj = self._objects.pop(vid)
+                    self._pending_updates.pop(vid, None)
+                    self.emit(ObjectDeleted(obj))
+
+            # Cached responses may be stale if the configuration has changed
+            if config_changed:
+                self._vantage.command_client.response_cache.clear()
+
+            if version is not None:
+                self._sync_version = version
 
         logger.info(
-            "%s populated (%d objects)", type(self).__name__, len(self._objects)
+            "%s %s (%d objects)",
+            type(self).__name__,
+            "refreshed" if delta else "populated",
+            len(cur_ids) if delta else len(self._objects),
         )
 
         # Mark the controller as initialized
         if not self._initialized:
             self._initialized = True
 
-        # Fetch state and subscribe to state changes if requested
+        # Fetch state and subscribe to state changes if requested. When refreshing
+        # incrementally, only the state of new objects is fetched.
         if self._objects:
-            if fetch_state:
-                await self.fetch_state()
+            if fetch_state and (added or not delta):
+                await self._fetch_state(
+                    added if delta else list(self._objects.values())
+                )
 
             if enable_state_monitoring:
                 await self.enable_state_monitoring()
 
-    async def fetch_state(self) -> None:
-        """Fetch the state properties of all objects managed by this controller."""
-        for obj in self._objects.values():
+    async def fetch_state(self) -> FetchStateStats:
+        """Fetch the state properties of all objects managed by this controller.
+
+        Objects, and their properties, are fetched concurrently. The number of
+        concurrent requests is bounded by the limit shared by all controllers, see
+        [`Vantage.fetch_semaphore`][aiovantage.Vantage.fetch_semaphore].
+
+        Requests are sent with background priority, so that they don't delay other
+        commands, such as user-initiated control of objects.
+
+        Returns:
+            Statistics about the objects fetched.
+        """
+        return await self._fetch_state(list(self._objects.values()))
+
+    async def _fetch_state(self, objects: list[T]) -> FetchStateStats:
+        # Fetch the state properties of the given objects
+        start = time.monotonic()
+        limiter = _FetchLimiter(self._vantage.fetch_semaphore)
+
+        async def fetch(obj: T) -> None:
             # Fetch state, and notify subscribers if any attributes changed
-            attrs_changed = await obj.fetch_state()
+            attrs_changed = await obj.fetch_state(limiter)
             if attrs_changed:
-                self.emit(ObjectUpdated(obj, attrs_changed))
+                self._emit_updated(obj, attrs_changed)
 
-        logger.info("%s fetched state", type(self).__name__)
+        # Wait for every fetch to finish before raising the first error, so none are
+        # left running in the background
+        with command_priority(CommandPriority.BACKGROUND):
+            results = await asyncio.gather(
+                *(fetch(obj) for obj in objects), return_exceptions=True
+            )
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        stats = FetchStateStats(len(objects), limiter.fetches, time.monotonic() - start)
+        logger.info(
+            "%s fetched state of %d objects (%d fetches) in %.2fs",
+            type(self).__name__,
+            stats.objects,
+            stats.fetches,
+            stats.duration,
+        )
+
+        return stats
 
     async def enable_state_monitoring(self) -> None:
         """Monitor for state changes on objects managed by this controller."""
@@ -169,10 +298,9 @@ class Controller(QuerySet[T], EventDispatcher):
         # controller explicitly requesting category statuses, we'll fall back to
         # "category" status events.
         if event_conn.supports_enhanced_log and not self.force_category_status:
-            # Subscribe to "object status" events from the Enhanced Log.
-            status_unsub = self._vantage.event_stream.subscribe_enhanced_log(
-                self._handle_enhanced_log_event, "STATUS", "STATUSEX"
-            )
+            # Subscribe to "object status" events from the Enhanced Log, which are
+            # routed to the controller managing each object.
+            status_unsub = self._vantage.route_object_status(self)
 
             self._status_type = StatusType.OBJECT
         else:
@@ -203,10 +331,133 @@ class Controller(QuerySet[T], EventDispatcher):
             unsub = self._status_unsubs.pop()
             unsub()
 
+        # Stop fetching state after a reconnect
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+
         self._status_type = None
 
         logger.info("%s unsubscribed from state changes", type(self).__name__)
 
+    def handle_object_status(
+        self, vid: int, method: str, result: str, *args: str
+    ) -> None:
+        """Handle an "object interface" status event for an object.
+
+        Args:
+            vid: The Vantage ID of the object.
+            method: The method that was invoked.
+            result: The result of the method.
+            args: The arguments of the method.
+        """
+        # Look up the object that this event is for
+        obj = self._objects.get(vid)
+        if obj is None:
+            return
+
+        # Handle the event, and notify subscribers if any attributes changed
+        attrs_changed = obj.handle_object_status(method, result, *args)
+        if attrs_changed:
+            self._emit_updated(obj, attrs_changed)
+
+    def _can_refresh_incrementally(self, version: ConfigVersion | None) -> bool:
+        # Objects modified since the last refresh can be fetched alone if no objects
+        # have been deleted or cleared since, and we know the latest modification
+        # time of our objects, unless nothing has been modified at all
+        return (
+            self._initialized
+            and version is not None
+            and self._sync_version is not None
+            and version.last_delete_time == self._sync_version.last_delete_time
+            and version.last_clear_time == self._sync_version.last_clear_time
+            and (version == self._sync_version or self._modified_since is not None)
+        )
+
+    async def _fetch_objects(
+        self, page_size: int | None, modified_since: dt.datetime | None = None
+    ) -> list[SystemObject]:
+        # Fetch the objects managed by this controller, optionally only those
+        # modified since the given time
+        return [
+            obj
+            async for obj in ConfigurationInterface.get_objects(
+                self._vantage.config_client,
+                *self.vantage_types,
+                xpath=None
+                if modified_since is None
+                else _modified_since_xpath(modified_since),
+                as_type=SystemObject,
+                page_size=page_size,
+            )
+        ]
+
+    def _merge_object(self, obj: T) -> bool:
+        # Add a fetched object to the controller, or update the existing object with
+        # the same vid. Returns True if an existing object changed.
+
+        # Keep track of the latest modification time, for incremental refresh
+        if obj.m_time is not None and (
+            self._modified_since is None or obj.m_time > self._modified_since
+        ):
+            self._modified_since = obj.m_time
+
+        existing_obj = self._objects.get(obj.vid)
+        if existing_obj is None:
+            # This is a new object.
+
+            # Attach the command client to the object
+            obj.command_client = self._vantage.command_client
+
+            # Add it to the controller and notify subscribers
+            self._objects[obj.vid] = obj
+            self.emit(ObjectAdded(obj))
+            return False
+
+        # Check if any attributes have changed and update them
+        attrs_changed: list[str] = []
+        for f in fields(type(obj)):
+            if hasattr(existing_obj, f.name):
+                new_value = getattr(obj, f.name)
+                if getattr(existing_obj, f.name) != new_value:
+                    setattr(existing_obj, f.name, new_value)
+                    attrs_changed.append(f.name)
+
+        # Notify subscribers if any attributes changed
+        if not attrs_changed:
+            return False
+
+        self._emit_updated(existing_obj, attrs_changed)
+        return True
+
+    def _emit_updated(self, obj: T, attrs_changed: list[str]) -> None:
+        # Emit an ObjectUpdated event immediately, unless coalescing updates
+        window = self.update_coalesce_window
+        if window is None:
+            self.emit(ObjectUpdated(obj, attrs_changed))
+            return
+
+        # Merge the changed attributes with any pending update for this object
+        pending = self._pending_updates.get(obj.vid)
+        if pending is None:
+            pending = self._pending_updates[obj.vid] = (obj, {})
+        pending[1].update(dict.fromkeys(attrs_changed))
+
+        # Schedule the pending updates to be emitted at the end of the window
+        if self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            if window > 0:
+                self._flush_handle = loop.call_later(window, self._flush_updates)
+            else:
+                self._flush_handle = loop.call_soon(self._flush_updates)
+
+    def _flush_updates(self) -> None:
+        # Emit a single ObjectUpdated event for each object with pending updates
+        self._flush_handle = None
+        pending_updates, self._pending_updates = self._pending_updates, {}
+        for obj, attrs_changed in pending_updates.values():
+            self.emit(ObjectUpdated(obj, list(attrs_changed)))
+
     def _handle_status_event(self, event: StatusReceived) -> None:
         # Look up the object that this event is for
         obj = self._objects.get(event.vid)
@@ -225,29 +476,35 @@ class Controller(QuerySet[T], EventDispatcher):
 
         # Notify subscribers if any attributes changed
         if attrs_changed:
-            self.emit(ObjectUpdated(obj, attrs_changed))
-
-    def _handle_enhanced_log_event(self, event: EnhancedLogReceived) -> None:
-        # Tokenize STATUS/STATUSEX logs from the enhanced log.
-        # These are "object interface" status messages, of the form:
-        # -> EL: <vid> <method> <result> <arg1> <arg2> ...
-        vid_str, method, result, *args = Converter.tokenize(event.log)
-
-        # Pass the event to the controller, if this object is managed by it
-        obj = self._objects.get(int(vid_str))
-        if obj is None:
-            return
-
-        # Handle the event, and notify subscribers if any attributes changed
-        attrs_changed = obj.handle_object_status(method, result, *args)
-        if attrs_changed:
-            self.emit(ObjectUpdated(obj, attrs_changed))
+            self._emit_updated(obj, attrs_changed)
 
     def _handle_reconnect_event(self, event: Reconnected) -> None:
-        # Fetch latest state if we've been disconnected
-        asyncio.create_task(self.fetch_state())
+        # Fetch latest state if we've been disconnected, replacing any earlier fetch
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+
+        self._reconnect_task = asyncio.create_task(self.fetch_state())
+        self._reconnect_task.add_done_callback(self._reconnect_fetch_done)
+
+    def _reconnect_fetch_done(self, task: asyncio.Task[FetchStateStats]) -> None:
+        # Log failures to fetch state after reconnecting, since nothing awaits the task
+        if task is self._reconnect_task:
+            self._reconnect_task = None
+
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            logger.error(
+                "%s failed to fetch state after reconnecting",
+                type(self).__name__,
+                exc_info=exc,
+            )
 
     async def _lazy_initialize(self) -> None:
         # Initialize the controller if it isn't already initialized
         if not self._initialized:
             await self.initialize()
+
+
+def _modified_since_xpath(since: dt.datetime) -> str:
+    # Build an XPath matching objects modified at or after the given time. XPath 1.0
+    # can only compare numbers, so "MTime" is converted to a number like 20240131235959
+    return f"/*[translate(substring(@MTime, 1, 19), '-:T', '') >= {since:%Y%m%d%H%M%S}]"
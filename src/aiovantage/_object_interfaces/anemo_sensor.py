@@ -14,7 +14,7 @@ class AnemoSensorInterface(Interface):
     speed: Decimal | None = None
 
     # Methods
-    @method("GetSpeed", "GetSpeedHW", property="speed")
+    @method("GetSpeed", "GetSpeedHW", property="speed", read=True)
     async def get_speed(self, *, hw: bool = False) -> Decimal:
         """Get the speed of an anemo sensor.
 
@@ -1,8 +1,11 @@
-from collections.abc import Callable
+import asyncio
+from collections.abc import Callable, Sequence
+from contextlib import AbstractAsyncContextManager, nullcontext
 from dataclasses import fields, is_dataclass
 from typing import (
     Any,
     ClassVar,
+    NamedTuple,
     Protocol,
     TypeVar,
     get_type_hints,
@@ -10,20 +13,39 @@ from typing import (
     runtime_checkable,
 )
 
-from aiovantage import logger
-from aiovantage.command_client import CommandClient, Converter
+from aiovantage._command_client.priority import current_priority
+from aiovantage._logger import logger
+from aiovantage.command_client import CommandClient, CommandPriority, Converter
 from aiovantage.errors import CommandError, ConversionError
 
 T = TypeVar("T")
 
+# Sentinel for properties which could not be fetched
+_FETCH_FAILED = object()
+
 
 class _AsyncCallable(Protocol):
     async def __call__(self, *args: Any, **kwargs: Any) -> Any: ...
 
 
+# Decodes the result and arguments of a response or status message
+_Decoder = Callable[[str, Sequence[str]], Any]
+
+
+class _MethodMetadata(NamedTuple):
+    method: str
+    out: str | None
+    property: str | None
+    fetch: bool
+    coalesce: bool
+    cacheable: bool
+    read: bool
+    interactive: bool
+
+
 @runtime_checkable
 class _MethodCallable(Protocol):
-    method_metadata: list[tuple[str, str | None, str | None, bool]]
+    method_metadata: list[_MethodMetadata]
 
     async def __call__(self, *args: Any, **kwargs: Any) -> Any: ...
 
@@ -33,6 +55,10 @@ def method(
     out: str | None = None,
     property: str | None = None,
     fetch: bool = True,
+    coalesce: bool = False,
+    cacheable: bool = False,
+    read: bool = False,
+    interactive: bool = False,
 ) -> Callable[[T], T]:
     """Decorator to annotate a function as a Vantage method.
 
@@ -49,16 +75,33 @@ def method(
         out: Optional source of the return value, either "return" or "argN".
         property: Optional property name to associate with the function.
         fetch: Whether to fetch the property when fetching state.
+        coalesce: Whether rapid calls may be coalesced, only sending the latest call.
+            Only suitable for setters where a later call supersedes earlier calls.
+        cacheable: Whether responses may be cached. Only suitable for getters of
+            values which rarely change, such as the type or model of an object.
+        read: Whether the method only reads values, without side effects, so
+            concurrent identical calls may share a single request.
+        interactive: Whether the method controls an object, so calls are sent ahead
+            of background commands. Methods which may be coalesced are interactive.
     """
 
     def decorator(func: T) -> T:
         # Attach metadata to the function
-        metadata: list[tuple[str, str | None, str | None, bool]] = getattr(
-            func, "method_metadata", []
-        )
+        metadata: list[_MethodMetadata] = getattr(func, "method_metadata", [])
 
         for method in methods:
-            metadata.append((method, out, property, fetch))
+            metadata.append(
+                _MethodMetadata(
+                    method,
+                    out,
+                    property,
+                    fetch,
+                    coalesce,
+                    cacheable,
+                    read,
+                    interactive or coalesce,
+                )
+            )
 
         func.method_metadata = metadata  # type: ignore
 
@@ -81,6 +124,11 @@ class _InterfaceMeta(type):
         method_output: dict[str, str] = {}
         method_properties: dict[str, str] = {}
         property_getters: dict[str, _AsyncCallable] = {}
+        method_decoders: dict[str, _Decoder] = {}
+        coalesced_methods: set[str] = set()
+        cacheable_methods: set[str] = set()
+        read_methods: set[str] = set()
+        interactive_methods: set[str] = set()
 
         # Include method metadata from base classes
         for base in bases:
@@ -88,14 +136,28 @@ class _InterfaceMeta(type):
                 method_signatures.update(base._method_signatures)  # type: ignore
                 method_output.update(base._method_output)  # type: ignore
                 method_properties.update(base._method_properties)  # type: ignore
+                method_decoders.update(base._method_decoders)  # type: ignore
                 property_getters.update(base._property_getters)  # type: ignore
+                coalesced_methods.update(base._coalesced_methods)  # type: ignore
+                cacheable_methods.update(base._cacheable_methods)  # type: ignore
+                read_methods.update(base._read_methods)  # type: ignore
+                interactive_methods.update(base._interactive_methods)  # type: ignore
 
         # Collect method metadata from member functions
         for attr in dct.values():
             if not isinstance(attr, _MethodCallable):
                 continue
 
-            for method, output, property, fetch in attr.method_metadata:
+            for (
+                method,
+                output,
+                property,
+                fetch,
+                coalesce,
+                cacheable,
+                read,
+                interactive,
+            ) in attr.method_metadata:
                 # Get the return type of the method
                 type_hints = get_type_hints(attr)
                 if "return" not in type_hints:
@@ -113,6 +175,12 @@ class _InterfaceMeta(type):
                 if output:
                     method_output[fq_method] = output
 
+                # Compile a decoder for the method's return type and output argument
+                # Used for parsing responses and status messages
+                method_decoders[fq_method] = _compile_decoder(
+                    fq_method, type_hints["return"], output or "return"
+                )
+
                 # Save mapping between method name and property name
                 # Used to update properties when receiving status messages
                 if property:
@@ -123,11 +191,36 @@ class _InterfaceMeta(type):
                 if property and fetch:
                     property_getters[property] = attr
 
+                # Save which methods can be coalesced
+                # Used to drop superseded calls when invoking methods
+                if coalesce:
+                    coalesced_methods.add(fq_method)
+
+                # Save which methods can be cached
+                # Used to reuse responses when invoking methods
+                if cacheable:
+                    cacheable_methods.add(fq_method)
+
+                # Save which methods only read values
+                # Used to share in-flight requests when invoking methods
+                if read:
+                    read_methods.add(fq_method)
+
+                # Save which methods control objects
+                # Used to send control commands ahead of background commands
+                if interactive:
+                    interactive_methods.add(fq_method)
+
         # Attach the method metadata to the class
         dct["_method_signatures"] = method_signatures
         dct["_method_output"] = method_output
         dct["_method_properties"] = method_properties
+        dct["_method_decoders"] = method_decoders
         dct["_property_getters"] = property_getters
+        dct["_coalesced_methods"] = coalesced_methods
+        dct["_cacheable_methods"] = cacheable_methods
+        dct["_read_methods"] = read_methods
+        dct["_interactive_methods"] = interactive_methods
 
         return super().__new__(cls, name, bases, dct)
 
@@ -148,7 +241,12 @@ class Interface(metaclass=_InterfaceMeta):
     _method_signatures: dict[str, type[Any]]
     _method_output: dict[str, str]
     _method_properties: dict[str, str]
+    _method_decoders: dict[str, _Decoder]
     _property_getters: dict[str, _AsyncCallable]
+    _coalesced_methods: set[str]
+    _cacheable_methods: set[str]
+    _read_methods: set[str]
+    _interactive_methods: set[str]
 
     @overload
     async def invoke(self, method: str, *params: Any) -> Any: ...
@@ -178,8 +276,24 @@ class Interface(metaclass=_InterfaceMeta):
         if params:
             request += " " + " ".join(Converter.serialize(p) for p in params)
 
-        # Send the request
-        response = await self.command_client.raw_request(request)
+        # Send the request. Responses for rarely changing values may be cached, and
+        # concurrent identical reads share a single request. If enabled, calls to
+        # setters which are superseded by a later call before they are sent are
+        # dropped, since only the latest matters. Calls to methods which control
+        # objects are sent ahead of background commands.
+        priority = _request_priority(method in self._interactive_methods)
+        if method in self._cacheable_methods:
+            response = await self.command_client.raw_request_cached(request)
+        elif method in self._read_methods:
+            response = await self.command_client.raw_request_shared(request)
+        elif self.command_client.coalesce_setters and method in self._coalesced_methods:
+            response = await self.command_client.raw_request_latest(
+                (self.vid, method), request, priority=priority
+            )
+            if response is None:
+                return None
+        else:
+            response = await self.command_client.raw_request(request, priority=priority)
 
         # Break the response into tokens
         return_line = response[-1]
@@ -205,27 +319,53 @@ class Interface(metaclass=_InterfaceMeta):
 
         return changed
 
-    async def fetch_state(self) -> list[str]:
+    async def fetch_state(
+        self, limiter: AbstractAsyncContextManager[Any] | None = None
+    ) -> list[str]:
         """Fetch state properties provided by the interface(s) this object implements.
 
+        Properties are fetched concurrently.
+
+        Args:
+            limiter: An optional context manager held while fetching each property,
+                typically used to bound the number of concurrent requests.
+
         Returns:
             A list of property names that were updated.
         """
-        # Fetch each state property
-        fetched_properties: dict[str, Any] = {}
-        for prop, getter in self._property_getters.items():
-            try:
-                fetched_properties[prop] = await getter(self)
-            except (CommandError, ConversionError) as ex:
-                logger.warning(
-                    "Failed to fetch property %s from %s: %s",
-                    prop,
-                    self.interface_name,
-                    ex,
-                )
-                continue
 
-        return self.update_properties(fetched_properties)
+        async def fetch(prop: str, getter: _AsyncCallable) -> Any:
+            async with limiter or nullcontext():
+                try:
+                    return await getter(self)
+                except (CommandError, ConversionError) as ex:
+                    logger.warning(
+                        "Failed to fetch property %s from %s: %s",
+                        prop,
+                        self.interface_name,
+                        ex,
+                    )
+                    return _FETCH_FAILED
+
+        # Fetch each state property, waiting for every fetch to finish before raising
+        # the first error
+        props = list(self._property_getters)
+        values = await asyncio.gather(
+            *(fetch(prop, self._property_getters[prop]) for prop in props),
+            return_exceptions=True,
+        )
+
+        for value in values:
+            if isinstance(value, BaseException):
+                raise value
+
+        return self.update_properties(
+            {
+                prop: value
+                for prop, value in zip(props, values, strict=True)
+                if value is not _FETCH_FAILED
+            }
+        )
 
     def handle_object_status(self, method: str, result: str, *args: str) -> list[str]:
         """Handle an object interface status message.
@@ -274,49 +414,107 @@ class Interface(metaclass=_InterfaceMeta):
         # -> EL: <id> <method> <result> <arg1> <arg2> ...
         # -> S:STATUS <id> <method> <result> <arg1> <arg2> ...
 
-        # Make sure we have a signature for the method
-        if as_type is None and method not in cls._method_signatures:
-            raise NotImplementedError(f"No signature found for method {method}")
+        # Use the precompiled decoder for the method, unless a type is given
+        if as_type is not None:
+            decoder = _compile_decoder(
+                method, as_type, cls._method_output.get(method, "return")
+            )
+        else:
+            decoder = cls._method_decoders.get(method)
+            if decoder is None:
+                raise NotImplementedError(f"No signature found for method {method}")
+
+        return decoder(result, args)
 
-        # Get the expected return type of the method, return early if None
-        signature = as_type or cls._method_signatures[method]
-        if signature in (None, type(None)):
-            return None
 
-        # Grab either the result or an argument based on "out" metadata field
-        def get_output_value(out: str) -> Any:
-            if out == "return":
-                return result
+def _compile_output_getter(
+    method: str, out: str
+) -> Callable[[str, Sequence[str]], str]:
+    # Compile a function to grab either the result or an argument, based on the
+    # "out" metadata field
+    if out == "return":
 
-            if out.startswith("arg") and out[3:].isdigit():
-                index = int(out[3:])
-                if 0 <= index < len(args):
-                    return args[index]
+        def get_result(result: str, args: Sequence[str]) -> str:
+            return result
+
+        return get_result
+
+    if out.startswith("arg") and out[3:].isdigit():
+        index = int(out[3:])
+
+        def get_arg(result: str, args: Sequence[str]) -> str:
+            if index < len(args):
+                return args[index]
 
             raise ValueError(f"Invalid 'out' metadata when parsing {method}")
 
-        # Parse the response based on the expected return type
-        if is_dataclass(signature):
-            # If the method returns a dataclass, parse the result and/or arguments
-            # into the expected fields of the dataclass, based on the field metadata.
-            type_hints = get_type_hints(signature)
-            props: dict[str, Any] = {}
+        return get_arg
+
+    raise ValueError(f"Invalid 'out' metadata when parsing {method}")
+
 
-            for field in fields(signature):
-                out = field.metadata.get("out")
-                if out is None:
-                    raise ValueError(f"Field {field.name} missing 'out' metadata")
+def _request_priority(interactive: bool) -> CommandPriority:
+    # Commands which control objects are usually user-initiated, so are sent ahead of
+    # other commands, unless a different priority was set for the context
+    priority = current_priority()
+    if interactive and priority == CommandPriority.NORMAL:
+        return CommandPriority.INTERACTIVE
 
-                field_signature = type_hints.get(field.name)
-                if field_signature is None:
-                    raise ValueError(f"Field {field.name} missing type hint")
+    return priority
 
-                props[field.name] = Converter.deserialize(
-                    field_signature, get_output_value(out)
+
+def _compile_decoder(method: str, signature: type[Any] | None, out: str) -> _Decoder:
+    # Compile a function to parse the result and/or arguments of a response, so the
+    # type hints and converters are only looked up once per method.
+
+    # Methods which return None don't need parsing
+    if signature in (None, type(None)):
+
+        def decode_none(result: str, args: Sequence[str]) -> None:
+            return None
+
+        return decode_none
+
+    # If the method returns a dataclass, parse the result and/or arguments into the
+    # expected fields of the dataclass, based on the field metadata.
+    if is_dataclass(signature):
+        type_hints = get_type_hints(signature)
+        field_decoders: list[
+            tuple[str, Callable[[str, Sequence[str]], str], Callable[[str], Any]]
+        ] = []
+
+        for field in fields(signature):
+            field_out = field.metadata.get("out")
+            if field_out is None:
+                raise ValueError(f"Field {field.name} missing 'out' metadata")
+
+            field_signature: type[Any] | None = type_hints.get(field.name)
+            if field_signature is None:
+                raise ValueError(f"Field {field.name} missing type hint")
+
+            field_decoders.append(
+                (
+                    field.name,
+                    _compile_output_getter(method, field_out),
+                    Converter.deserializer(field_signature),
                 )
+            )
 
-            return signature(**props)
-        else:
-            # Otherwise, parse the result into the expected type
-            out = cls._method_output.get(method, "return")
-            return Converter.deserialize(signature, get_output_value(out))
+        def decode_dataclass(result: str, args: Sequence[str]) -> Any:
+            return signature(
+                **{
+                    name: deserialize(get_value(result, args))
+                    for name, get_value, deserialize in field_decoders
+                }
+            )
+
+        return decode_dataclass
+
+    # Otherwise, parse the result into the expected type
+    get_value = _compile_output_getter(method, out)
+    deserialize = Converter.deserializer(signature)
+
+    def decode_value(result: str, args: Sequence[str]) -> Any:
+        return deserialize(get_value(result, args))
+
+    return decode_value
@@ -36,28 +36,28 @@ class BlindInterface(Interface, ShadeOrientation, ShadeType):
     blind_state: BlindState | None = None
 
     # Methods
-    @method("Open")
+    @method("Open", interactive=True)
     async def open(self) -> None:
         """Open a blind."""
         # INVOKE <id> Blind.Open
         # -> R:INVOKE <id> <rcode> Blind.Open
         await self.invoke("Blind.Open")
 
-    @method("Close")
+    @method("Close", interactive=True)
     async def close(self) -> None:
         """Close a blind."""
         # INVOKE <id> Blind.Close
         # -> R:INVOKE <id> <rcode> Blind.Close
         await self.invoke("Blind.Close")
 
-    @method("Stop")
+    @method("Stop", interactive=True)
     async def stop(self) -> None:
         """Stop a blind."""
         # INVOKE <id> Blind.Stop
         # -> R:INVOKE <id> <rcode> Blind.Stop
         await self.invoke("Blind.Stop")
 
-    @method("SetPosition", "SetPositionSW")
+    @method("SetPosition", "SetPositionSW", coalesce=True)
     async def set_position(self, position: float, *, sw: bool = False) -> None:
         """Set the position of a blind.
 
@@ -71,7 +71,7 @@ class BlindInterface(Interface, ShadeOrientation, ShadeType):
             "Blind.SetPositionSW" if sw else "Blind.SetPosition", position
         )
 
-    @method("GetPosition", "GetPositionHW", property="position")
+    @method("GetPosition", "GetPositionHW", property="position", read=True)
     async def get_position(self, *, hw: bool = False) -> Decimal:
         """Get the position of a blind.
 
@@ -85,7 +85,7 @@ class BlindInterface(Interface, ShadeOrientation, ShadeType):
         # -> R:INVOKE <id> <position (0-100.000)> Blind.GetPosition
         return await self.invoke("Blind.GetPositionHW" if hw else "Blind.GetPosition")
 
-    @method("SetTiltAngle", "SetTiltAngleSW")
+    @method("SetTiltAngle", "SetTiltAngleSW", coalesce=True)
     async def set_tilt_angle(self, angle: int, *, sw: bool = False) -> None:
         """Set the tilt angle of a blind.
 
@@ -97,7 +97,7 @@ class BlindInterface(Interface, ShadeOrientation, ShadeType):
         # -> R:INVOKE <id> <rcode> Blind.SetTiltAngle <angle>
         await self.invoke("Blind.SetTiltAngleSW" if sw else "Blind.SetTiltAngle", angle)
 
-    @method("GetTiltAngle", "GetTiltAngleHW", property="tilt_angle")
+    @method("GetTiltAngle", "GetTiltAngleHW", property="tilt_angle", read=True)
     async def get_tilt_angle(self, *, hw: bool = False) -> int:
         """Get the tilt angle of a blind.
 
@@ -111,7 +111,7 @@ class BlindInterface(Interface, ShadeOrientation, ShadeType):
         # -> R:INVOKE <id> <angle (-100-100)> Blind.GetTiltAngle
         return await self.invoke("Blind.GetTiltAngleHW" if hw else "Blind.GetTiltAngle")
 
-    @method("TiltClockwise")
+    @method("TiltClockwise", interactive=True)
     async def tilt_clockwise(self, angle: int) -> None:
         """Tilt the blinds clockwise by the specified angle.
 
@@ -122,7 +122,7 @@ class BlindInterface(Interface, ShadeOrientation, ShadeType):
         # -> R:INVOKE <id> <rcode> Blind.TiltClockwise <angle>
         await self.invoke("Blind.TiltClockwise", angle)
 
-    @method("TiltCounterClockwise")
+    @method("TiltCounterClockwise", interactive=True)
     async def tilt_counter_clockwise(self, angle: int) -> None:
         """Tilt the shades counter-clockwise by the specified angle.
 
@@ -133,7 +133,7 @@ class BlindInterface(Interface, ShadeOrientation, ShadeType):
         # -> R:INVOKE <id> <rcode> Blind.TiltCounterClockwise <angle>
         await self.invoke("Blind.TiltCounterClockwise", angle)
 
-    @method("IsTiltAvailable", property="tilt_available")
+    @method("IsTiltAvailable", property="tilt_available", read=True)
     async def is_tilt_available(self) -> bool:
         """Check if the blind can tilt in its current state.
 
@@ -155,7 +155,7 @@ class BlindInterface(Interface, ShadeOrientation, ShadeType):
         # -> R:INVOKE <id> <rcode> Blind.SetTiltAvailableSW <available>
         await self.invoke("Blind.SetTiltAvailableSW", available)
 
-    @method("GetBlindState", property="blind_state")
+    @method("GetBlindState", property="blind_state", read=True)
     async def get_blind_state(self) -> BlindState:
         """Get the state of a blind.
 
@@ -180,7 +180,7 @@ class BlindInterface(Interface, ShadeOrientation, ShadeType):
             "Blind.SetUpperLimitSW" if sw else "Blind.SetUpperLimit", limit
         )
 
-    @method("GetUpperLimit", "GetUpperLimitHW")
+    @method("GetUpperLimit", "GetUpperLimitHW", read=True)
     async def get_upper_limit(self, *, hw: bool = False) -> Decimal:
         """Get the upper limit of a blind.
 
@@ -210,7 +210,7 @@ class BlindInterface(Interface, ShadeOrientation, ShadeType):
             "Blind.SetLowerLimitSW" if sw else "Blind.SetLowerLimit", limit
         )
 
-    @method("GetLowerLimit", "GetLowerLimitHW")
+    @method("GetLowerLimit", "GetLowerLimitHW", read=True)
     async def get_lower_limit(self, *, hw: bool = False) -> Decimal:
         """Get the lower limit of a blind.
 
@@ -226,7 +226,7 @@ class BlindInterface(Interface, ShadeOrientation, ShadeType):
             "Blind.GetLowerLimitHW" if hw else "Blind.GetLowerLimit"
         )
 
-    @method("GetTravelTimes")
+    @method("GetTravelTimes", read=True)
     async def get_travel_times(self) -> TravelTimes:
         """Get the travel times of a blind.
 
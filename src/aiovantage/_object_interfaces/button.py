@@ -34,7 +34,7 @@ class ButtonInterface(Interface):
     state: State | None = State.Up
 
     # Methods
-    @method("GetState", "GetStateHW", property="state")
+    @method("GetState", "GetStateHW", property="state", read=True)
     async def get_state(self, *, hw: bool = False) -> State:
         """Get the state of a button.
 
@@ -48,7 +48,7 @@ class ButtonInterface(Interface):
         # -> R:INVOKE <id> <state (Up/Down)> Button.GetState
         return await self.invoke("Button.GetStateHW" if hw else "Button.GetState")
 
-    @method("SetState", "SetStateSW")
+    @method("SetState", "SetStateSW", interactive=True)
     async def set_state(self, state: State, *, sw: bool = False) -> None:
         """Set the state of a button.
 
@@ -60,7 +60,7 @@ class ButtonInterface(Interface):
         # -> R:INVOKE <id> <rcode> Button.SetState <state (Up/Down)>
         await self.invoke("Button.SetStateSW" if sw else "Button.SetState", state)
 
-    @method("GetHoldOn", "GetHoldOnHW")
+    @method("GetHoldOn", "GetHoldOnHW", read=True)
     async def get_hold_on(self, *, hw: bool = False) -> Decimal:
         """Get the hold on time of a button.
 
@@ -86,7 +86,7 @@ class ButtonInterface(Interface):
         # -> R:INVOKE <id> <rcode> Button.SetHoldOn <seconds>
         await self.invoke("Button.SetHoldOnSW" if sw else "Button.SetHoldOn", seconds)
 
-    @method("GetPolarity", "GetPolarityHW")
+    @method("GetPolarity", "GetPolarityHW", read=True)
     async def get_polarity(self, *, hw: bool = False) -> Polarity:
         """Get the polarity of a button.
 
@@ -114,7 +114,7 @@ class ButtonInterface(Interface):
             "Button.SetPolaritySW" if sw else "Button.SetPolarity", polarity
         )
 
-    @method("GetSndType", "GetSndTypeHW")
+    @method("GetSndType", "GetSndTypeHW", read=True)
     async def get_snd_type(self, *, hw: bool = False) -> SndType:
         """Get the sound type of a button.
 
@@ -142,7 +142,7 @@ class ButtonInterface(Interface):
             "Button.SetSndTypeSW" if sw else "Button.SetSndType", snd_type
         )
 
-    @method("GetPlacement", "GetPlacementHW")
+    @method("GetPlacement", "GetPlacementHW", read=True)
     async def get_placement(self, *, hw: bool = False) -> int:
         """Get the placement of a button.
 
@@ -26,7 +26,7 @@ class ColorTemperatureInterface(Interface):
     min_value: int | None = None
 
     # Methods
-    @method("Set", "SetSW")
+    @method("Set", "SetSW", coalesce=True)
     async def set_color_temp(
         self, temp: int, transition: int = 0, *, sw: bool = False
     ) -> None:
@@ -43,7 +43,7 @@ class ColorTemperatureInterface(Interface):
             "ColorTemperature.SetSW" if sw else "ColorTemperature.Set", temp, transition
         )
 
-    @method("Get", "GetHW", property="color_temp")
+    @method("Get", "GetHW", property="color_temp", read=True)
     async def get_color_temp(self, *, hw: bool = False) -> int:
         """Get the color temperature of a light.
 
@@ -59,14 +59,14 @@ class ColorTemperatureInterface(Interface):
             "ColorTemperature.GetHW" if hw else "ColorTemperature.Get"
         )
 
-    @method("StopTransition")
+    @method("StopTransition", interactive=True)
     async def stop_transition(self) -> None:
         """Stop any ongoing color temperature transitions."""
         # INVOKE <id> ColorTemperature.StopTransition
         # -> R:INVOKE <id> <rcode> ColorTemperature.StopTransition
         await self.invoke("ColorTemperature.StopTransition")
 
-    @method("Warm")
+    @method("Warm", interactive=True)
     async def warm(self, amount: int, transition_time: float | Decimal) -> None:
         """Decrease the color temperature of a light.
 
@@ -78,7 +78,7 @@ class ColorTemperatureInterface(Interface):
         # -> R:INVOKE <id> <rcode> ColorTemperature.Warm <amount> <transition_time>
         await self.invoke("ColorTemperature.Warm", amount, transition_time)
 
-    @method("Cool")
+    @method("Cool", interactive=True)
     async def cool(self, amount: int, transition_time: float | Decimal) -> None:
         """Increase the color temperature of a light.
 
@@ -90,7 +90,7 @@ class ColorTemperatureInterface(Interface):
         # -> R:INVOKE <id> <rcode> ColorTemperature.Cool <amount> <transition_time>
         await self.invoke("ColorTemperature.Cool", amount, transition_time)
 
-    @method("SetPreset")
+    @method("SetPreset", interactive=True)
     async def set_temperature_preset(
         self, value: Preset, transition_time: float | Decimal
     ) -> None:
@@ -104,7 +104,7 @@ class ColorTemperatureInterface(Interface):
         # -> R:INVOKE <id> <rcode> ColorTemperature.SetPreset <value> <transition_time>
         await self.invoke("ColorTemperature.SetPreset", value, transition_time)
 
-    @method("GetPreset")
+    @method("GetPreset", read=True)
     async def get_temperature_preset(self) -> Preset:
         """Get the color temperature preset of a light.
 
@@ -115,7 +115,9 @@ class ColorTemperatureInterface(Interface):
         # -> R:INVOKE <id> <preset> ColorTemperature.GetPreset
         return await self.invoke("ColorTemperature.GetPreset")
 
-    @method("GetMaxValue", "GetMaxValueHW", property="max_value")
+    @method(
+        "GetMaxValue", "GetMaxValueHW", property="max_value", cacheable=True, read=True
+    )
     async def get_max_value(self, *, hw: bool = False) -> int:
         """Get the maximum color temperature of a light.
 
@@ -142,7 +144,9 @@ class ColorTemperatureInterface(Interface):
         # -> R:INVOKE <id> <rcode> ColorTemperature.SetMaxValueSW <value>
         await self.invoke("ColorTemperature.SetMaxValueSW", value)
 
-    @method("GetMinValue", "GetMinValueHW", property="min_value")
+    @method(
+        "GetMinValue", "GetMinValueHW", property="min_value", cacheable=True, read=True
+    )
     async def get_min_value(self, *, hw: bool = False) -> int:
         """Get the minimum color temperature of a light.
 
@@ -169,7 +173,7 @@ class ColorTemperatureInterface(Interface):
         # -> R:INVOKE <id> <rcode> ColorTemperature.SetMinValueSW <value>
         await self.invoke("ColorTemperature.SetMinValueSW", value)
 
-    @method("GetTransitionTemperature")
+    @method("GetTransitionTemperature", read=True)
     async def get_transition_temperature(self) -> int:
         """Get the current color temperature of a light in transition.
 
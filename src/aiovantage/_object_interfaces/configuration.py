@@ -30,7 +30,7 @@ class ConfigurationInterface(Interface):
         Sunset = 1
 
     # Methods
-    @method("GetControllerVID")
+    @method("GetControllerVID", read=True)
     async def get_controller_vid(self, controller: int) -> int:
         """Get the VID of a controller, based on the controller number.
 
@@ -67,7 +67,7 @@ class ConfigurationInterface(Interface):
         # -> R:INVOKE <id> <rcode> Configuration.CreateObject <type>
         return await self.invoke("Configuration.CreateObject", type)
 
-    @method("GetModificationTime")
+    @method("GetModificationTime", read=True)
     async def get_modification_time(self) -> dt.datetime:
         """Get the modification time of this object.
 
@@ -78,7 +78,7 @@ class ConfigurationInterface(Interface):
         # -> R:INVOKE <id> <mtime> Configuration.GetModificationTime
         return await self.invoke("Configuration.GetModificationTime")
 
-    @method("GetLastDeleteTime")
+    @method("GetLastDeleteTime", read=True)
     async def get_last_delete_time(self, store: Store) -> dt.datetime:
         """Get the time of the last object deletion.
 
@@ -92,7 +92,7 @@ class ConfigurationInterface(Interface):
         # -> R:INVOKE <id> <time> Configuration.GetLastDeleteTime <store>
         return await self.invoke("Configuration.GetLastDeleteTime", store)
 
-    @method("GetLastClearTime")
+    @method("GetLastClearTime", read=True)
     async def get_last_clear_time(self) -> dt.datetime:
         """Get the time of the last clear.
 
@@ -119,7 +119,7 @@ class ConfigurationInterface(Interface):
         # -> R:INVOKE <id> <handle> Configuration.OpenFilter <store> <types> <xpath>
         return await self.invoke("Configuration.OpenFilter", store, types, xpath)
 
-    @method("GetNextObjectVID")
+    @method("GetNextObjectVID", read=True)
     async def get_next_object_vid(self, handle: int) -> int:
         """Get the VID of the next object in a filter.
 
@@ -158,7 +158,7 @@ class ConfigurationInterface(Interface):
         # -> R:INVOKE <id> <found (0/1)> Configuration.FindLocalObject <vid>
         return await self.invoke("Configuration.FindLocalObject", vid)
 
-    @method("GetTimeZone", out="arg0")
+    @method("GetTimeZone", out="arg0", cacheable=True, read=True)
     async def get_time_zone(self) -> str:
         """Get the time zone.
 
@@ -169,7 +169,7 @@ class ConfigurationInterface(Interface):
         # -> R:INVOKE <id> <rcode> Configuration.GetTimeZone <tz> <size>
         return await self.invoke("Configuration.GetTimeZone")
 
-    @method("GetTimeLocation", out="arg0")
+    @method("GetTimeLocation", out="arg0", read=True)
     async def get_time_location(self) -> str:
         """Get the time location.
 
@@ -180,7 +180,7 @@ class ConfigurationInterface(Interface):
         # -> R:INVOKE <id> <rcode> Configuration.GetTimeLocation <loc> <size>
         return await self.invoke("Configuration.GetTimeLocation")
 
-    @method("GetAstronomicalTime")
+    @method("GetAstronomicalTime", read=True)
     async def get_astronomical_time(
         self, event: SolarEvent, year: int, month: int, day: int
     ) -> dt.datetime:
@@ -14,7 +14,7 @@ class CurrentSensorInterface(Interface):
     current: Decimal | None = None
 
     # Methods
-    @method("GetCurrent", "GetCurrentHW", property="current")
+    @method("GetCurrent", "GetCurrentHW", property="current", read=True)
     async def get_current(self, *, hw: bool = False) -> Decimal:
         """Get the value of a current sensor.
 
@@ -22,7 +22,7 @@ class FanInterface(Interface):
     speed: FanSpeed | None = None
 
     # Methods
-    @method("GetSpeed", "GetSpeedHW", property="speed")
+    @method("GetSpeed", "GetSpeedHW", property="speed", read=True)
     async def get_speed(self, *, hw: bool = False) -> FanSpeed:
         """Get the speed of a fan.
 
@@ -36,7 +36,7 @@ class FanInterface(Interface):
         # -> R:INVOKE <id> <speed> Fan.GetSpeed
         return await self.invoke("Fan.GetSpeedHW" if hw else "Fan.GetSpeed")
 
-    @method("SetSpeed", "SetSpeedSW")
+    @method("SetSpeed", "SetSpeedSW", coalesce=True)
     async def set_speed(self, speed: FanSpeed, *, sw: bool = False) -> None:
         """Set the speed of a fan.
 
@@ -48,14 +48,14 @@ class FanInterface(Interface):
         # -> R:INVOKE <id> <rcode> Fan.SetSpeed <speed>
         await self.invoke("Fan.SetSpeedSW" if sw else "Fan.SetSpeed", speed)
 
-    @method("IncreaseSpeed")
+    @method("IncreaseSpeed", interactive=True)
     async def increase_speed(self, vid: int) -> None:
         """Increase the speed of a fan."""
         # INVOKE <id> Fan.IncreaseSpeed
         # -> R:INVOKE <id> <rcode> Fan.IncreaseSpeed
         await self.invoke("Fan.IncreaseSpeed")
 
-    @method("DecreaseSpeed")
+    @method("DecreaseSpeed", interactive=True)
     async def decrease_speed(self) -> None:
         """Decrease the speed of a fan."""
         # INVOKE <id> Fan.DecreaseSpeed
@@ -1,3 +1,4 @@
+from contextlib import AbstractAsyncContextManager, nullcontext
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -86,8 +87,13 @@ class GMemInterface(Interface):
         await self.command_client.command("VARIABLE", self.vid, value)
 
     @override
-    async def fetch_state(self) -> list[str]:
-        return self.update_properties({"value": await self.get_value()})
+    async def fetch_state(
+        self, limiter: AbstractAsyncContextManager[Any] | None = None
+    ) -> list[str]:
+        async with limiter or nullcontext():
+            value = await self.get_value()
+
+        return self.update_properties({"value": value})
 
     @override
     def handle_category_status(self, category: str, *args: str) -> list[str]:
@@ -31,7 +31,7 @@ class IntrospectionInterface(Interface):
         total: int = field(metadata={"out": "arg2"})
 
     # Methods
-    @method("GetAppControllers", out="arg0")
+    @method("GetAppControllers", out="arg0", read=True)
     async def get_app_controllers(self) -> str:
         """Get a list of controllers in application mode, excluding this controller.
 
@@ -42,7 +42,7 @@ class IntrospectionInterface(Interface):
         # -> R:INVOKE <id> <rcode> Introspection.GetAppControllers <controllers>
         return await self.invoke("Introspection.GetAppControllers")
 
-    @method("GetFirmwareVersion", out="arg1")
+    @method("GetFirmwareVersion", out="arg1", cacheable=True, read=True)
     async def get_firmware_version(self, image: Firmware) -> str:
         """Get the firmware version.
 
@@ -53,7 +53,7 @@ class IntrospectionInterface(Interface):
         # -> R:INVOKE <id> <rcode> Introspection.GetFirmwareVersion <image> <version>
         return await self.invoke("Introspection.GetFirmwareVersion", image)
 
-    @method("GetLicenseInfo")
+    @method("GetLicenseInfo", read=True)
     async def get_license_info(self, type: LicenseType) -> LicenseInfo:
         """Get license information.
 
@@ -14,7 +14,7 @@ class LightSensorInterface(Interface):
     level: Decimal | None = None
 
     # Methods
-    @method("GetLevel", "GetLevelHW", property="level")
+    @method("GetLevel", "GetLevelHW", property="level", read=True)
     async def get_level(self, *, hw: bool = False) -> Decimal:
         """Get the level of a light sensor.
 
@@ -44,7 +44,7 @@ class LoadInterface(Interface):
     level: Decimal | None = None
 
     # Methods
-    @method("SetLevel", "SetLevelSW")
+    @method("SetLevel", "SetLevelSW", coalesce=True)
     async def set_level(self, level: float | Decimal, *, sw: bool = False) -> None:
         """Set the level of a load.
 
@@ -56,7 +56,7 @@ class LoadInterface(Interface):
         # -> R:INVOKE <id> <rcode> Load.SetLevel <level (0-100)>
         await self.invoke("Load.SetLevelSW" if sw else "Load.SetLevel", level)
 
-    @method("GetLevel", "GetLevelHW", property="level")
+    @method("GetLevel", "GetLevelHW", property="level", read=True)
     async def get_level(self, *, hw: bool = False) -> Decimal:
         """Get the level of a load.
 
@@ -70,7 +70,7 @@ class LoadInterface(Interface):
         # -> R:INVOKE <id> <level (0.000-100.000)> Load.GetLevel
         return await self.invoke("Load.GetLevelHW" if hw else "Load.GetLevel")
 
-    @method("Ramp")
+    @method("Ramp", interactive=True)
     async def ramp(
         self, cmd: RampType, ramptime: float | Decimal, finallevel: float | Decimal
     ) -> None:
@@ -96,7 +96,7 @@ class LoadInterface(Interface):
         # -> R:INVOKE <id> <rcode> Load.SetProfile <profile>
         await self.invoke("Load.SetProfile", profile)
 
-    @method("GetProfile")
+    @method("GetProfile", read=True)
     async def get_profile(self) -> int:
         """Get the id of the power profile used by this load.
 
@@ -107,7 +107,7 @@ class LoadInterface(Interface):
         # -> R:INVOKE <id> <profile> Load.GetProfile
         return await self.invoke("Load.GetProfile")
 
-    @method("GetOverrideLevel")
+    @method("GetOverrideLevel", read=True)
     async def get_override_level(self) -> Decimal:
         """Get the override level of a load.
 
@@ -118,7 +118,7 @@ class LoadInterface(Interface):
         # -> R:INVOKE <id> <level (0.000-100.000)> Load.GetOverrideLevel
         return await self.invoke("Load.GetOverrideLevel")
 
-    @method("RampAutoOff")
+    @method("RampAutoOff", interactive=True)
     async def ramp_auto_off(
         self,
         cmd: RampType,
@@ -150,7 +150,7 @@ class LoadInterface(Interface):
             offtimeout,
         )
 
-    @method("GetAlertState")
+    @method("GetAlertState", read=True)
     async def get_alert_state(self) -> AlertState:
         """Get the alert state of a load.
 
@@ -172,7 +172,7 @@ class LoadInterface(Interface):
         # -> R:INVOKE <id> <rcode> Load.SetAlertStateSW <alert state>
         await self.invoke("Load.SetAlertStateSW", alert_state)
 
-    @method("GetDimmingConfig")
+    @method("GetDimmingConfig", read=True)
     async def get_dimming_config(self) -> DimmingConfig:
         """Get the dimming configuration of a load.
 
@@ -16,7 +16,7 @@ class ObjectInterface(Interface):
     m_time: dt.datetime | None = None
 
     # Methods
-    @method("GetVID")
+    @method("GetVID", read=True)
     async def get_vid(self) -> int:
         """Get the Vantage ID of an object.
 
@@ -27,7 +27,7 @@ class ObjectInterface(Interface):
         # -> R:INVOKE <id> <vid> Object.GetVID
         return await self.invoke("Object.GetVID")
 
-    @method("GetController")
+    @method("GetController", cacheable=True, read=True)
     async def get_controller(self) -> int:
         """Get the VID of the controller of an object.
 
@@ -38,7 +38,7 @@ class ObjectInterface(Interface):
         # -> R:INVOKE <id> <controller> Object.GetController
         return await self.invoke("Object.GetController")
 
-    @method("GetType", out="arg0")
+    @method("GetType", out="arg0", cacheable=True, read=True)
     async def get_type(self) -> str:
         """Get the type of an object.
 
@@ -49,7 +49,7 @@ class ObjectInterface(Interface):
         # -> R:INVOKE <id> <type> Object.GetType
         return await self.invoke("Object.GetType")
 
-    @method("GetName", out="arg0")
+    @method("GetName", out="arg0", read=True)
     async def get_name(self) -> str:
         """Get the name field of an object.
 
@@ -60,7 +60,7 @@ class ObjectInterface(Interface):
         # -> R:INVOKE <id> <name> Object.GetName
         return await self.invoke("Object.GetName")
 
-    @method("GetModel", out="arg0")
+    @method("GetModel", out="arg0", cacheable=True, read=True)
     async def get_model(self) -> str:
         """Get the model field of an object.
 
@@ -71,7 +71,7 @@ class ObjectInterface(Interface):
         # -> R:INVOKE <id> <model> Object.GetModel
         return await self.invoke("Object.GetModel")
 
-    @method("GetNote", out="arg0")
+    @method("GetNote", out="arg0", read=True)
     async def get_note(self) -> str:
         """Get the note field of an object.
 
@@ -82,7 +82,7 @@ class ObjectInterface(Interface):
         # -> R:INVOKE <id> <note> Object.GetNote
         return await self.invoke("Object.GetNote")
 
-    @method("GetProperty")
+    @method("GetProperty", read=True)
     async def get_property(self, xpath: str) -> int:
         """Get an integer property of an object.
 
@@ -96,7 +96,7 @@ class ObjectInterface(Interface):
         # -> R:INVOKE <id> <value> Object.GetProperty <xpath>
         return await self.invoke("Object.GetProperty", xpath)
 
-    @method("GetPropertyEx", out="arg1")
+    @method("GetPropertyEx", out="arg1", read=True)
     async def get_property_ex(self, xpath: str) -> str:
         """Get a string property of an object.
 
@@ -124,7 +124,7 @@ class ObjectInterface(Interface):
         # -> R:INVOKE <id> <rcode> Object.Unlock
         await self.invoke("Object.Unlock")
 
-    @method("IsLocked")
+    @method("IsLocked", read=True)
     async def is_locked(self) -> bool:
         """Check if an object is locked.
 
@@ -135,7 +135,7 @@ class ObjectInterface(Interface):
         # -> R:INVOKE <id> <locked (0/1)> Object.IsLocked
         return await self.invoke("Object.IsLocked")
 
-    @method("IsInterfaceSupported")
+    @method("IsInterfaceSupported", read=True)
     async def is_interface_supported(self, iid: int) -> bool:
         """Check if an interface is supported by an object.
 
@@ -149,7 +149,7 @@ class ObjectInterface(Interface):
         # -> R:INVOKE <id> <supported (0/1)> Object.IsInterfaceSupported <iid>
         return await self.invoke("Object.IsInterfaceSupported", iid)
 
-    @method("IsMethodSupported")
+    @method("IsMethodSupported", read=True)
     async def is_method_supported(self, iid: int, mid: int) -> bool:
         """Check if a method is supported by an object.
 
@@ -188,7 +188,7 @@ class ObjectInterface(Interface):
         # -> R:INVOKE <id> <rcode> Object.SetPropertyEx <property> <value>
         await self.invoke("Object.SetPropertyEx", property, value)
 
-    @method("IsEnumeratorSupported")
+    @method("IsEnumeratorSupported", read=True)
     async def is_enumerator_supported(
         self, interface_name: str, enumeration_name: str, enumerator_name: str
     ) -> bool:
@@ -211,7 +211,7 @@ class ObjectInterface(Interface):
             enumerator_name,
         )
 
-    @method("GetMTime", property="m_time", fetch=False)
+    @method("GetMTime", property="m_time", fetch=False, read=True)
     async def get_m_time(self) -> dt.datetime:
         """Get the modification time of an object.
 
@@ -222,7 +222,7 @@ class ObjectInterface(Interface):
         # -> R:INVOKE <id> <mtime> Object.GetMTime
         return await self.invoke("Object.GetMTime")
 
-    @method("GetDName", out="arg0")
+    @method("GetDName", out="arg0", read=True)
     async def get_d_name(self) -> str:
         """Get the display name of an object.
 
@@ -233,7 +233,7 @@ class ObjectInterface(Interface):
         # -> R:INVOKE <id> <dname> Object.GetDName
         return await self.invoke("Object.GetDName")
 
-    @method("GetArea")
+    @method("GetArea", read=True)
     async def get_area(self) -> int:
         """Get the area of an object.
 
@@ -14,7 +14,7 @@ class PowerSensorInterface(Interface):
     power: Decimal | None = None
 
     # Methods
-    @method("GetPower", "GetPowerHW", property="power")
+    @method("GetPower", "GetPowerHW", property="power", read=True)
     async def get_power(self, *, hw: bool = False) -> Decimal:
         """Get the value of a power sensor.
 
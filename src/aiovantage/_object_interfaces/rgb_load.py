@@ -1,6 +1,10 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager, nullcontext
 from decimal import Decimal
 from enum import IntEnum
 from itertools import islice
+from typing import Any
 
 from typing_extensions import override
 
@@ -48,7 +52,7 @@ class RGBLoadInterface(Interface):
     hsl: tuple[int, int, int] | None = None
 
     # Methods
-    @method("SetRGB", "SetRGBSW", "SetRGBFollowLevel")
+    @method("SetRGB", "SetRGBSW", "SetRGBFollowLevel", coalesce=True)
     async def set_rgb(
         self,
         red: int = 255,
@@ -81,7 +85,7 @@ class RGBLoadInterface(Interface):
 
         await self.invoke(method, red, green, blue)
 
-    @method("GetRGB", "GetRGBHW")
+    @method("GetRGB", "GetRGBHW", read=True)
     async def get_rgb(self, channel: RGBChannel, *, hw: bool = False) -> int:
         """Get a single RGB color channel of a load from the controller.
 
@@ -98,7 +102,7 @@ class RGBLoadInterface(Interface):
             "RGBLoad.GetRGBHW" if hw else "RGBLoad.GetRGB", channel
         )
 
-    @method("SetHSL", "SetHSLSW")
+    @method("SetHSL", "SetHSLSW", coalesce=True)
     async def set_hsl(
         self,
         hue: int,
@@ -121,7 +125,7 @@ class RGBLoadInterface(Interface):
             "RGBLoad.SetHSLSW" if sw else "RGBLoad.SetHSL", hue, saturation, lightness
         )
 
-    @method("GetHSL", "GetHSLHW")
+    @method("GetHSL", "GetHSLHW", read=True)
     async def get_hsl(self, attribute: HSLAttribute, *, hw: bool = False) -> int:
         """Get a single HSL color attribute of a load from the controller.
 
@@ -139,7 +143,7 @@ class RGBLoadInterface(Interface):
             "RGBLoad.GetHSLHW" if hw else "RGBLoad.GetHSL", attribute
         )
 
-    @method("DissolveRGB", "DissolveRGBFollowLevel")
+    @method("DissolveRGB", "DissolveRGBFollowLevel", interactive=True)
     async def dissolve_rgb(
         self,
         red: int,
@@ -167,7 +171,7 @@ class RGBLoadInterface(Interface):
 
         await self.invoke(method, red, green, blue, rate)
 
-    @method("DissolveHSL")
+    @method("DissolveHSL", interactive=True)
     async def dissolve_hsl(
         self,
         hue: int,
@@ -203,7 +207,7 @@ class RGBLoadInterface(Interface):
             "RGBLoad.SetDissolveRateSW" if sw else "RGBLoad.SetDissolveRate", rate
         )
 
-    @method("GetDissolveRate", "GetDissolveRateHW")
+    @method("GetDissolveRate", "GetDissolveRateHW", read=True)
     async def get_dissolve_rate(self, *, hw: bool = False) -> Decimal:
         """Get the default dissolve rate for RGB and HSL transitions.
 
@@ -219,7 +223,7 @@ class RGBLoadInterface(Interface):
             "RGBLoad.GetDissolveRateHW" if hw else "RGBLoad.GetDissolveRate"
         )
 
-    @method("IncrementRGBComponent")
+    @method("IncrementRGBComponent", interactive=True)
     async def increment_rgb_component(self, channel: RGBChannel) -> None:
         """Increment a single RGB color channel of a load.
 
@@ -230,7 +234,7 @@ class RGBLoadInterface(Interface):
         # -> R:INVOKE <id> <rcode> RGBLoad.IncrementRGBComponent <channel>
         await self.invoke("RGBLoad.IncrementRGBComponent", channel)
 
-    @method("DecrementRGBComponent")
+    @method("DecrementRGBComponent", interactive=True)
     async def decrement_rgb_component(self, channel: RGBChannel) -> None:
         """Decrement a single RGB color channel of a load.
 
@@ -241,7 +245,7 @@ class RGBLoadInterface(Interface):
         # -> R:INVOKE <id> <rcode> RGBLoad.DecrementRGBComponent <channel>
         await self.invoke("RGBLoad.DecrementRGBComponent", channel)
 
-    @method("SetRGBComponent")
+    @method("SetRGBComponent", interactive=True)
     async def set_rgb_component(self, channel: RGBChannel, value: int) -> None:
         """Set a single RGB(W) color channel of a load.
 
@@ -253,7 +257,7 @@ class RGBLoadInterface(Interface):
         # -> R:INVOKE <id> <rcode> RGBLoad.SetRGBComponent <channel> <value>
         await self.invoke("RGBLoad.SetRGBComponent", channel, value)
 
-    @method("IncrementHSLAttribute")
+    @method("IncrementHSLAttribute", interactive=True)
     async def increment_hsl_attribute(self, attribute: HSLAttribute) -> None:
         """Increment a single HSL color attribute of a load.
 
@@ -264,7 +268,7 @@ class RGBLoadInterface(Interface):
         # -> R:INVOKE <id> <rcode> RGBLoad.IncrementHSLAttribute <attribute>
         await self.invoke("RGBLoad.IncrementHSLAttribute", attribute)
 
-    @method("DecrementHSLAttribute")
+    @method("DecrementHSLAttribute", interactive=True)
     async def decrement_hsl_attribute(self, attribute: HSLAttribute) -> None:
         """Decrement a single HSL color attribute of a load.
 
@@ -275,7 +279,7 @@ class RGBLoadInterface(Interface):
         # -> R:INVOKE <id> <rcode> RGBLoad.DecrementHSLAttribute <attribute>
         await self.invoke("RGBLoad.DecrementHSLAttribute", attribute)
 
-    @method("SetHSLAttribute")
+    @method("SetHSLAttribute", interactive=True)
     async def set_hsl_attribute(self, attribute: HSLAttribute, value: int) -> None:
         """Set a single HSL color attribute of a load.
 
@@ -288,42 +292,42 @@ class RGBLoadInterface(Interface):
         # -> R:INVOKE <id> <rcode> RGBLoad.SetHSLAttribute <attribute> <value>
         await self.invoke("RGBLoad.SetHSLAttribute", attribute, value)
 
-    @method("Stop")
+    @method("Stop", interactive=True)
     async def stop(self) -> None:
         """Stop the transition."""
         # INVOKE <id> RGBLoad.Stop
         # -> R:INVOKE <id> <rcode> RGBLoad.Stop
         await self.invoke("RGBLoad.Stop")
 
-    @method("NextPreset")
+    @method("NextPreset", interactive=True)
     async def next_preset(self) -> None:
         """Change to the next lighting preset."""
         # INVOKE <id> RGBLoad.NextPreset
         # -> R:INVOKE <id> <rcode> RGBLoad.NextPreset
         await self.invoke("RGBLoad.NextPreset")
 
-    @method("PreviousPreset")
+    @method("PreviousPreset", interactive=True)
     async def previous_preset(self) -> None:
         """Change to the previous lighting preset."""
         # INVOKE <id> RGBLoad.PreviousPreset
         # -> R:INVOKE <id> <rcode> RGBLoad.PreviousPreset
         await self.invoke("RGBLoad.PreviousPreset")
 
-    @method("NextEffect")
+    @method("NextEffect", interactive=True)
     async def next_effect(self) -> None:
         """Change to the next lighting effect."""
         # INVOKE <id> RGBLoad.NextEffect
         # -> R:INVOKE <id> <rcode> RGBLoad.NextEffect
         await self.invoke("RGBLoad.NextEffect")
 
-    @method("PreviousEffect")
+    @method("PreviousEffect", interactive=True)
     async def previous_effect(self) -> None:
         """Change to the previous lighting effect."""
         # INVOKE <id> RGBLoad.PreviousEffect
         # -> R:INVOKE <id> <rcode> RGBLoad.PreviousEffect
         await self.invoke("RGBLoad.PreviousEffect")
 
-    @method("SetPreset", "SetPresetSW")
+    @method("SetPreset", "SetPresetSW", interactive=True)
     async def set_preset(self, index: int, *, sw: bool = False) -> None:
         """Change to a specific lighting preset.
 
@@ -335,7 +339,7 @@ class RGBLoadInterface(Interface):
         # -> R:INVOKE <id> <rcode> RGBLoad.SetPreset <index>
         await self.invoke("RGBLoad.SetPresetSW" if sw else "RGBLoad.SetPreset", index)
 
-    @method("GetPreset", "GetPresetHW")
+    @method("GetPreset", "GetPresetHW", read=True)
     async def get_preset(self, *, hw: bool = False) -> int:
         """Get the current lighting preset.
 
@@ -349,7 +353,7 @@ class RGBLoadInterface(Interface):
         # -> R:INVOKE <id> <index> RGBLoad.GetPreset
         return await self.invoke("RGBLoad.GetPresetHW" if hw else "RGBLoad.GetPreset")
 
-    @method("SetEffect", "SetEffectSW")
+    @method("SetEffect", "SetEffectSW", interactive=True)
     async def set_effect(self, index: int, *, sw: bool = False) -> None:
         """Change to a specific lighting effect.
 
@@ -361,7 +365,7 @@ class RGBLoadInterface(Interface):
         # -> R:INVOKE <id> <rcode> RGBLoad.SetEffect <index>
         await self.invoke("RGBLoad.SetEffectSW" if sw else "RGBLoad.SetEffect", index)
 
-    @method("GetEffect", "GetEffectHW")
+    @method("GetEffect", "GetEffectHW", read=True)
     async def get_effect(self, *, hw: bool = False) -> int:
         """Get the current lighting effect.
 
@@ -375,7 +379,7 @@ class RGBLoadInterface(Interface):
         # -> R:INVOKE <id> <index> RGBLoad.GetEffect
         return await self.invoke("RGBLoad.GetEffectHW" if hw else "RGBLoad.GetEffect")
 
-    @method("SetColorByName")
+    @method("SetColorByName", interactive=True)
     async def set_color_by_name(self, color: ColorName) -> None:
         """Set the color of an RGB load by name.
 
@@ -386,7 +390,7 @@ class RGBLoadInterface(Interface):
         # -> R:INVOKE <id> <rcode> RGBLoad.SetColorByName <color>
         await self.invoke("RGBLoad.SetColorByName", color)
 
-    @method("GetColorName")
+    @method("GetColorName", read=True)
     async def get_color_name(self) -> ColorName:
         """Get the name of the color of a load from the controller.
 
@@ -397,7 +401,7 @@ class RGBLoadInterface(Interface):
         # -> R:INVOKE <id> <color> RGBLoad.GetColorName
         return await self.invoke("RGBLoad.GetColorName")
 
-    @method("GetColor", "GetColorHW")
+    @method("GetColor", "GetColorHW", read=True)
     async def get_color(self, *, hw: bool = False) -> int:
         """Get the RGB/RGBW color of a load from the controller.
 
@@ -415,7 +419,7 @@ class RGBLoadInterface(Interface):
         # -> R:INVOKE <id> <color> RGBLoad.GetColor
         return await self.invoke("RGBLoad.GetColorHW" if hw else "RGBLoad.GetColor")
 
-    @method("SetRGBW", "SetRGBWSW", "SetRGBWFollowLevel")
+    @method("SetRGBW", "SetRGBWSW", "SetRGBWFollowLevel", coalesce=True)
     async def set_rgbw(
         self,
         red: int = 255,
@@ -450,7 +454,7 @@ class RGBLoadInterface(Interface):
 
         await self.invoke(method, red, green, blue, white)
 
-    @method("GetRGBW", "GetRGBWHW")
+    @method("GetRGBW", "GetRGBWHW", read=True)
     async def get_rgbw(self, channel: int, *, hw: bool = False) -> int:
         """Get a single RGBW color channel of a load from the controller.
 
@@ -467,7 +471,7 @@ class RGBLoadInterface(Interface):
             "RGBLoad.GetRGBWHW" if hw else "RGBLoad.GetRGBW", channel
         )
 
-    @method("GetTransitionLevel")
+    @method("GetTransitionLevel", read=True)
     async def get_transition_level(self) -> Decimal:
         """Get the transition level of a load.
 
@@ -478,7 +482,7 @@ class RGBLoadInterface(Interface):
         # -> R:INVOKE <id> <level> RGBLoad.GetTransitionLevel
         return await self.invoke("RGBLoad.GetTransitionLevel")
 
-    @method("DissolveRGBW", "DissolveRGBWFollowLevel")
+    @method("DissolveRGBW", "DissolveRGBWFollowLevel", interactive=True)
     async def dissolve_rgbw(
         self,
         red: int,
@@ -545,10 +549,9 @@ class RGBLoadInterface(Interface):
     # before updating the property.
 
     @override
-    async def fetch_state(self) -> list[str]:
-        # Fetch state from other interfaces first
-        props_changed = await super().fetch_state()
-
+    async def fetch_state(
+        self, limiter: AbstractAsyncContextManager[Any] | None = None
+    ) -> list[str]:
         # Define the getters for our "virtual" properties
         getters = {
             "rgb": self.get_rgb_color,
@@ -556,12 +559,31 @@ class RGBLoadInterface(Interface):
             "rgbw": self.get_rgbw_color,
         }
 
-        # Fetch the properties
-        for prop, getter in getters.items():
+        async def fetch(
+            prop: str, getter: Callable[[], Awaitable[tuple[int, ...]]]
+        ) -> list[str]:
             try:
-                props_changed.extend(self.update_properties({prop: await getter()}))
+                async with limiter or nullcontext():
+                    value = await getter()
             except CommandError:
-                continue
+                return []
+
+            return self.update_properties({prop: value})
+
+        # Fetch the properties concurrently with state from other interfaces, waiting
+        # for every fetch to finish before raising the first error
+        results = await asyncio.gather(
+            super().fetch_state(limiter),
+            *(fetch(prop, getter) for prop, getter in getters.items()),
+            return_exceptions=True,
+        )
+
+        props_changed: list[str] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+            props_changed.extend(result)
 
         return props_changed
 
@@ -12,7 +12,7 @@ class SensorInterface(Interface):
     level: Decimal | None = None
 
     # Methods
-    @method("GetLevel", "GetLevelHW", property="level")
+    @method("GetLevel", "GetLevelHW", property="level", read=True)
     async def get_level(self, *, hw: bool = False) -> Decimal:
         """Get the level of a sensor.
 
@@ -37,7 +37,7 @@ class SensorInterface(Interface):
         # -> R:INVOKE <id> <rcode> Sensor.SetLevel <level (0-100)>
         await self.invoke("Sensor.SetLevel", level)
 
-    @method("GetHighRange")
+    @method("GetHighRange", read=True)
     async def get_high_range(self) -> Decimal:
         """Get the high range of a sensor.
 
@@ -48,7 +48,7 @@ class SensorInterface(Interface):
         # -> R:INVOKE <id> <high range> Sensor.GetHighRange
         return await self.invoke("Sensor.GetHighRange")
 
-    @method("GetLowRange")
+    @method("GetLowRange", read=True)
     async def get_low_range(self) -> Decimal:
         """Get the low range of a sensor.
 
@@ -59,7 +59,7 @@ class SensorInterface(Interface):
         # -> R:INVOKE <id> <low range> Sensor.GetLowRange
         return await self.invoke("Sensor.GetLowRange")
 
-    @method("GetHoldOnTime")
+    @method("GetHoldOnTime", read=True)
     async def get_hold_on_time(self) -> Decimal:
         """Get the hold on time of a sensor.
 
@@ -70,7 +70,7 @@ class SensorInterface(Interface):
         # -> R:INVOKE <id> <hold on time> Sensor.GetHoldOnTime
         return await self.invoke("Sensor.GetHoldOnTime")
 
-    @method("IsTracking")
+    @method("IsTracking", read=True)
     async def is_tracking(self) -> bool:
         """Get whether the sensor is tracking.
 
@@ -81,7 +81,7 @@ class SensorInterface(Interface):
         # -> R:INVOKE <id> <tracking (0/1)> Sensor.IsTracking
         return await self.invoke("Sensor.IsTracking")
 
-    @method("GetTrackingDelta")
+    @method("GetTrackingDelta", read=True)
     async def get_tracking_delta(self) -> Decimal:
         """Get the tracking delta of a sensor.
 
@@ -92,7 +92,7 @@ class SensorInterface(Interface):
         # -> R:INVOKE <id> <tracking delta> Sensor.GetTrackingDelta
         return await self.invoke("Sensor.GetTrackingDelta")
 
-    @method("GetTrackingMin")
+    @method("GetTrackingMin", read=True)
     async def get_tracking_min(self) -> Decimal:
         """Get the tracking min time of a sensor.
 
@@ -103,7 +103,7 @@ class SensorInterface(Interface):
         # -> R:INVOKE <id> <tracking min> Sensor.GetTrackingMin
         return await self.invoke("Sensor.GetTrackingMin")
 
-    @method("GetTrackingMax")
+    @method("GetTrackingMax", read=True)
     async def get_tracking_max(self) -> Decimal:
         """Get the tracking max time of a sensor.
 
@@ -16,7 +16,7 @@ class SounderInterface(Interface):
         Off = 1
 
     # Methods
-    @method("GetFrequency", "GetFrequencyHW")
+    @method("GetFrequency", "GetFrequencyHW", read=True)
     async def get_frequency(self, *, hw: bool = False) -> Decimal:
         """Get the frequency of the keypad speaker.
 
@@ -43,7 +43,7 @@ class SounderInterface(Interface):
         # -> R:INVOKE <id> <rcode> Sounder.SetFrequency
         await self.invoke("Sounder.SetFrequency", frequency)
 
-    @method("GetDuration", "GetDurationHW")
+    @method("GetDuration", "GetDurationHW", read=True)
     async def get_duration(self, *, hw: bool = False) -> Decimal:
         """Get the length of time the keypad speaker will sound.
 
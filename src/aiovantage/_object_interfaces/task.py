@@ -25,7 +25,7 @@ class TaskInterface(Interface):
     context_state: bool | None = None
 
     # Methods
-    @method("Start")
+    @method("Start", interactive=True)
     async def start(self) -> None:
         """Start a task."""
         # TODO: Add support for Task.Start parameters
@@ -33,28 +33,28 @@ class TaskInterface(Interface):
         # -> R:INVOKE <id> <rcode (0/1)> Task.Start <source> <event> <param1> <param2>
         await self.invoke("Task.Start")
 
-    @method("Stop")
+    @method("Stop", interactive=True)
     async def stop(self) -> None:
         """Stop a running task."""
         # INVOKE <id> Task.Stop
         # -> R:INVOKE <id> <rcode> Task.Stop
         await self.invoke("Task.Stop")
 
-    @method("Cancel")
+    @method("Cancel", interactive=True)
     async def cancel(self) -> None:
         """Cancel a scheduled task."""
         # INVOKE <id> Task.Cancel
         # -> R:INVOKE <id> <rcode> Task.Cancel
         await self.invoke("Task.Cancel")
 
-    @method("IsRunning", property="running")
+    @method("IsRunning", property="running", read=True)
     async def is_running(self) -> bool:
         """Get the running state of a task."""
         # INVOKE <id> Task.IsRunning
         # -> R:INVOKE <id> <running (0/1)> Task.IsRunning
         return await self.invoke("Task.IsRunning")
 
-    @method("GetState", property="state")
+    @method("GetState", property="state", read=True)
     async def get_state(self) -> int:
         """Get the state of a task.
 
@@ -65,7 +65,7 @@ class TaskInterface(Interface):
         # -> R:INVOKE <id> <state> Task.GetState
         return await self.invoke("Task.GetState")
 
-    @method("SetState")
+    @method("SetState", interactive=True)
     async def set_state(self, state: int) -> None:
         """Set the state of a task.
 
@@ -76,7 +76,7 @@ class TaskInterface(Interface):
         # -> R:INVOKE <id> <rcode> Task.SetState <state>
         await self.invoke("Task.SetState", state)
 
-    @method("GetStatus")
+    @method("GetStatus", read=True)
     async def get_status(self) -> Status:
         """Get the status of a task.
 
@@ -87,7 +87,7 @@ class TaskInterface(Interface):
         # -> R:INVOKE <id> <status> Task.GetStatus
         return await self.invoke("Task.GetStatus")
 
-    @method("GetContextState")
+    @method("GetContextState", read=True)
     async def get_context_state(self) -> int:
         """Get the context-aware task state.
 
@@ -98,7 +98,7 @@ class TaskInterface(Interface):
         # -> R:INVOKE <id> <context state> Task.GetContextState
         return await self.invoke("Task.GetContextState")
 
-    @method("HasContextState", property="context_state")
+    @method("HasContextState", property="context_state", read=True)
     async def has_context_state(self) -> bool:
         """Check if the task is context-aware.
 
@@ -14,7 +14,7 @@ class TemperatureInterface(Interface):
     value: Decimal | None = None
 
     # Methods
-    @method("GetValue", "GetValueHW", property="value")
+    @method("GetValue", "GetValueHW", property="value", read=True)
     async def get_value(self, *, hw: bool = False) -> Decimal:
         """Get the value of a temperature sensor.
 
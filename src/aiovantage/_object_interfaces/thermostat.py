@@ -62,7 +62,10 @@ class ThermostatInterface(Interface):
 
     # Methods
     @method(
-        "GetIndoorTemperature", "GetIndoorTemperatureHW", property="indoor_temperature"
+        "GetIndoorTemperature",
+        "GetIndoorTemperatureHW",
+        property="indoor_temperature",
+        read=True,
     )
     async def get_indoor_temperature(self, *, hw: bool = False) -> Decimal:
         """Get the current indoor temperature.
@@ -96,6 +99,7 @@ class ThermostatInterface(Interface):
         "GetOutdoorTemperature",
         "GetOutdoorTemperatureHW",
         property="outdoor_temperature",
+        read=True,
     )
     async def get_outdoor_temperature(self, *, hw: bool = False) -> Decimal:
         """Get the current outdoor temperature.
@@ -125,7 +129,9 @@ class ThermostatInterface(Interface):
         # -> R:INVOKE <id> Thermostat.SetOutdoorTemperature <temp>
         await self.invoke("Thermostat.SetOutdoorTemperatureSW", temp)
 
-    @method("GetHeatSetPoint", "GetHeatSetPointHW", property="heat_set_point")
+    @method(
+        "GetHeatSetPoint", "GetHeatSetPointHW", property="heat_set_point", read=True
+    )
     async def get_heat_set_point(self, *, hw: bool = False) -> Decimal:
         """Get the current heat set point.
 
@@ -141,7 +147,7 @@ class ThermostatInterface(Interface):
             "Thermostat.GetHeatSetPointHW" if hw else "Thermostat.GetHeatSetPoint"
         )
 
-    @method("SetHeatSetPoint", "SetHeatSetPointSW")
+    @method("SetHeatSetPoint", "SetHeatSetPointSW", coalesce=True)
     async def set_heat_set_point(
         self, temp: float | Decimal, *, sw: bool = False
     ) -> None:
@@ -157,7 +163,9 @@ class ThermostatInterface(Interface):
             "Thermostat.SetHeatSetPointSW" if sw else "Thermostat.SetHeatSetPoint", temp
         )
 
-    @method("GetCoolSetPoint", "GetCoolSetPointHW", property="cool_set_point")
+    @method(
+        "GetCoolSetPoint", "GetCoolSetPointHW", property="cool_set_point", read=True
+    )
     async def get_cool_set_point(self, *, hw: bool = False) -> Decimal:
         """Get the current cool set point.
 
@@ -173,7 +181,7 @@ class ThermostatInterface(Interface):
             "Thermostat.GetCoolSetPointHW" if hw else "Thermostat.GetCoolSetPoint"
         )
 
-    @method("SetCoolSetPoint", "SetCoolSetPointSW")
+    @method("SetCoolSetPoint", "SetCoolSetPointSW", coalesce=True)
     async def set_cool_set_point(
         self, temp: float | Decimal, *, sw: bool = False
     ) -> None:
@@ -189,7 +197,9 @@ class ThermostatInterface(Interface):
             "Thermostat.SetCoolSetPointSW" if sw else "Thermostat.SetCoolSetPoint", temp
         )
 
-    @method("GetOperationMode", "GetOperationModeHW", property="operation_mode")
+    @method(
+        "GetOperationMode", "GetOperationModeHW", property="operation_mode", read=True
+    )
     async def get_operation_mode(self, *, hw: bool = False) -> OperationMode:
         """Get the current operation mode.
 
@@ -205,7 +215,7 @@ class ThermostatInterface(Interface):
             "Thermostat.GetOperationModeHW" if hw else "Thermostat.GetOperationMode",
         )
 
-    @method("SetOperationMode", "SetOperationModeSW")
+    @method("SetOperationMode", "SetOperationModeSW", interactive=True)
     async def set_operation_mode(self, mode: int, *, sw: bool = False) -> None:
         """Set the current operation mode.
 
@@ -220,7 +230,7 @@ class ThermostatInterface(Interface):
             mode,
         )
 
-    @method("GetFanMode", "GetFanModeHW", property="fan_mode")
+    @method("GetFanMode", "GetFanModeHW", property="fan_mode", read=True)
     async def get_fan_mode(self, *, hw: bool = False) -> FanMode:
         """Get the current fan mode.
 
@@ -236,7 +246,7 @@ class ThermostatInterface(Interface):
             "Thermostat.GetFanModeHW" if hw else "Thermostat.GetFanMode"
         )
 
-    @method("SetFanMode", "SetFanModeSW")
+    @method("SetFanMode", "SetFanModeSW", interactive=True)
     async def set_fan_mode(self, mode: int, *, sw: bool = False) -> None:
         """Set the current fan mode.
 
@@ -250,7 +260,7 @@ class ThermostatInterface(Interface):
             "Thermostat.SetFanModeSW" if sw else "Thermostat.SetFanMode", mode
         )
 
-    @method("GetDayMode", "GetDayModeHW")
+    @method("GetDayMode", "GetDayModeHW", read=True)
     async def get_day_mode(self, *, hw: bool = False) -> DayMode:
         """Get the current day mode.
 
@@ -266,7 +276,7 @@ class ThermostatInterface(Interface):
             "Thermostat.GetDayModeHW" if hw else "Thermostat.GetDayMode"
         )
 
-    @method("SetDayMode", "SetDayModeSW")
+    @method("SetDayMode", "SetDayModeSW", interactive=True)
     async def set_day_mode(self, mode: int, *, sw: bool = False) -> None:
         """Set the current day mode.
 
@@ -280,7 +290,7 @@ class ThermostatInterface(Interface):
             "Thermostat.SetDayModeSW" if sw else "Thermostat.SetDayMode", mode
         )
 
-    @method("SetHoldMode", "SetHoldModeSW")
+    @method("SetHoldMode", "SetHoldModeSW", interactive=True)
     async def set_hold_mode(self, mode: int, *, sw: bool = False) -> None:
         """Set the current hold mode.
 
@@ -294,7 +304,7 @@ class ThermostatInterface(Interface):
             "Thermostat.SetHoldModeSW" if sw else "Thermostat.SetHoldMode", mode
         )
 
-    @method("GetHoldMode", "GetHoldModeHW")
+    @method("GetHoldMode", "GetHoldModeHW", read=True)
     async def get_hold_mode(self, *, hw: bool = False) -> HoldMode:
         """Get the current hold mode.
 
@@ -310,7 +320,7 @@ class ThermostatInterface(Interface):
             "Thermostat.GetHoldModeHW" if hw else "Thermostat.GetHoldMode"
         )
 
-    @method("GetStatus", "GetStatusHW", property="status")
+    @method("GetStatus", "GetStatusHW", property="status", read=True)
     async def get_status(self, *, hw: bool = False) -> Status:
         """Get the current status.
 
@@ -337,7 +347,9 @@ class ThermostatInterface(Interface):
         # -> R:INVOKE <id> Thermostat.SetStatusSW <status>
         await self.invoke("Thermostat.SetStatusSW", status)
 
-    @method("GetAutoSetPoint", "GetAutoSetPointHW", property="auto_set_point")
+    @method(
+        "GetAutoSetPoint", "GetAutoSetPointHW", property="auto_set_point", read=True
+    )
     async def get_auto_set_point(self, *, hw: bool = False) -> Decimal:
         """Get the current auto set point.
 
@@ -353,7 +365,7 @@ class ThermostatInterface(Interface):
             "Thermostat.GetAutoSetPointHW" if hw else "Thermostat.GetAutoSetPoint"
         )
 
-    @method("SetAutoSetPoint", "SetAutoSetPointSW")
+    @method("SetAutoSetPoint", "SetAutoSetPointSW", coalesce=True)
     async def set_auto_set_point(
         self, temp: float | Decimal, *, sw: bool = False
     ) -> None:
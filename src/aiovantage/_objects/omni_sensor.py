@@ -1,9 +1,11 @@
 """OmniSensor object."""
 
+from contextlib import AbstractAsyncContextManager, nullcontext
 from dataclasses import dataclass, field
 from decimal import Decimal
 from enum import Enum
 from types import NoneType
+from typing import Any
 
 from typing_extensions import override
 
@@ -109,8 +111,13 @@ class OmniSensor(Sensor, SensorInterface):
     # OmniSensors do additional conversion behind the scenes.
 
     @override
-    async def fetch_state(self) -> list[str]:
-        return self.update_properties({"level": await self.get_level(hw=True)})
+    async def fetch_state(
+        self, limiter: AbstractAsyncContextManager[Any] | None = None
+    ) -> list[str]:
+        async with limiter or nullcontext():
+            level = await self.get_level(hw=True)
+
+        return self.update_properties({"level": level})
 
     @override
     def handle_object_status(self, method: str, result: str, *args: str) -> list[str]:
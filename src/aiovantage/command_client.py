@@ -15,10 +15,17 @@ The service is discoverable via mDNS as `_hc._tcp.local` and/or `_secure_hc._tcp
 from ._command_client.client import CommandClient, CommandResponse
 from ._command_client.converter import Converter
 from ._command_client.events import EventStream
+from ._command_client.priority import CommandPriority, command_priority
+from ._command_client.recorder import RecordedLine, StreamRecorder, read_recording
 
 __all__ = [
     "CommandClient",
+    "CommandPriority",
     "CommandResponse",
     "Converter",
     "EventStream",
+    "RecordedLine",
+    "StreamRecorder",
+    "command_priority",
+    "read_recording",
 ]
@@ -91,11 +91,16 @@ COMMAND_ERROR_CODES = {
 }
 
 
-def raise_command_error(code: int, message: str) -> None:
-    """Raise a command error based on the error code."""
+def command_error(code: int, message: str) -> CommandError:
+    """Create a command error based on the error code."""
     error_cls = COMMAND_ERROR_CODES.get(code)
 
     if error_cls is None:
-        raise CommandError(f"{message} (Error code {code})")
+        return CommandError(f"{message} (Error code {code})")
+
+    return error_cls(message)
 
-    raise error_cls(message)
+
+def raise_command_error(code: int, message: str) -> None:
+    """Raise a command error based on the error code."""
+    raise command_error(code, message)
@@ -1,9 +1,20 @@
 """Event classes for Vantage controller events."""
 
-from collections import defaultdict
-from collections.abc import Callable
-from dataclasses import dataclass
-from typing import Any, Generic, TypeVar
+import asyncio
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter, defaultdict, deque
+from collections.abc import Callable, Hashable, Iterable
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import Any, Generic, Literal, TypeVar
+
+from typing_extensions import Self
+
+from aiovantage._command_client.converter import Converter
+from aiovantage._logger import logger
 
 T = TypeVar("T")
 
@@ -16,9 +27,112 @@ __all__ = [
     "ObjectAdded",
     "ObjectUpdated",
     "ObjectDeleted",
+    "EventSubscription",
+    "OverflowPolicy",
+    "CallbackStats",
 ]
 
 
+CALLBACK_TIME_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+"""Upper bounds, in seconds, of the buckets of callback duration histograms."""
+
+
+@dataclass
+class CallbackStats:
+    """Timing statistics for an event callback."""
+
+    calls: int = 0
+    """The number of times the callback was called."""
+
+    total_time: float = 0.0
+    """The total time spent in the callback, in seconds."""
+
+    max_time: float = 0.0
+    """The longest time spent in a single call, in seconds."""
+
+    histogram: list[int] = field(
+        default_factory=lambda: [0] * (len(CALLBACK_TIME_BUCKETS) + 1)
+    )
+    """The number of calls in each bucket of `CALLBACK_TIME_BUCKETS`, followed by
+    the number of calls longer than the largest bucket."""
+
+    def record(self, duration: float) -> None:
+        """Record the duration of a call.
+
+        Args:
+            duration: The duration of the call, in seconds.
+        """
+        self.calls += 1
+        self.total_time += duration
+        self.max_time = max(self.max_time, duration)
+        self.histogram[bisect_left(CALLBACK_TIME_BUCKETS, duration)] += 1
+
+
+class _ExecutorCallback:
+    # A callback which is called in the dispatcher's executor, rather than inline
+    __slots__ = ("callback",)
+
+    def __init__(self, callback: Callable[[Any], None]) -> None:
+        self.callback = callback
+
+    def __call__(self, event: Any) -> None:
+        self.callback(event)
+
+
+class _OrderedDispatch:
+    # Runs jobs in an executor, with jobs sharing a key run one at a time in order.
+    # Each key with pending jobs has a queue, drained by a single executor task.
+
+    def __init__(self, executor: Executor) -> None:
+        self.executor = executor
+        self.depth = 0
+        self._lock = threading.Lock()
+        self._queues: dict[Hashable, deque[Callable[[], None]]] = {}
+
+    def submit(self, key: Hashable, job: Callable[[], None]) -> None:
+        with self._lock:
+            self.depth += 1
+            queue = self._queues.get(key)
+            if queue is not None:
+                queue.append(job)
+                return
+
+            self._queues[key] = deque([job])
+
+        try:
+            self.executor.submit(self._drain, key)
+        except BaseException:
+            # Drop the queue if the executor rejects it, eg. once it is shut down,
+            # along with any jobs queued behind this one in the meantime
+            with self._lock:
+                self.depth -= len(self._queues.pop(key))
+            raise
+
+    def _drain(self, key: Hashable) -> None:
+        queue = self._queues[key]
+        while True:
+            with self._lock:
+                if not queue:
+                    del self._queues[key]
+                    return
+                job = queue.popleft()
+
+            try:
+                job()
+            finally:
+                with self._lock:
+                    self.depth -= 1
+
+
+class _FilteredCallback:
+    # A subscription filtered by vid and/or attribute, which may be indexed under
+    # several keys, but should only be called once per event
+    __slots__ = ("callback",)
+
+    def __init__(self, callback: Callable[[Any], None]) -> None:
+        self.callback = callback
+
+
 class EventDispatcher:
     """Simple event dispatcher that allows subscription to and emission of events."""
 
@@ -26,37 +140,382 @@ class EventDispatcher:
         """Initialize the event dispatcher."""
         self._subscribers: dict[type, list[Callable[[Any], None]]] = defaultdict(list)
 
+        # Filtered subscribers, indexed by event type, vid and attribute
+        self._filtered_subscribers: dict[
+            tuple[type, int | None, str | None], list[_FilteredCallback]
+        ] = defaultdict(list)
+        self._filtered_counts: Counter[type] = Counter()
+
+        # Optional callback timing instrumentation
+        self._slow_callback_threshold: float | None = None
+        self._callback_stats: dict[Callable[[Any], None], CallbackStats] = {}
+        self._stats_lock = threading.Lock()
+
+        # Optional executor to call subscribers with, in order for each object
+        self._dispatch: _OrderedDispatch | None = None
+
+    @property
+    def executor(self) -> Executor | None:
+        """The executor that callbacks subscribed with `in_executor=True` run in."""
+        return None if self._dispatch is None else self._dispatch.executor
+
+    @executor.setter
+    def executor(self, executor: Executor | None) -> None:
+        self._dispatch = None if executor is None else _OrderedDispatch(executor)
+
+    @property
+    def executor_queue_depth(self) -> int:
+        """The number of callbacks waiting to run, or running, in the executor."""
+        return 0 if self._dispatch is None else self._dispatch.depth
+
+    @property
+    def callback_stats(self) -> dict[Callable[[Any], None], CallbackStats]:
+        """Timing statistics for each callback, when callback timing is enabled."""
+        return self._callback_stats
+
+    def enable_callback_timing(self, slow_callback_threshold: float = 0.1) -> None:
+        """Record timing statistics for callbacks, and log slow callbacks.
+
+        Args:
+            slow_callback_threshold: Log a warning when a callback takes longer than
+                this many seconds to handle an event.
+        """
+        self._slow_callback_threshold = slow_callback_threshold
+
+    def disable_callback_timing(self) -> None:
+        """Stop recording timing statistics for callbacks, and clear them."""
+        self._slow_callback_threshold = None
+        self._callback_stats.clear()
+
     def subscribe(
-        self, event_type: type[T], callback: Callable[[T], None]
+        self,
+        event_type: type[T],
+        callback: Callable[[T], None],
+        *,
+        vid: int | None = None,
+        attrs: Iterable[str] | None = None,
+        in_executor: bool = False,
     ) -> Callable[[], None]:
         """Register a callback function to be called when an event is emitted.
 
+        Optionally, the callback can be limited to events for a single object, and to
+        ObjectUpdated events where specific attributes changed. Filtered callbacks are
+        indexed, so only matching callbacks are considered when an event is emitted.
+
+        Callbacks which do expensive work can be called in the dispatcher's
+        `executor`, rather than on the event loop. These callbacks are called in
+        order for events related to the same object, but events for different
+        objects may be handled concurrently. They must not modify objects, or use
+        the event loop other than with thread-safe methods such as
+        `loop.call_soon_threadsafe`. If no executor is set, they are called inline.
+
         Args:
             event_type: Event type to subscribe to.
             callback: Callback function to call when an event of this type is emitted.
+            vid: Only call back for events related to the object with this Vantage ID.
+            attrs: Only call back for events where any of these attributes changed.
+            in_executor: Whether to call the callback in the dispatcher's executor.
 
         Returns:
             A function that can be called to unsubscribe from the event.
         """
-        self._subscribers[event_type].append(callback)
+        if in_executor:
+            callback = _ExecutorCallback(callback)
+
+        if vid is None and attrs is None:
+            self._subscribers[event_type].append(callback)
+
+            def unsubscribe() -> None:
+                self._subscribers[event_type].remove(callback)
+                if not self._subscribers[event_type]:
+                    del self._subscribers[event_type]
+
+            return unsubscribe
 
-        def unsubscribe() -> None:
-            self._subscribers[event_type].remove(callback)
-            if not self._subscribers[event_type]:
-                del self._subscribers[event_type]
+        # Index the callback under every attribute it is interested in
+        entry = _FilteredCallback(callback)
+        if attrs is None:
+            keys = [(event_type, vid, None)]
+        else:
+            keys = [(event_type, vid, attr) for attr in set(attrs)]
 
-        return unsubscribe
+        for key in keys:
+            self._filtered_subscribers[key].append(entry)
+        self._filtered_counts[event_type] += 1
+
+        def unsubscribe_filtered() -> None:
+            for key in keys:
+                self._filtered_subscribers[key].remove(entry)
+                if not self._filtered_subscribers[key]:
+                    del self._filtered_subscribers[key]
+
+            self._filtered_counts[event_type] -= 1
+            if not self._filtered_counts[event_type]:
+                del self._filtered_counts[event_type]
+
+        return unsubscribe_filtered
 
     def emit(self, event: Any) -> None:
         """Emit an event, notifying all subscribers.
 
+        Exceptions raised by a callback are logged, and don't prevent other
+        subscribers from being notified.
+
         Args:
             event: The event to emit.
         """
-        event_type = type(event)  # type: ignore
+        event_type: type[Any] = type(event)  # type: ignore
         if event_type in self._subscribers:
             for callback in self._subscribers[event_type]:
-                callback(event)
+                self._call_subscriber(callback, event)
+
+        if event_type in self._filtered_counts:
+            for entry in self._filtered_callbacks(event_type, event):
+                self._call_subscriber(entry.callback, event)
+
+    def events(
+        self,
+        event_type: type[T],
+        *,
+        vid: int | None = None,
+        attrs: Iterable[str] | None = None,
+        maxsize: int = 1000,
+        overflow: "OverflowPolicy" = "drop_oldest",
+    ) -> "EventSubscription[T]":
+        """Subscribe to events, and receive them with an async iterator.
+
+        Events are queued for the subscriber, rather than calling back into it when
+        they are emitted, so a slow subscriber doesn't delay other subscribers.
+
+        Example:
+            ```python
+            async with controller.events(ObjectUpdated) as events:
+                async for event in events:
+                    print(event.obj.name, event.attrs_changed)
+            ```
+
+        Args:
+            event_type: Event type to subscribe to.
+            vid: Only receive events related to the object with this Vantage ID.
+            attrs: Only receive events where any of these attributes changed.
+            maxsize: The maximum number of queued events.
+            overflow: What to do with new events when the queue is full, either drop
+                the oldest queued event, or drop the new event.
+
+        Returns:
+            An async iterator of events, which should be closed when no longer needed.
+        """
+        subscription = EventSubscription[T](maxsize, overflow)
+        subscription.attach(
+            self.subscribe(event_type, subscription.put, vid=vid, attrs=attrs)
+        )
+        return subscription
+
+    def _call_subscriber(self, callback: Callable[[Any], None], event: Any) -> None:
+        # Hand callbacks subscribed with in_executor=True to the executor, keyed by
+        # the object the event relates to, so each object's events stay in order
+        if isinstance(callback, _ExecutorCallback):
+            if self._dispatch is None:
+                self._call_subscriber(callback.callback, event)
+                return
+
+            try:
+                self._dispatch.submit(
+                    _event_vid(event),
+                    lambda: self._call_subscriber(callback.callback, event),
+                )
+            except Exception:
+                logger.exception(
+                    "Error submitting callback %s handling %s to executor",
+                    _callback_name(callback.callback),
+                    type(event).__name__,
+                )
+            return
+
+        # Call a subscriber, isolating exceptions, and timing the call if enabled
+        threshold = self._slow_callback_threshold
+        start = time.perf_counter() if threshold is not None else 0.0
+
+        try:
+            callback(event)
+        except Exception:
+            logger.exception(
+                "Error in callback %s handling %s",
+                _callback_name(callback),
+                type(event).__name__,
+            )
+
+        if threshold is None:
+            return
+
+        duration = time.perf_counter() - start
+        with self._stats_lock:
+            stats = self._callback_stats.get(callback)
+            if stats is None:
+                stats = self._callback_stats[callback] = CallbackStats()
+            stats.record(duration)
+
+        if duration > threshold:
+            logger.warning(
+                "Slow callback %s took %.3fs handling %s",
+                _callback_name(callback),
+                duration,
+                type(event).__name__,
+            )
+
+    def _filtered_callbacks(
+        self, event_type: type, event: Any
+    ) -> list[_FilteredCallback]:
+        # Look up the filtered callbacks matching the vid and changed attributes of
+        # the event, calling each callback once even if it matches several keys
+        vid = _event_vid(event)
+        attrs: list[str] = getattr(event, "attrs_changed", [])
+
+        keys: list[tuple[type, int | None, str | None]] = []
+        for key_vid in (None, vid) if vid is not None else (None,):
+            keys.append((event_type, key_vid, None))
+            keys.extend((event_type, key_vid, attr) for attr in attrs)
+
+        index = self._filtered_subscribers
+        return list(
+            dict.fromkeys(entry for key in keys if key in index for entry in index[key])
+        )
+
+
+def _callback_name(callback: Callable[[Any], None]) -> str:
+    # Get a readable name for a callback, for logging
+    return getattr(callback, "__qualname__", repr(callback))
+
+
+def _event_vid(event: Any) -> int | None:
+    # Get the vid of the object an event relates to, if any
+    obj = getattr(event, "obj", None)
+    if obj is not None:
+        return getattr(obj, "vid", None)
+
+    if isinstance(event, StatusReceived):
+        return event.vid
+
+    return None
+
+
+OverflowPolicy = Literal["drop_oldest", "drop_newest"]
+"""What to do with new events when a subscription's queue is full."""
+
+
+class EventSubscription(Generic[T]):
+    """An async iterator of events, backed by a bounded queue.
+
+    When the queue is full, events are dropped according to the overflow policy, and
+    counted in `dropped`. Close the subscription to unsubscribe, which ends iteration
+    once any queued events have been consumed.
+
+    Args:
+        maxsize: The maximum number of queued events.
+        overflow: What to do with new events when the queue is full.
+    """
+
+    def __init__(
+        self, maxsize: int = 1000, overflow: OverflowPolicy = "drop_oldest"
+    ) -> None:
+        """Initialize the subscription."""
+        self._maxsize = maxsize
+        self._overflow = overflow
+        self._queue: deque[T] = deque()
+        self._waiter: asyncio.Future[None] | None = None
+        self._unsubscribe: Callable[[], None] | None = None
+        self._closed = False
+        self.dropped = 0
+        """The number of events dropped because the queue was full."""
+
+    def __aiter__(self) -> Self:
+        """Return the async iterator."""
+        return self
+
+    async def __anext__(self) -> T:
+        """Wait for the next event."""
+        while not self._queue:
+            if self._closed:
+                raise StopAsyncIteration
+
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+
+        return self._queue.popleft()
+
+    async def __aenter__(self) -> Self:
+        """Return context manager."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit context manager."""
+        self.close()
+
+    @property
+    def qsize(self) -> int:
+        """The number of queued events."""
+        return len(self._queue)
+
+    @property
+    def maxsize(self) -> int:
+        """The maximum number of queued events."""
+        return self._maxsize
+
+    @property
+    def closed(self) -> bool:
+        """Whether the subscription has been closed."""
+        return self._closed
+
+    def attach(self, unsubscribe: Callable[[], None]) -> None:
+        """Attach the function to call to unsubscribe, when the subscription is closed.
+
+        Args:
+            unsubscribe: The function to call to unsubscribe.
+        """
+        self._unsubscribe = unsubscribe
+
+    def put(self, event: T) -> None:
+        """Queue an event, dropping an event if the queue is full.
+
+        Args:
+            event: The event to queue.
+        """
+        if self._closed:
+            return
+
+        if len(self._queue) >= self._maxsize:
+            self.dropped += 1
+            if self._overflow == "drop_newest":
+                return
+
+            self._queue.popleft()
+
+        self._queue.append(event)
+        self._wake()
+
+    def close(self) -> None:
+        """Unsubscribe, and end iteration once queued events have been consumed."""
+        if self._closed:
+            return
+
+        self._closed = True
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+        self._wake()
+
+    def _wake(self) -> None:
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
 
 
 class Connected:
@@ -71,27 +530,146 @@ class Reconnected:
     """Event emitted when the client connection is re-established."""
 
 
-@dataclass
 class StatusReceived:
-    """Event emitted when a "S:" status is received."""
+    """Event emitted when a "S:" status is received.
 
-    category: str
-    """The status category, eg. "LOAD", "BLIND", etc."""
+    Events created from a received message with `from_message` are tokenized lazily,
+    the first time they are accessed. The same event is passed to every subscriber,
+    so the message is only tokenized once.
 
-    vid: int
-    """The unique Vantage ID of the object the status applies to."""
+    Args:
+        category: The status category, eg. "LOAD", "BLIND", etc.
+        vid: The unique Vantage ID of the object the status applies to.
+        args: The arguments of the status message.
+    """
 
-    args: list[str]
-    """The arguments of the status message."""
+    __slots__ = ("_args", "_category", "_vid", "message")
+    __match_args__ = ("category", "vid", "args")
 
+    message: str | None
+    """The status message, eg. "S:LOAD 123 100.000", if created from a message."""
 
-@dataclass
+    def __init__(self, category: str, vid: int, args: list[str]) -> None:
+        """Initialize the event."""
+        self.message = None
+        self._category = category
+        self._vid = vid
+        self._args: list[str] | None = args
+
+    @classmethod
+    def from_message(cls, message: str) -> "StatusReceived":
+        """Create an event from a status message, without tokenizing it yet.
+
+        Args:
+            message: The status message, eg. "S:LOAD 123 100.000".
+
+        Returns:
+            The event.
+        """
+        event = cls("", 0, [])
+        event.message = message
+        event._args = None
+        return event
+
+    def __repr__(self) -> str:
+        """Return a representation of the event."""
+        return (
+            f"{type(self).__name__}(category={self.category!r}, vid={self.vid!r}, "
+            f"args={self.args!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Compare events by their category, VID and arguments."""
+        if not isinstance(other, StatusReceived):
+            return NotImplemented
+
+        return (self.category, self.vid, self.args) == (
+            other.category,
+            other.vid,
+            other.args,
+        )
+
+    __hash__ = None  # type: ignore
+
+    @property
+    def category(self) -> str:
+        """The status category, eg. "LOAD", "BLIND", etc."""
+        self._parse()
+        return self._category
+
+    @property
+    def vid(self) -> int:
+        """The unique Vantage ID of the object the status applies to."""
+        self._parse()
+        return self._vid
+
+    @property
+    def args(self) -> list[str]:
+        """The arguments of the status message."""
+        return self._parse()
+
+    def _parse(self) -> list[str]:
+        # Tokenize a message of the form "S:<category> <vid> <args>", once
+        if self._args is None:
+            category, vid_str, *args = Converter.tokenize(self.message or "")
+            self._category = category[2:]
+            self._vid = int(vid_str)
+            self._args = args
+
+        return self._args
+
+
+@dataclass(slots=True)
 class EnhancedLogReceived:
-    """Event emitted when an "EL:" enhanced log is received."""
+    """Event emitted when an "EL:" enhanced log is received.
+
+    For "STATUS" and "STATUSEX" logs, the object status is tokenized lazily, the first
+    time it is accessed. The same event is passed to every subscriber, so the log is
+    only tokenized once.
+    """
 
     log: str
     """The enhanced log message."""
 
+    _vid: int = field(default=0, init=False, repr=False, compare=False)
+    _method: str = field(default="", init=False, repr=False, compare=False)
+    _result: str = field(default="", init=False, repr=False, compare=False)
+    _args: list[str] | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def vid(self) -> int:
+        """The Vantage ID of the object, for object status logs."""
+        self._parse()
+        return self._vid
+
+    @property
+    def method(self) -> str:
+        """The method that was invoked, for object status logs."""
+        self._parse()
+        return self._method
+
+    @property
+    def result(self) -> str:
+        """The result of the method, for object status logs."""
+        self._parse()
+        return self._result
+
+    @property
+    def args(self) -> list[str]:
+        """The arguments of the method, for object status logs."""
+        return self._parse()
+
+    def _parse(self) -> list[str]:
+        # Tokenize an object status log of the form "<vid> <method> <result> <args>"
+        if self._args is None:
+            vid_str, method, result, *args = Converter.tokenize(self.log)
+            self._vid = int(vid_str)
+            self._method = method
+            self._result = result
+            self._args = args
+
+        return self._args
+
 
 @dataclass
 class ObjectAdded(Generic[T]):